@@ -68,18 +68,23 @@ Core modules:
                            transitions, manifest skip reasons, and subprocess commands.
     convert_orchestrator -- CPU-aware parallel batch processor for audiobook conversion.
                            Manages ThreadPoolExecutor with dynamic thread allocation,
-                           CPU load monitoring via psutil.cpu_percent(), and per-book
-                           stage sequencing (validate -> concat -> convert -> asin ->
-                           metadata -> organize -> cleanup). Cleans work dirs on
-                           retag-in-place early exit and in dry-run mode. Returns
-                           BatchResult summary.
+                           CPU load monitoring via non-blocking psutil.cpu_percent()
+                           samples, and per-book stage sequencing (validate -> concat ->
+                           convert -> asin -> metadata -> organize -> cleanup). Cleans
+                           work dirs on retag-in-place early exit and in dry-run mode.
+                           Returns BatchResult summary.
     library_index       -- In-memory library index for O(1) folder/file lookups in batch mode.
-                           Replaces per-call iterdir() with dict-based scans via os.walk().
+                           Replaces per-call iterdir() with dict-based scans via os.scandir().
                            Supports cross-source dedup, dynamic registration, reorganize detection.
-                           Author alias canonicalization via PipelineDB (SQLite).
+                           Author alias canonicalization and a per-directory listing snapshot
+                           (re-read only when the dir mtime changes) via PipelineDB (SQLite).
     ai                  -- AI-assisted metadata resolution via any OpenAI-compatible endpoint
                            (LiteLLM, OpenAI, Ollama). Includes cache-busting for semantic caches,
-                           conflict resolution, and Audible disambiguation. Logs evidence sources,
+                           an in-process exact-match response cache (nonce stripped from the key),
+                           conflict resolution via a forced resolve_metadata tool call (streamed;
+                           text reply fallback, retried without tools on a 400),
+                           batch resolve_many() on a bounded thread pool,
+                           and Audible disambiguation. Logs evidence sources,
                            resolution decisions, and parse failures.
     pipeline_db         -- SQLite-backed pipeline state (WAL mode). Replaces JSON manifests
                            with a single database for book records, per-stage progress,
@@ -88,7 +93,10 @@ Core modules:
     ffprobe             -- Audio file inspection via ffprobe subprocess. Includes get_format_name()
                            for container format validation. Logs every subprocess call, tag
                            extraction, and parse result. Numeric functions raise ValueError on
-                           empty ffprobe output (corrupt files, missing binary).
+                           empty ffprobe output (corrupt files, missing binary). Duration,
+                           bitrate, codec, channels, sample rate, format, tags and chapter
+                           count come from one probe() call cached per (path, mtime, size);
+                           its JSON is parsed with orjson when installed.
     sanitize            -- Filename sanitization and book hash generation. Logs truncation
                            events and hash results.
     concurrency         -- File locking and disk space checks. Logs lock acquisition and
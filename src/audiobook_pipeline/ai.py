@@ -7,11 +7,125 @@ Works with any OpenAI-compatible endpoint (OpenAI, LiteLLM, Ollama).
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 from loguru import logger
 
+# Exact-match response cache keyed on the prompt with its nonce stripped.
+# Batch runs resolve identical evidence repeatedly (multi-part books, retries,
+# reorganize re-scans). Deliberately no similarity tier: adjacent books in a
+# series produce near-identical prompts that must resolve differently -- the
+# same reason the nonce defeats semantic caching in LiteLLM-style proxies.
+_RESPONSE_CACHE: dict[str, object] = {}
+_RESPONSE_CACHE_MAX = 1024
+_RESPONSE_CACHE_LOCK = threading.Lock()
+_MISS = object()
+
+# Author values that count as "no author" (compared stripped + lowercased)
+_AUTHOR_PLACEHOLDERS = frozenset({"", "unknown", "_unsorted", "various", "n/a", "none"})
+
+# Structured output for resolve(): forcing this tool call replaces the
+# free-text AUTHOR/TITLE reply. The text format stays as a fallback for
+# endpoints/models that ignore tools (some Ollama models) and, via a retry
+# without tools, for endpoints that reject them with a 400.
+_RESOLVE_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "resolve_metadata",
+        "description": "Record the resolved audiobook metadata.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "author": {"type": "string"},
+                "title": {"type": "string"},
+                "series": {"type": ["string", "null"]},
+                "position": {"type": ["string", "null"]},
+            },
+            "required": ["author", "title"],
+        },
+    },
+}
+_RESOLVE_FIELDS = ("author", "title", "series", "position")
+
+# Prompt bodies (the per-call nonce is prefixed at send time). Instruction
+# text is fixed; only the evidence/candidate slots vary per call.
+_RESOLVE_TEMPLATE = (
+    "Resolve metadata for: {filename}\n\n"
+    "Evidence:\n{evidence}\n\n"
+    "Determine the correct audiobook metadata from the evidence above.\n"
+    "- Author: real person's first and last name (not series/brand names)\n"
+    "- Title: the specific book title (not the series name)\n"
+    "- Series: the SPECIFIC sub-series name, NOT an umbrella/universe name. "
+    "When a book belongs to multiple series (e.g., 'Liveship Traders #2' AND "
+    "'Realms of the Elderlings #5'), always pick the specific trilogy/series "
+    "(Liveship Traders), not the overarching universe/world name. NONE if no series.\n"
+    "- Position: book number within the chosen series, otherwise NONE\n\n"
+    "Call resolve_metadata with the result. If you cannot call tools, "
+    "reply in this exact format (one per line, no extra text):\n"
+    "AUTHOR: <name>\n"
+    "TITLE: <title>\n"
+    "SERIES: <series or NONE>\n"
+    "POSITION: <number or NONE>"
+)
+_DISAMBIGUATE_TEMPLATE = (
+    'Find the best match for: "{title}"{by_author}\n\n'
+    "Search results:\n{candidates}\n\n"
+    "Which result (1-5) is the best match? Reply with ONLY the number,"
+    " or 0 if none match. No explanation."
+)
+_PROMPT_TEMPLATES = {
+    "resolve": _RESOLVE_TEMPLATE,
+    "disambiguate": _DISAMBIGUATE_TEMPLATE,
+}
+
+# Valid disambiguation replies: 0 (no match) or a 1-5 candidate number
+_PICK_DIGITS = frozenset("012345")
+
+# A text reply is complete once its POSITION line is terminated
+_POSITION_LINE_RE = re.compile(r"^\s*POSITION:.*\n", re.IGNORECASE | re.MULTILINE)
+
+
+def clear_cache() -> None:
+    """Drop all cached AI responses."""
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
+
+
+def _build_prompt(kind: str, **ctx: str) -> tuple[str, str]:
+    """Fill a prompt template; return (nonce-free body, nonce-prefixed prompt).
+
+    The body keys the response cache; the 8-char nonce prefix on the sent
+    prompt defeats prefix-based semantic caching in upstream proxies.
+    """
+    body = _PROMPT_TEMPLATES[kind].format_map(ctx)
+    return body, f"[{uuid.uuid4().hex[:8]}] {body}"
+
+
+def _cache_key(kind: str, model: str, prompt_body: str) -> str:
+    """Hash the nonce-free prompt body into a cache key."""
+    raw = f"{kind}\0{model}\0{prompt_body}".encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _cache_get(key: str) -> object:
+    """Return the cached value for key, or _MISS."""
+    with _RESPONSE_CACHE_LOCK:
+        return _RESPONSE_CACHE.get(key, _MISS)
+
+
+def _cache_put(key: str, value: object) -> None:
+    """Store a value, evicting the oldest entry when full."""
+    with _RESPONSE_CACHE_LOCK:
+        if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+            # Evict oldest entry (dicts preserve insertion order)
+            _RESPONSE_CACHE.pop(next(iter(_RESPONSE_CACHE)))
+        _RESPONSE_CACHE[key] = value
+
 
 def get_client(base_url: str, api_key: str):
     """Return an OpenAI client configured for the given endpoint, or None.
@@ -45,15 +159,15 @@ def needs_resolution(
 
     Returns True when metadata sources conflict or are all empty.
     """
-    authors = set()
-    for source in [
-        path_metadata.get("author", ""),
-        tag_metadata.get("author", ""),
-        (audible_result or {}).get("author", ""),
-    ]:
-        cleaned = source.strip().lower()
-        if cleaned and cleaned not in ("unknown", "_unsorted", "various"):
-            authors.add(cleaned)
+    authors = {
+        cleaned
+        for source in (
+            path_metadata.get("author"),
+            tag_metadata.get("author"),
+            (audible_result or {}).get("author"),
+        )
+        if (cleaned := (source or "").strip().lower()) not in _AUTHOR_PLACEHOLDERS
+    }
 
     # Conflict: multiple different non-empty authors
     if len(authors) > 1:
@@ -157,47 +271,98 @@ def resolve(
         return None
 
     evidence_text = "\n".join(evidence_parts)
-    nonce = uuid.uuid4().hex[:8]
 
     # Unique evidence leads the prompt to defeat prefix-based semantic caching
-    prompt = (
-        f"[{nonce}] Resolve metadata for: {source_filename!r}\n\n"
-        f"Evidence:\n{evidence_text}\n\n"
-        "Determine the correct audiobook metadata from the evidence above.\n"
-        "- Author: real person's first and last name (not series/brand names)\n"
-        "- Title: the specific book title (not the series name)\n"
-        "- Series: the SPECIFIC sub-series name, NOT an umbrella/universe name. "
-        "When a book belongs to multiple series (e.g., 'Liveship Traders #2' AND "
-        "'Realms of the Elderlings #5'), always pick the specific trilogy/series "
-        "(Liveship Traders), not the overarching universe/world name. NONE if no series.\n"
-        "- Position: book number within the chosen series, otherwise NONE\n\n"
-        "Reply in this exact format (one per line, no extra text):\n"
-        "AUTHOR: <name>\n"
-        "TITLE: <title>\n"
-        "SERIES: <series or NONE>\n"
-        "POSITION: <number or NONE>"
+    prompt_body, prompt = _build_prompt(
+        "resolve", filename=repr(source_filename), evidence=evidence_text
     )
 
+    cache_key = _cache_key("resolve", model, prompt_body)
+    cached = _cache_get(cache_key)
+    if cached is not _MISS:
+        logger.bind(stage="ai").debug("Resolve cache hit")
+        return dict(cached)
+
     logger.bind(stage="ai").debug("Resolving metadata conflict...")
 
+    from openai import BadRequestError
+
+    request = {
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": 150,
+        "temperature": 0.1,
+        "stream": True,
+        "extra_headers": {"Cache-Control": "no-cache"},
+        "extra_body": {"cache": {"no-cache": True}},
+    }
     try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=150,
-            temperature=0.1,
-            extra_headers={"Cache-Control": "no-cache"},
-            extra_body={"cache": {"no-cache": True}},
-        )
-        content = response.choices[0].message.content.strip()
-        logger.bind(stage="ai").debug(f"AI response: {content}")
-        return _parse_resolve_response(content)
+        try:
+            response = client.chat.completions.create(
+                **request,
+                tools=[_RESOLVE_TOOL],
+                tool_choice={
+                    "type": "function",
+                    "function": {"name": "resolve_metadata"},
+                },
+            )
+        except BadRequestError as e:
+            # Endpoints without tool support reject the request outright (400)
+            # rather than ignoring the tools; retry once for the text format.
+            logger.bind(stage="ai").debug(f"Tool call rejected, retrying as text: {e}")
+            response = client.chat.completions.create(**request)
+        content, arguments = _collect_stream(response)
+        if arguments:
+            logger.bind(stage="ai").debug(f"AI tool call: {arguments}")
+            result = _parse_tool_arguments(arguments)
+        else:
+            content = content.strip()
+            logger.bind(stage="ai").debug(f"AI response: {content}")
+            result = _parse_resolve_response(content)
+        if result is not None:
+            _cache_put(cache_key, dict(result))
+        return result
 
     except Exception as e:
         logger.bind(stage="ai").warning(f"Metadata resolution failed: {e}")
         return None
 
 
+def resolve_many(
+    items: list[dict],
+    model: str,
+    client,
+    max_workers: int = 8,
+) -> list[dict | None]:
+    """Resolve metadata for many books concurrently.
+
+    Each item holds resolve() keyword arguments (path_metadata, tag_metadata,
+    audible_candidates, source_filename, source_directory). Requests overlap
+    on a bounded thread pool -- max_workers caps in-flight calls to respect
+    endpoint rate limits. Results are returned in input order.
+    """
+    if client is None or not items:
+        return [None] * len(items)
+
+    def _one(item: dict) -> dict | None:
+        return resolve(
+            item.get("path_metadata", {}),
+            item.get("tag_metadata", {}),
+            item.get("audible_candidates"),
+            model,
+            client,
+            source_filename=item.get("source_filename", ""),
+            source_directory=item.get("source_directory", ""),
+        )
+
+    workers = max(1, min(max_workers, len(items)))
+    logger.bind(stage="ai").debug(
+        f"Resolving {len(items)} books with {workers} workers"
+    )
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_one, items))
+
+
 def disambiguate(
     candidates: list[dict],
     title_hint: str,
@@ -217,16 +382,19 @@ def disambiguate(
         for i, c in enumerate(candidates[:5])
     )
 
-    nonce = uuid.uuid4().hex[:8]
-
-    prompt = (
-        f'[{nonce}] Find the best match for: "{title_hint}"'
-        + (f" by {author_hint}" if author_hint else "")
-        + f"\n\nSearch results:\n{candidate_text}"
-        + "\n\nWhich result (1-5) is the best match? Reply with ONLY the number,"
-        + " or 0 if none match. No explanation."
+    prompt_body, prompt = _build_prompt(
+        "disambiguate",
+        title=title_hint,
+        by_author=f" by {author_hint}" if author_hint else "",
+        candidates=candidate_text,
     )
 
+    cache_key = _cache_key("disambiguate", model, prompt_body)
+    pick = _cache_get(cache_key)
+    if pick is not _MISS:
+        logger.bind(stage="ai").debug(f"Disambiguate cache hit: {pick}")
+        return _candidate_at(candidates, pick)
+
     try:
         response = client.chat.completions.create(
             model=model,
@@ -238,43 +406,108 @@ def disambiguate(
         )
         content = response.choices[0].message.content.strip()
 
-        match = re.search(r"[0-5]", content)
-        if match:
-            pick = int(match.group())
-            if pick == 0:
-                return None
-            idx = pick - 1
-            if 0 <= idx < len(candidates):
-                return candidates[idx]
+        pick = _first_pick(content)
+        # Garbled replies (no pick) are retried next time, not cached
+        if pick is not None:
+            _cache_put(cache_key, pick)
+        return _candidate_at(candidates, pick)
     except Exception as e:
         logger.bind(stage="ai").warning(f"AI disambiguation failed: {e}")
 
     return None
 
 
+def _first_pick(content: str) -> int | None:
+    """Return the first 0-5 digit in an AI reply ("10" -> 1), or None."""
+    return next((int(c) for c in content if c in _PICK_DIGITS), None)
+
+
+def _candidate_at(candidates: list[dict], pick: int | None) -> dict | None:
+    """Map a 1-based AI pick to a candidate (0 or out of range -> None)."""
+    if not pick:
+        return None
+    idx = pick - 1
+    if 0 <= idx < len(candidates):
+        return candidates[idx]
+    return None
+
+
+def _collect_stream(stream) -> tuple[str, str]:
+    """Accumulate a streamed completion into (text content, tool arguments).
+
+    Stops reading as soon as a text reply has a terminated POSITION line,
+    so trailing explanation is never waited on, then closes the stream.
+    """
+    content_parts: list[str] = []
+    argument_parts: list[str] = []
+    try:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            for call in delta.tool_calls or ():
+                if call.index == 0 and call.function and call.function.arguments:
+                    argument_parts.append(call.function.arguments)
+            if delta.content:
+                content_parts.append(delta.content)
+                if "\n" in delta.content and _POSITION_LINE_RE.search(
+                    "".join(content_parts)
+                ):
+                    break
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
+    return "".join(content_parts), "".join(argument_parts)
+
+
+def _parse_tool_arguments(arguments: str) -> dict | None:
+    """Parse resolve_metadata tool-call arguments into a metadata dict."""
+    try:
+        args = json.loads(arguments)
+    except (TypeError, ValueError):
+        logger.bind(stage="ai").debug("AI parse failed: invalid tool arguments")
+        return None
+    if not isinstance(args, dict):
+        logger.bind(stage="ai").debug("AI parse failed: tool arguments not an object")
+        return None
+
+    result = {}
+    for key in _RESOLVE_FIELDS:
+        if args.get(key) is None:
+            continue
+        val = _clean_field(key, str(args[key]))
+        if val:
+            result[key] = val
+    return _finalize_resolved(result)
+
+
 def _parse_resolve_response(content: str) -> dict | None:
-    """Parse the structured AI response into a metadata dict."""
+    """Parse the structured AI text response into a metadata dict."""
     result = {}
 
     for line in content.splitlines():
-        line = line.strip()
-        if line.upper().startswith("AUTHOR:"):
-            val = line.split(":", 1)[1].strip().strip('"').strip("'")
-            if val and val.upper() != "UNKNOWN":
-                result["author"] = val
-        elif line.upper().startswith("TITLE:"):
-            val = line.split(":", 1)[1].strip().strip('"').strip("'")
-            if val and val.upper() != "UNKNOWN":
-                result["title"] = val
-        elif line.upper().startswith("SERIES:"):
-            val = line.split(":", 1)[1].strip().strip('"').strip("'")
-            if val and val.upper() not in ("NONE", "UNKNOWN", "N/A", ""):
-                result["series"] = val
-        elif line.upper().startswith("POSITION:"):
-            val = line.split(":", 1)[1].strip().strip('"').strip("'")
-            if val and val.upper() not in ("NONE", "UNKNOWN", "N/A", ""):
-                result["position"] = val
+        key, sep, val = line.strip().partition(":")
+        key = key.lower()
+        if not sep or key not in _RESOLVE_FIELDS:
+            continue
+        val = _clean_field(key, val)
+        if val:
+            result[key] = val
+
+    return _finalize_resolved(result)
+
+
+def _clean_field(key: str, val: str) -> str:
+    """Strip quotes and map placeholder values (UNKNOWN, NONE, N/A) to ''."""
+    val = val.strip().strip('"').strip("'")
+    if key in ("author", "title"):
+        return "" if val.upper() == "UNKNOWN" else val
+    return "" if val.upper() in ("NONE", "UNKNOWN", "N/A", "") else val
+
 
+def _finalize_resolved(result: dict) -> dict | None:
+    """Validate and normalize parsed metadata fields."""
     # Must have at least author to be useful
     if "author" not in result:
         logger.bind(stage="ai").debug("AI parse failed: no author found in response")
@@ -4,7 +4,11 @@ Submodules:
     audible -- Audible catalog search client with expanded response_groups.
               Returns subtitle, publisher_summary, publisher_name, copyright,
               language, and genre (from category_ladders) in addition to core
-              fields. Logs query params, result counts, and API warnings.
+              fields. Reuses one pooled httpx.Client per region (closed at
+              exit) and caches successful results per (query, region) for
+              an hour (clear_cache() resets). Decodes response bytes with
+              orjson when installed (the `fast` extra), stdlib json
+              otherwise. Logs query params, result counts, and API warnings.
     search  -- Fuzzy scoring and path hint extraction. Logs scoring details,
               best match with score, and path parsing results.
 """
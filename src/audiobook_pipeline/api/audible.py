@@ -5,11 +5,115 @@ for fuzzy matching and metadata resolution. Extracts expanded metadata
 (subtitle, publisher, copyright, genre, language) for Plex-compatible tagging.
 """
 
+import atexit
+import importlib.metadata
+import importlib.util
+import json
+import operator
 import re
+import sys
+import threading
+import time
+from concurrent.futures import Future
 
 import httpx
 from loguru import logger
 
+try:  # optional C JSON parser (pip install audiobook-pipeline[fast])
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    _json_loads = json.loads
+
+# HTTP/2 and brotli need optional packages (pip install audiobook-pipeline[fast]);
+# only advertise what httpx can actually use
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_BROTLI = any(
+    importlib.util.find_spec(mod) is not None for mod in ("brotli", "brotlicffi")
+)
+
+
+def _user_agent() -> str:
+    """Return the User-Agent header, versioned from the installed package."""
+    try:
+        version = importlib.metadata.version("audiobook-pipeline")
+    except importlib.metadata.PackageNotFoundError:  # running from a bare checkout
+        return "audiobook-pipeline"
+    return f"audiobook-pipeline/{version}"
+
+
+_CLIENT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate, br" if _BROTLI else "gzip, deflate",
+    "User-Agent": _user_agent(),
+}
+
+# Shared string objects for names that repeat across products
+_intern = sys.intern
+
+# C-level step.get("name", "") for walking category ladders
+_STEP_NAME = operator.methodcaller("get", "name", "")
+
+# One pooled client per region -- keeps TCP/TLS connections alive across
+# the many searches of a batch run instead of a fresh handshake per query.
+_CLIENTS: dict[str, httpx.Client] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_client(region: str) -> httpx.Client:
+    """Return the pooled HTTP client for an Audible region."""
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(region)
+        if client is None:
+            client = httpx.Client(
+                base_url=f"https://api.audible.{region}/1.0",
+                headers=_CLIENT_HEADERS,
+                http2=_HTTP2,
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                ),
+            )
+            _CLIENTS[region] = client
+        return client
+
+
+def close_clients() -> None:
+    """Close all pooled clients (registered with atexit)."""
+    with _CLIENTS_LOCK:
+        for client in _CLIENTS.values():
+            client.close()
+        _CLIENTS.clear()
+
+
+atexit.register(close_clients)
+
+# Successful search results keyed on (normalized query, region). A book
+# issues several overlapping queries and batch runs / retries repeat them.
+_SEARCH_CACHE: dict[tuple[str, str], tuple[float, list[dict]]] = {}
+_SEARCH_CACHE_TTL = 3600.0
+_SEARCH_CACHE_MAX = 1024
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+# Searches currently being fetched, so concurrent duplicates wait instead
+# of issuing their own request (guarded by _SEARCH_CACHE_LOCK)
+_INFLIGHT: dict[tuple[str, str], Future] = {}
+
+
+def clear_cache() -> None:
+    """Drop all cached search results."""
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE.clear()
+
+
+def _copy_result(result: dict) -> dict:
+    """Copy a cached result, including its lists, so callers can't mutate the cache."""
+    return {
+        **result,
+        "authors": list(result["authors"]),
+        "narrators": list(result["narrators"]),
+        "all_series": [dict(s) for s in result["all_series"]],
+    }
+
 
 def search(query: str, region: str = "com") -> list[dict]:
     """Search Audible catalog API, return up to 10 results.
@@ -18,8 +122,52 @@ def search(query: str, region: str = "com") -> list[dict]:
     author_str, series, position, narrators, narrator_str, release_date,
     year, cover_url, publisher_summary, publisher_name, copyright,
     language, genre.
+
+    Concurrent calls for the same (query, region) share one HTTP request:
+    the first caller fetches, the others wait on its Future.
     """
-    api_base = f"https://api.audible.{region}/1.0"
+    logger.debug(f"Audible search: query={query!r} region={region}")
+
+    cache_key = (query.strip().lower(), region)
+    with _SEARCH_CACHE_LOCK:
+        hit = _SEARCH_CACHE.get(cache_key)
+        if hit and time.monotonic() - hit[0] < _SEARCH_CACHE_TTL:
+            logger.debug(f"Audible cache hit: {len(hit[1])} products")
+            return [_copy_result(r) for r in hit[1]]
+        pending = _INFLIGHT.get(cache_key)
+        is_owner = pending is None
+        if is_owner:
+            pending = _INFLIGHT[cache_key] = Future()
+
+    if not is_owner:
+        logger.debug("Audible search already in flight, waiting")
+        return [_copy_result(r) for r in pending.result()]
+
+    results: list[dict] | None = None
+    try:
+        results = _fetch(query, region)
+    except BaseException as e:
+        pending.set_exception(e)
+        raise
+    finally:
+        with _SEARCH_CACHE_LOCK:
+            del _INFLIGHT[cache_key]
+            if results is not None:
+                _SEARCH_CACHE.pop(cache_key, None)
+                if len(_SEARCH_CACHE) >= _SEARCH_CACHE_MAX:
+                    # Evict oldest entry (dicts preserve insertion order)
+                    _SEARCH_CACHE.pop(next(iter(_SEARCH_CACHE)))
+                _SEARCH_CACHE[cache_key] = (time.monotonic(), results)
+
+    pending.set_result(results or [])
+    if results is None:
+        return []
+    logger.debug(f"Audible results: {len(results)} products")
+    return [_copy_result(r) for r in results]
+
+
+def _fetch(query: str, region: str) -> list[dict] | None:
+    """Query the catalog API; None on HTTP or decode failure (not cached)."""
     params = {
         "keywords": query,
         "num_results": "10",
@@ -32,72 +180,81 @@ def search(query: str, region: str = "com") -> list[dict]:
         "image_sizes": "500,1024",
     }
 
-    logger.debug(f"Audible search: query={query!r} region={region}")
-
     try:
-        resp = httpx.get(
-            f"{api_base}/catalog/products",
-            params=params,
-            timeout=30.0,
-        )
+        resp = _get_client(region).get("/catalog/products", params=params)
         resp.raise_for_status()
     except httpx.HTTPError as e:
         logger.warning(f"Audible API error: {e}")
-        return []
+        return None
 
-    data = resp.json()
-    products = data.get("products", [])
-
-    results = []
-    for p in products:
-        authors = [a.get("name", "") for a in (p.get("authors") or [])]
-        series_info = _pick_best_series(p.get("series") or [])
-        # Extract cover art URL -- prefer larger sizes
-        images = p.get("product_images") or {}
-        cover_url = images.get("1024", images.get("500", ""))
-
-        narrators = [n.get("name", "") for n in (p.get("narrators") or [])]
-        release_date = p.get("release_date", "")
-
-        # Extract genre from category_ladders (walk ladder, join with /)
-        genre = _extract_genre(p.get("category_ladders") or [])
-
-        # Publisher summary -- strip HTML tags
-        raw_summary = p.get("publisher_summary", "") or ""
-        publisher_summary = _strip_html(raw_summary)
-
-        # Store all series for AI evidence (helps prefer sub-series over umbrella)
-        all_series = [
-            {"name": s.get("title", ""), "position": s.get("sequence", "")}
-            for s in (p.get("series") or [])
-            if s.get("title")
-        ]
-
-        results.append(
-            {
-                "asin": p.get("asin", ""),
-                "title": p.get("title", ""),
-                "subtitle": p.get("subtitle", "") or "",
-                "authors": authors,
-                "author_str": ", ".join(authors),
-                "narrators": narrators,
-                "narrator_str": ", ".join(narrators),
-                "series": series_info.get("title", "") if series_info else "",
-                "position": series_info.get("sequence", "") if series_info else "",
-                "all_series": all_series,
-                "release_date": release_date,
-                "year": release_date[:4] if release_date else "",
-                "cover_url": cover_url,
-                "publisher_summary": publisher_summary,
-                "publisher_name": p.get("publisher_name", "") or "",
-                "copyright": p.get("copyright", "") or "",
-                "language": p.get("language", "") or "",
-                "genre": genre,
-            }
-        )
+    try:
+        return _parse_products(resp.content)
+    except ValueError as e:
+        logger.warning(f"Audible API returned invalid JSON: {e}")
+        return None
 
-    logger.debug(f"Audible results: {len(results)} products")
-    return results
+
+def _parse_products(content: bytes) -> list[dict]:
+    """Decode a catalog response body and project each product to a result dict.
+
+    Raises ValueError when the body is not a JSON object.
+    """
+    data = _json_loads(content)
+    if not isinstance(data, dict):
+        raise ValueError(f"expected JSON object, got {type(data).__name__}")
+    return [_project_product(p) for p in data.get("products") or []]
+
+
+def _project_product(p: dict) -> dict:
+    """Extract only the fields the pipeline uses from one catalog product.
+
+    Names that repeat across products and cached searches (authors,
+    narrators, series, publisher, language, genre) are interned so every
+    result shares one string object per distinct value.
+    """
+    authors = [_intern(a.get("name") or "") for a in (p.get("authors") or [])]
+    series_info = _pick_best_series(p.get("series") or [])
+    # Extract cover art URL -- prefer larger sizes
+    images = p.get("product_images") or {}
+    cover_url = images.get("1024", images.get("500", ""))
+
+    narrators = [_intern(n.get("name") or "") for n in (p.get("narrators") or [])]
+    release_date = p.get("release_date", "")
+
+    # Extract genre from category_ladders (walk ladder, join with /)
+    genre = _intern(_extract_genre(p.get("category_ladders") or []))
+
+    # Publisher summary -- strip HTML tags
+    raw_summary = p.get("publisher_summary", "") or ""
+    publisher_summary = _strip_html(raw_summary)
+
+    # Store all series for AI evidence (helps prefer sub-series over umbrella)
+    all_series = [
+        {"name": s.get("title", ""), "position": s.get("sequence", "")}
+        for s in (p.get("series") or [])
+        if s.get("title")
+    ]
+
+    return {
+        "asin": p.get("asin", ""),
+        "title": p.get("title", ""),
+        "subtitle": p.get("subtitle", "") or "",
+        "authors": authors,
+        "author_str": ", ".join(authors),
+        "narrators": narrators,
+        "narrator_str": ", ".join(narrators),
+        "series": _intern(series_info.get("title") or "") if series_info else "",
+        "position": series_info.get("sequence", "") if series_info else "",
+        "all_series": all_series,
+        "release_date": release_date,
+        "year": release_date[:4] if release_date else "",
+        "cover_url": cover_url,
+        "publisher_summary": publisher_summary,
+        "publisher_name": _intern(p.get("publisher_name", "") or ""),
+        "copyright": p.get("copyright", "") or "",
+        "language": _intern(p.get("language", "") or ""),
+        "genre": genre,
+    }
 
 
 def _pick_best_series(series_list: list[dict]) -> dict | None:
@@ -139,9 +296,8 @@ def _extract_genre(category_ladders: list[dict]) -> str:
     """
     if not category_ladders:
         return ""
-    ladder = category_ladders[0].get("ladder", [])
-    names = [step.get("name", "") for step in ladder if step.get("name")]
-    return "/".join(names) if names else ""
+    ladder = category_ladders[0].get("ladder") or []
+    return "/".join(filter(None, map(_STEP_NAME, ladder)))
 
 
 def _strip_html(text: str) -> str:
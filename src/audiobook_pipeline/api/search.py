@@ -5,13 +5,31 @@ the best metadata match for an audiobook file.
 """
 
 import re
-from pathlib import Path
+from functools import lru_cache
+from itertools import chain, repeat
+from operator import itemgetter
+from pathlib import PurePosixPath
 
 from loguru import logger
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 log = logger.bind(stage="search")
 
+# Path-parsing patterns, compiled once for batch library scans
+_HASH_SUFFIX_RE = re.compile(r"\s+-\s+[a-f0-9]{16}$")
+_BRACKET_CHARS = str.maketrans("", "", "[](){}")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Series numbering patterns stripped by _strip_series_numbers()
+_BRACKET_NUM_RE = re.compile(r"\[[0-9]+\]")
+_HASH_NUM_RE = re.compile(r"#[0-9]+-")
+_LEADING_NUM_RE = re.compile(r"^[0-9]+\s*[-\u2013]?\s*")
+_STANDALONE_NUM_RE = re.compile(r"\s[0-9]{1,3}\s")
+
+# Position bonus by result rank (10, 8, ... then 0), and the sort key
+_POSITION_BONUS = (10, 8, 6, 4, 2)
+_SCORE_KEY = itemgetter("score")
+
 
 def score_results(
     results: list[dict],
@@ -24,27 +42,23 @@ def score_results(
     """
     log.debug(f"Scoring {len(results)} results against title={title_hint!r}")
 
-    scored = []
-    for idx, r in enumerate(results):
-        title_score = fuzz.token_sort_ratio(
-            title_hint.lower(), r["title"].lower(),
-        ) * 0.6
-
-        if author_hint:
-            author_scores = [
-                fuzz.partial_ratio(author_hint.lower(), a.lower())
-                for a in r["authors"]
-            ]
-            author_score = max(author_scores, default=0) * 0.3
-        else:
-            author_score = 0.0
-
-        position_score = max(10 - (idx * 2), 0)
-
-        total = title_score + author_score + position_score
-        scored.append({**r, "score": round(total, 1)})
-
-    scored.sort(key=lambda x: x["score"], reverse=True)
+    title_key = title_hint.lower().strip()
+    title_scores = _title_scores(
+        title_key, tuple(r["title"].lower().strip() for r in results)
+    )
+    if author_hint:
+        author_scores = _author_scores(
+            author_hint.lower(), tuple(tuple(r["authors"]) for r in results)
+        )
+    else:
+        author_scores = (0.0,) * len(results)
+
+    bonuses = chain(_POSITION_BONUS, repeat(0))
+    scored = [
+        {**r, "score": round(t * 0.6 + a * 0.3 + b, 1)}
+        for r, t, a, b in zip(results, title_scores, author_scores, bonuses)
+    ]
+    scored.sort(key=_SCORE_KEY, reverse=True)
 
     if scored:
         best = scored[0]
@@ -53,58 +67,149 @@ def score_results(
     return scored
 
 
+@lru_cache(maxsize=1024)
+def _title_scores(title_hint: str, titles: tuple[str, ...]) -> tuple[float, ...]:
+    """token_sort_ratio of the hint against every title, in one C++ pass.
+
+    Cached per (hint, candidate titles) so re-scoring the same catalog
+    results is a dict lookup.
+    """
+    # Exact matches score 100 by definition -- only fuzzy-score the rest
+    scores = [100.0 if t == title_hint else 0.0 for t in titles]
+    pending = {idx: t for idx, t in enumerate(titles) if t != title_hint}
+    if pending:
+        for _, score, idx in process.extract(
+            title_hint, pending, scorer=fuzz.token_sort_ratio, limit=None
+        ):
+            scores[idx] = score
+    return tuple(scores)
+
+
+@lru_cache(maxsize=1024)
+def _author_scores(
+    author_hint: str,
+    authors_by_result: tuple[tuple[str, ...], ...],
+) -> tuple[float, ...]:
+    """Best partial_ratio of the hint against each result's authors.
+
+    All authors are flattened into one list and scored in a single C++
+    pass, then reduced to the per-result maximum.
+    """
+    # Results with an exact (case-insensitive) author match score 100
+    # without entering the fuzzy pass
+    best = [
+        100.0 if any(a.lower() == author_hint for a in authors) else 0.0
+        for authors in authors_by_result
+    ]
+    flat = [
+        a
+        for i, authors in enumerate(authors_by_result)
+        if best[i] < 100.0
+        for a in authors
+    ]
+    owners = [
+        i
+        for i, authors in enumerate(authors_by_result)
+        if best[i] < 100.0
+        for _ in authors
+    ]
+    for _, score, idx in process.extract(
+        author_hint,
+        flat,
+        scorer=fuzz.partial_ratio,
+        processor=str.lower,
+        limit=None,
+    ):
+        owner = owners[idx]
+        if score > best[owner]:
+            best[owner] = score
+    return tuple(best)
+
+
 def parse_source_path(source_path: str) -> dict:
     """Extract title/author hints from a source file path.
 
     Returns dict with keys: title_hint, author_hint, query.
     """
     log.debug(f"parse_source_path: source_path={source_path!r}")
+    # Pure string parsing, so results are cached; copy to keep the cache immutable
+    result = dict(_parse_source_path(source_path))
+    log.debug(f"parse_source_path: result={result}")
+    return result
 
-    p = Path(source_path)
-
-    basename = p.stem if p.is_file() or p.suffix else p.name
-    basename = re.sub(r"\s+-\s+[a-f0-9]{16}$", "", basename)
 
+@lru_cache(maxsize=2048)
+def _parse_source_path(source_path: str) -> tuple[tuple[str, str], ...]:
+    """Cached worker for parse_source_path(), returned as dict items."""
+    p = PurePosixPath(source_path)
     parent = p.parent
-    parent_name = parent.name if parent != Path("/") else ""
-    parent_name = re.sub(r"\s+-\s+[a-f0-9]{16}$", "", parent_name)
+
+    # stem == name when there is no suffix, so no filesystem check is needed.
+    # "/" and "." have an empty name, so root/relative edges need no checks.
+    basename = _HASH_SUFFIX_RE.sub("", p.stem)
+    parent_name = _HASH_SUFFIX_RE.sub("", parent.name)
 
     author_hint = ""
     if parent_name and parent_name == basename:
-        grandparent = parent.parent
-        if grandparent != Path("/") and grandparent != Path("."):
-            gp_name = grandparent.name
-            gp_name = re.sub(r"\s+-\s+[a-f0-9]{16}$", "", gp_name)
-            if gp_name:
-                parent_name = gp_name
+        gp_name = _HASH_SUFFIX_RE.sub("", parent.parent.name)
+        if gp_name:
+            parent_name = gp_name
 
     title_hint = _strip_series_numbers(basename)
-    title_hint = re.sub(r"[\[\](){}]", "", title_hint)
-    title_hint = re.sub(r"\s+", " ", title_hint).strip()
+    title_hint = title_hint.translate(_BRACKET_CHARS)
+    title_hint = _WHITESPACE_RE.sub(" ", title_hint).strip()
 
     if parent_name and parent_name != basename:
-        author_hint = parent_name
-        author_hint_clean = _strip_series_numbers(author_hint)
-        author_hint_clean = re.sub(r"[\[\](){}]", "", author_hint_clean)
-        author_hint = re.sub(r"\s+", " ", author_hint_clean).strip()
-
-    result = {
-        "title_hint": title_hint,
-        "author_hint": author_hint,
-        "query": f"{author_hint} {title_hint}".strip() if author_hint else title_hint,
-    }
-    log.debug(f"parse_source_path: result={result}")
-    return result
+        author_hint_clean = _strip_series_numbers(parent_name)
+        author_hint_clean = author_hint_clean.translate(_BRACKET_CHARS)
+        author_hint = _WHITESPACE_RE.sub(" ", author_hint_clean).strip()
+
+    return (
+        ("title_hint", title_hint),
+        ("author_hint", author_hint),
+        ("query", f"{author_hint} {title_hint}".strip() if author_hint else title_hint),
+    )
+
+
+@lru_cache(maxsize=2048)
+def _strip_standalone_nums(s: str) -> str:
+    """Drop space-bounded 1-3 digit tokens and collapse whitespace.
+
+    Single-pass equivalent of ``_STANDALONE_NUM_RE.sub(" ", s)`` followed by
+    whitespace collapsing, for strings whose only whitespace is " " (i.e.
+    ``s.isprintable()``). Like the regex, matches don't overlap: in
+    "A 1 2 B" the space before "2" was consumed by the " 1 " match, so "2"
+    survives.
+    """
+    tokens = s.split(" ")
+    last = len(tokens) - 1
+    kept = []
+    dropped = False
+    for i, tok in enumerate(tokens):
+        dropped = (
+            not dropped
+            and 0 < i < last
+            and len(tok) <= 3
+            and tok.isascii()
+            and tok.isdigit()
+        )
+        if not dropped and tok:
+            kept.append(tok)
+    return " ".join(kept)
 
 
 def _strip_series_numbers(s: str) -> str:
     """Strip series numbering patterns from a string."""
     original = s
-    s = re.sub(r"\[[0-9]+\]", "", s)
-    s = re.sub(r"#[0-9]+-", "", s)
-    s = re.sub(r"^[0-9]+\s*[-\u2013]?\s*", "", s)
-    s = re.sub(r"\s[0-9]{1,3}\s", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _BRACKET_NUM_RE.sub("", s)
+    s = _HASH_NUM_RE.sub("", s)
+    s = _LEADING_NUM_RE.sub("", s)
+    if s.isprintable():
+        s = _strip_standalone_nums(s)
+    else:
+        # Tabs/newlines/non-ASCII spaces: let the regex handle \s exactly
+        s = _STANDALONE_NUM_RE.sub(" ", s)
+        s = _WHITESPACE_RE.sub(" ", s).strip()
 
     if s != original:
         log.debug(f"_strip_series_numbers: {original!r} -> {s!r}")
@@ -178,13 +178,11 @@ def main(
 
     config = PipelineConfig(**config_kwargs)  # type: ignore[arg-type]
 
-    # Enforce level semantics on ai_all
+    # Enforce level semantics on ai_all -- copy rather than re-reading env/.env
     if config.level in (PipelineLevel.AI, PipelineLevel.FULL):
-        config_kwargs["ai_all"] = True
-        config = PipelineConfig(**config_kwargs)  # type: ignore[arg-type]
+        config = config.model_copy(update={"ai_all": True})
     elif config.level in (PipelineLevel.SIMPLE, PipelineLevel.NORMAL):
-        config_kwargs["ai_all"] = False
-        config = PipelineConfig(**config_kwargs)  # type: ignore[arg-type]
+        config = config.model_copy(update={"ai_all": False})
 
     config.setup_logging()
     log.info(f"Pipeline level: {config.level.value}")
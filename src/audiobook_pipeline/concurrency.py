@@ -1,13 +1,21 @@
 """File locking and disk space checks."""
 
+import os
 import shutil
 import sys
+import threading
+import time
 from pathlib import Path
 
 from loguru import logger
 
 log = logger.bind(stage="concurrency")
 
+# Free-space readings per work_dir: {path: (monotonic_ts, free_bytes)}
+_DISK_FREE_TTL = 5.0
+_DISK_FREE_CACHE: dict[str, tuple[float, int]] = {}
+_DISK_FREE_LOCK = threading.Lock()
+
 
 class LockError(Exception):
     """Raised when lock cannot be acquired."""
@@ -26,7 +34,7 @@ def acquire_global_lock(lock_dir: Path, skip: bool = False) -> object | None:
         log.debug("Skipping lock acquisition")
         return None
 
-    lock_dir.mkdir(parents=True, exist_ok=True)
+    os.makedirs(lock_dir, exist_ok=True)
     lock_file = lock_dir / "pipeline.lock"
 
     if sys.platform == "win32":
@@ -42,15 +50,69 @@ def acquire_global_lock(lock_dir: Path, skip: bool = False) -> object | None:
         return fh
     else:
         import fcntl
-        fh = open(lock_file, "w")
+        # Raw open + flock: no truncation of a file another instance holds,
+        # and no buffered file object unless we actually get the lock.
+        fd = os.open(lock_file, os.O_WRONLY | os.O_CREAT, 0o644)
         try:
-            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
         except OSError:
-            fh.close()
+            os.close(fd)
             log.warning(f"Failed to acquire lock at {lock_file}")
             raise LockError("Another pipeline instance is running")
         log.info(f"Lock acquired at {lock_file}")
-        return fh
+        return os.fdopen(fd, "w")
+
+
+def _disk_free(path: Path) -> int:
+    """Free bytes on path's filesystem, reused for _DISK_FREE_TTL seconds.
+
+    A batch checks every book against the same work_dir; this turns N
+    statvfs calls (milliseconds each on NFS) into one per TTL window.
+    """
+    key = str(path)
+    now = time.monotonic()
+    with _DISK_FREE_LOCK:
+        hit = _DISK_FREE_CACHE.get(key)
+        if hit and now - hit[0] < _DISK_FREE_TTL:
+            return hit[1]
+    free = shutil.disk_usage(path).free
+    with _DISK_FREE_LOCK:
+        _DISK_FREE_CACHE[key] = (now, free)
+    return free
+
+
+def clear_disk_cache() -> None:
+    """Forget cached free-space readings."""
+    with _DISK_FREE_LOCK:
+        _DISK_FREE_CACHE.clear()
+
+
+def _dir_size(path: Path) -> int:
+    """Total size of regular files under path (one stat per file).
+
+    Uses os.scandir's cached d_type for the file/dir test instead of an
+    extra stat per entry. Like Path.rglob, symlinked directories are not
+    descended; symlinked files count their target's size. Best-effort:
+    unreadable directories and entries that vanish mid-walk are skipped.
+    """
+    total = 0
+    stack = [str(path)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        total += entry.stat().st_size
+                except OSError:
+                    continue
+    return total
 
 
 def check_disk_space(source_path: Path, work_dir: Path, multiplier: int = 3) -> bool:
@@ -64,14 +126,12 @@ def check_disk_space(source_path: Path, work_dir: Path, multiplier: int = 3) ->
     if source_path.is_file():
         source_size = source_path.stat().st_size
     else:
-        source_size = sum(
-            f.stat().st_size for f in source_path.rglob("*") if f.is_file()
-        )
+        source_size = _dir_size(source_path)
 
     required = source_size * multiplier
-    usage = shutil.disk_usage(work_dir)
-    result = usage.free >= required
+    free = _disk_free(work_dir)
+    result = free >= required
 
-    log.debug(f"Disk space check: required={required:,} bytes, free={usage.free:,} bytes, sufficient={result}")
+    log.debug(f"Disk space check: required={required:,} bytes, free={free:,} bytes, sufficient={result}")
 
     return result
@@ -20,6 +20,10 @@ warnings.filterwarnings(
     module="pydantic_settings",
 )
 
+_LOG_FORMAT = (
+    "{time:YYYY-MM-DDTHH:mm:ssZ} | {level:<8} | {extra[stage]:<12} | {message}"
+)
+
 
 class PipelineConfig(BaseSettings):
     """All pipeline configuration with layered resolution:
@@ -124,28 +128,26 @@ class PipelineConfig(BaseSettings):
         """Configure loguru for the pipeline."""
         logger.remove()  # Remove default stderr handler
 
-        log_format = (
-            "{time:YYYY-MM-DDTHH:mm:ssZ} | {level:<8} | "
-            "{extra[stage]:<12} | {message}"
-        )
-
-        def _default_extra(record):
-            record["extra"].setdefault("stage", "")
-            return True
+        # Default stage for records logged without logger.bind(stage=...);
+        # merged into every record by loguru, so sinks need no filter
+        logger.configure(extra={"stage": ""})
 
         logger.add(
             sys.stderr,
-            format=log_format,
+            format=_LOG_FORMAT,
             level=self.log_level.upper(),
-            filter=_default_extra,
         )
 
         self.log_dir.mkdir(parents=True, exist_ok=True)
+        # enqueue: file writes, rotation and gzip of rotated files happen on
+        # loguru's writer thread instead of blocking conversion workers.
+        # Writes stay line-buffered so `tail -f` and crash logs are complete.
         logger.add(
             str(self.log_dir / "pipeline.log"),
-            format=log_format,
+            format=_LOG_FORMAT,
             level="DEBUG",
             rotation="10 MB",
             retention="30 days",
-            filter=_default_extra,
+            compression="gz",
+            enqueue=True,
         )
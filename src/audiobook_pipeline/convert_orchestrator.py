@@ -24,6 +24,10 @@ from .stages import get_stage_runner
 
 log = logger.bind(stage="orchestrator")
 
+_CPU_COUNT = os.cpu_count() or 1
+# Shortest window a CPU reading covers; closer calls reuse the last reading
+_CPU_SAMPLE_MIN_S = 1.0
+
 
 class ConvertOrchestrator:
     """CPU-aware parallel batch processor for audiobook conversion.
@@ -44,6 +48,12 @@ class ConvertOrchestrator:
         """
         self.config = config
         self.db = PipelineDB(config.db_path)
+        # Balance workers vs threads: enough parallelism to keep CPU busy
+        # but enough threads per worker for ffmpeg to work efficiently
+        self._auto_workers = max(1, min(4, _CPU_COUNT // 3))
+        # Last CPU reading and when it was taken (see _cpu_load_pct)
+        self._cpu_pct: float | None = None
+        self._cpu_sampled_at = 0.0
 
     def clean_state(self, book_dirs: list[Path]) -> None:
         """Reset book records and work dirs for books in the batch.
@@ -101,8 +111,8 @@ class ConvertOrchestrator:
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             while queued or active:
                 # Check CPU and submit new jobs if below ceiling
-                # Ramp up gradually: measure CPU with a real interval between
-                # submissions so readings reflect actual load from new workers
+                # Ramp up gradually: the sleep between submissions is the
+                # sampling window, so readings reflect load from new workers
                 cpu_load = self._cpu_load_pct()
                 while (
                     queued
@@ -119,7 +129,7 @@ class ConvertOrchestrator:
                     )
                     # Let CPU readings stabilize before submitting the next job
                     time.sleep(2.0)
-                    cpu_load = psutil.cpu_percent(interval=1.0)
+                    cpu_load = self._cpu_load_pct()
 
                 # Display status
                 self._display_status(
@@ -438,17 +448,14 @@ class ConvertOrchestrator:
         Returns:
             Number of worker threads to use
         """
-        cpu_count = os.cpu_count() or 1
         if self.config.max_parallel_converts > 0:
             max_workers = self.config.max_parallel_converts
             log.debug(f"Using configured max_parallel_converts: {max_workers}")
         else:
-            # Balance workers vs threads: enough parallelism to keep CPU busy
-            # but enough threads per worker for ffmpeg to work efficiently
-            max_workers = max(1, min(4, cpu_count // 3))
+            max_workers = self._auto_workers
             log.debug(
                 f"Auto-calculated max_workers: {max_workers} "
-                f"(cpu_count={cpu_count})"
+                f"(cpu_count={_CPU_COUNT})"
             )
         return max_workers
 
@@ -464,19 +471,32 @@ class ConvertOrchestrator:
         Returns:
             Number of threads to allocate (0 means use all cores)
         """
-        cpu_count = os.cpu_count() or 1
         if active_count <= 1:
             return 0  # single book: all cores
-        return max(1, (cpu_count - 1) // active_count)
+        return max(1, (_CPU_COUNT - 1) // active_count)
 
     def _cpu_load_pct(self) -> float:
         """Get CPU utilization as a percentage (0-100).
 
-        Uses a blocking 1-second psutil sample for accurate system-wide
-        measurement. Non-blocking (interval=None) underreports when the
-        calling thread spends most of its time sleeping in wait().
+        The single metric for all scheduling decisions. A non-blocking psutil
+        sample measures CPU time since this thread's previous sample, so the
+        loop's own waits (wait() timeout, ramp-up sleep) are the sampling
+        window and no pass blocks on a fresh 1-second sample. The load average
+        is not used: it trails real usage by up to a minute and counts tasks
+        blocked on I/O, which would skew ramp-up and ramp-down.
+
+        The first call blocks for one window to prime the baseline. Calls
+        less than _CPU_SAMPLE_MIN_S apart reuse the last reading instead of
+        reporting a noisy few-millisecond window.
         """
-        return psutil.cpu_percent(interval=1.0)
+        if self._cpu_pct is None:
+            self._cpu_pct = psutil.cpu_percent(interval=_CPU_SAMPLE_MIN_S)
+        elif time.monotonic() - self._cpu_sampled_at >= _CPU_SAMPLE_MIN_S:
+            self._cpu_pct = psutil.cpu_percent(interval=None)
+        else:
+            return self._cpu_pct
+        self._cpu_sampled_at = time.monotonic()
+        return self._cpu_pct
 
     def _display_status(
         self,
@@ -1,36 +1,122 @@
 """FFprobe subprocess wrappers for audio file inspection."""
 
 import json
+import shutil
+import stat
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from loguru import logger
 
+try:  # optional C JSON parser (pip install audiobook-pipeline[fast])
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    _json_loads = json.loads
+
 log = logger.bind(stage="ffprobe")
 
+# Smaller than a handful of MP3/AAC frames -- never a usable audio file
+_MIN_AUDIO_BYTES = 1024
+
+
+@lru_cache(maxsize=1)
+def _ffprobe_bin() -> str:
+    """Absolute path to ffprobe (bare name if not on PATH)."""
+    return shutil.which("ffprobe") or "ffprobe"
+
 
 def _run_ffprobe(args: list[str]) -> subprocess.CompletedProcess:
-    """Run ffprobe with common flags."""
+    """Run ffprobe with common flags.
+
+    An absolute executable path and close_fds=False let CPython launch via
+    posix_spawn instead of fork+exec. Python-opened fds are non-inheritable
+    (PEP 446), so nothing leaks into the child.
+    """
     log.debug(f"Running ffprobe with args: {args}")
     return subprocess.run(
-        ["ffprobe", "-v", "error"] + args,
+        [_ffprobe_bin(), "-v", "error"] + args,
         capture_output=True,
         text=True,
+        close_fds=False,
     )
 
 
-def get_duration(file: Path) -> float:
-    """Get duration in seconds."""
+def probe(file: Path) -> dict:
+    """Probe format, tags, first audio stream and chapters in one ffprobe call.
+
+    Returns the parsed ``{"format": {...}, "streams": [...], "chapters": [...]}``
+    JSON, or {} when ffprobe fails. Results are cached per file version (path, mtime,
+    size), so the getters below share a single subprocess per file.
+    """
+    path = str(file)
+    try:
+        st = file.stat()
+    except OSError:
+        # Let ffprobe report on paths we can't stat, but don't cache them
+        return _probe_or_empty(_probe_uncached, path)
+    return _probe_or_empty(_probe_cached, path, st.st_mtime_ns, st.st_size)
+
+
+def _probe_or_empty(fn, *args) -> dict:
+    """Call a probe function, mapping failures to {}."""
+    try:
+        return fn(*args)
+    except ValueError as e:
+        log.debug(f"ffprobe failed for {args[0]}: {e}")
+        return {}
+
+
+def _probe_uncached(path: str) -> dict:
+    """Run the combined probe; raises ValueError so failures aren't cached."""
     result = _run_ffprobe(
         [
-            "-show_entries",
-            "format=duration",
+            "-select_streams",
+            "a:0",
+            "-show_format",
+            "-show_streams",
+            "-show_chapters",
             "-of",
-            "default=noprint_wrappers=1:nokey=1",
-            str(file),
+            "json",
+            path,
         ]
     )
-    output = result.stdout.strip()
+    if result.returncode != 0:
+        raise ValueError(f"ffprobe exited {result.returncode}")
+    try:
+        data = _json_loads(result.stdout)
+    except json.JSONDecodeError as e:  # orjson's error subclasses this
+        raise ValueError(f"invalid ffprobe JSON: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError("ffprobe JSON is not an object")
+    return data
+
+
+@lru_cache(maxsize=1024)
+def _probe_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """_probe_uncached keyed on file version; callers must not mutate the result."""
+    return _probe_uncached(path)
+
+
+def clear_cache() -> None:
+    """Drop cached probe results."""
+    _probe_cached.cache_clear()
+
+
+def _format_field(file: Path, key: str) -> str:
+    """Return a format-level field from the cached probe ("" if absent)."""
+    return str(probe(file).get("format", {}).get(key, "") or "")
+
+
+def _stream_field(file: Path, key: str) -> str:
+    """Return a field of the first audio stream ("" if absent)."""
+    streams = probe(file).get("streams") or [{}]
+    return str(streams[0].get(key, "") or "")
+
+
+def get_duration(file: Path) -> float:
+    """Get duration in seconds."""
+    output = _format_field(file, "duration")
     if not output:
         log.error(f"ffprobe returned empty duration for {file}")
         raise ValueError(f"ffprobe returned empty duration for {file}")
@@ -41,16 +127,7 @@ def get_duration(file: Path) -> float:
 
 def get_bitrate(file: Path) -> int:
     """Get bitrate in bits/sec."""
-    result = _run_ffprobe(
-        [
-            "-show_entries",
-            "format=bit_rate",
-            "-of",
-            "default=noprint_wrappers=1:nokey=1",
-            str(file),
-        ]
-    )
-    output = result.stdout.strip()
+    output = _format_field(file, "bit_rate")
     if not output:
         log.error(f"ffprobe returned empty bitrate for {file}")
         raise ValueError(f"ffprobe returned empty bitrate for {file}")
@@ -61,36 +138,14 @@ def get_bitrate(file: Path) -> int:
 
 def get_codec(file: Path) -> str:
     """Get audio codec name."""
-    result = _run_ffprobe(
-        [
-            "-select_streams",
-            "a:0",
-            "-show_entries",
-            "stream=codec_name",
-            "-of",
-            "default=noprint_wrappers=1:nokey=1",
-            str(file),
-        ]
-    )
-    codec = result.stdout.strip()
+    codec = _stream_field(file, "codec_name")
     log.debug(f"Codec for {file.name}: {codec}")
     return codec
 
 
 def get_channels(file: Path) -> int:
     """Get audio channel count."""
-    result = _run_ffprobe(
-        [
-            "-select_streams",
-            "a:0",
-            "-show_entries",
-            "stream=channels",
-            "-of",
-            "default=noprint_wrappers=1:nokey=1",
-            str(file),
-        ]
-    )
-    output = result.stdout.strip()
+    output = _stream_field(file, "channels")
     if not output:
         raise ValueError(f"ffprobe returned empty channel count for {file}")
     channels = int(output)
@@ -100,18 +155,7 @@ def get_channels(file: Path) -> int:
 
 def get_sample_rate(file: Path) -> int:
     """Get sample rate in Hz."""
-    result = _run_ffprobe(
-        [
-            "-select_streams",
-            "a:0",
-            "-show_entries",
-            "stream=sample_rate",
-            "-of",
-            "default=noprint_wrappers=1:nokey=1",
-            str(file),
-        ]
-    )
-    output = result.stdout.strip()
+    output = _stream_field(file, "sample_rate")
     if not output:
         raise ValueError(f"ffprobe returned empty sample rate for {file}")
     sample_rate = int(output)
@@ -121,11 +165,19 @@ def get_sample_rate(file: Path) -> int:
 
 def validate_audio_file(file: Path) -> bool:
     """Check if file is a valid audio file with at least one audio stream."""
-    if not file.is_file():
+    try:
+        st = file.stat()
+    except OSError:
         log.debug(f"File not found: {file}")
         return False
-    result = _run_ffprobe([str(file)])
-    if result.returncode != 0:
+    if not stat.S_ISREG(st.st_mode):
+        log.debug(f"Not a regular file: {file}")
+        return False
+    if st.st_size < _MIN_AUDIO_BYTES:
+        # Empty/truncated leftovers: no need to spawn ffprobe to reject them
+        log.debug(f"Too small to be audio ({st.st_size} bytes): {file.name}")
+        return False
+    if not probe(file):
         log.debug(f"Invalid audio file (ffprobe failed): {file.name}")
         return False
     codec = get_codec(file)
@@ -136,10 +188,8 @@ def validate_audio_file(file: Path) -> bool:
 
 def duration_to_timestamp(seconds: float) -> str:
     """Convert seconds to HH:MM:SS."""
-    total = int(seconds)
-    h = total // 3600
-    m = (total % 3600) // 60
-    s = total % 60
+    h, rem = divmod(int(seconds), 3600)
+    m, s = divmod(rem, 60)
     return f"{h:02d}:{m:02d}:{s:02d}"
 
 
@@ -149,32 +199,11 @@ def get_tags(file: Path) -> dict:
     Returns dict with lowercase keys. Common keys: artist, album_artist,
     title, album, genre, date, comment.
     """
-    result = subprocess.run(
-        [
-            "ffprobe",
-            "-v",
-            "error",
-            "-show_entries",
-            "format_tags",
-            "-of",
-            "json",
-            str(file),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        return {}
-    try:
-        data = json.loads(result.stdout)
-        raw = data.get("format", {}).get("tags", {})
-        # Normalize keys to lowercase
-        tags = {k.lower(): v for k, v in raw.items()}
-        log.debug(f"Extracted {len(tags)} tags from {file.name}")
-        return tags
-    except (json.JSONDecodeError, KeyError) as e:
-        log.warning(f"Failed to parse tags from {file.name}: {e}")
-        return {}
+    raw = probe(file).get("format", {}).get("tags") or {}
+    # Normalize keys to lowercase
+    tags = {k.lower(): v for k, v in raw.items()}
+    log.debug(f"Extracted {len(tags)} tags from {file.name}")
+    return tags
 
 
 def extract_author_from_tags(tags: dict) -> str:
@@ -269,33 +298,13 @@ def _clean_author_tag(raw: str) -> str:
 
 def get_format_name(file: Path) -> str:
     """Get container format name (e.g. 'mov,mp4,m4a,3gp,3g2,mj2')."""
-    result = _run_ffprobe(
-        [
-            "-show_entries",
-            "format=format_name",
-            "-of",
-            "default=noprint_wrappers=1:nokey=1",
-            str(file),
-        ]
-    )
-    fmt = result.stdout.strip()
+    fmt = _format_field(file, "format_name")
     log.debug(f"Format for {file.name}: {fmt}")
     return fmt
 
 
 def count_chapters(file: Path) -> int:
-    """Count embedded chapters in an audio file."""
-    result = subprocess.run(
-        ["ffprobe", "-v", "error", "-show_chapters", "-of", "json", str(file)],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        return 0
-    try:
-        data = json.loads(result.stdout)
-        count = len(data.get("chapters", []))
-        log.debug(f"Chapter count for {file.name}: {count}")
-        return count
-    except (json.JSONDecodeError, KeyError):
-        return 0
+    """Count embedded chapters in an audio file (0 if ffprobe fails)."""
+    count = len(probe(file).get("chapters") or [])
+    log.debug(f"Chapter count for {file.name}: {count}")
+    return count
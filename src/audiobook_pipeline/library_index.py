@@ -1,7 +1,9 @@
 """Pre-built index of a Plex audiobook library for O(1) lookups.
 
-Scans the destination library once at batch start using os.walk(),
-replacing per-call iterdir() with dict lookups. Supports:
+Scans the destination library once at batch start using os.scandir(),
+replacing per-call iterdir() with dict lookups. With a PipelineDB, directory
+listings are persisted and only directories whose mtime changed are re-read
+on the next run. Supports:
 - Fast folder name reuse (normalized near-match detection)
 - File existence checks for early-skip
 - Cross-source dedup within a batch
@@ -14,6 +16,8 @@ from __future__ import annotations
 
 import os
 import re
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -26,21 +30,45 @@ if TYPE_CHECKING:
 
 log = logger.bind(stage="index")
 
+# NAS/OS housekeeping dirs: never author/book folders, so neither indexed
+# nor descended into (hidden dirs -- names starting with "." -- likewise)
+_SKIP_DIRS = frozenset({"@eaDir", "#recycle", "#snapshot", "lost+found"})
+
+# Snapshot rows scanned within this long of the dir's mtime aren't trusted:
+# a later change in the same mtime tick (coarse on NFS/SMB) would go unseen
+_RACY_NS = 2_000_000_000
+
+# Author-name cleanup patterns (module scope: used per match_author call)
+_ROLE_SUFFIX_RE = re.compile(
+    r",?\s+\w+\s*-\s*(editor|translator|narrator|foreword|introduction)\b.*$",
+    re.IGNORECASE,
+)
+_ROLE_PAREN_RE = re.compile(
+    r"\s*\((Author|Editor|Translator|Narrator)\)", re.IGNORECASE
+)
+_AUTHOR_SPLIT_RE = re.compile(r",\s*|\s+and\s+")
+_JOINED_INITIALS_RE = re.compile(r"([a-z])\.([a-z])")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class LibraryIndex:
     """In-memory index of library folder structure for batch operations.
 
-    Built once via os.walk() at batch start. Provides O(1) lookups
+    Built once via an os.scandir() walk at batch start. Provides O(1) lookups
     instead of per-call iterdir() scans.
     """
 
     def __init__(self, library_root: Path, db: PipelineDB | None = None) -> None:
         self.library_root = library_root
         self._db = db
-        # Map: parent_path -> {normalized_name: actual_name}
-        self._folders: dict[Path, dict[str, str]] = {}
-        # Set of (dest_dir, filename) for file existence checks
-        self._files: set[tuple[Path, str]] = set()
+        # Map: parent path string -> {normalized_name: actual_name}
+        self._folders: dict[str, dict[str, str]] = {}
+        # Map: parent path string -> set of actual folder names. Distinct names
+        # can share a normalized key ("Good Omens" / "Good Omens (2019)"), so
+        # exact matches are checked here before the normalized lookup.
+        self._folder_names: dict[str, set[str]] = {}
+        # Map: dest_dir string -> set of filenames, for file existence checks
+        self._files: dict[str, set[str]] = {}
         # Set of source stems already processed in this batch
         self._processed: set[str] = set()
         # Map: lowercase surname -> list of existing author folder names
@@ -51,31 +79,82 @@ class LibraryIndex:
         self._scan(library_root)
 
     def _scan(self, root: Path) -> None:
-        """Walk the library tree and build lookup dicts."""
-        if not root.is_dir():
-            log.debug(f"Library root does not exist yet: {root}")
-            return
-
+        """Walk the library tree and build lookup dicts.
+
+        Iterative walk keyed on path strings (see _list_dir). With a
+        PipelineDB, each directory's listing is persisted with its mtime and
+        reused on the next run while the mtime is unchanged -- adding,
+        removing or renaming an entry always bumps the parent's mtime -- so
+        an unchanged library costs one stat per directory instead of a full
+        directory read.
+        """
         folder_count = 0
         file_count = 0
+        folders = self._folders
+        folder_names = self._folder_names
+        files = self._files
+        root_str = os.fspath(root)
+        snapshot = (
+            self._db.get_library_dirs(root_str) if self._db is not None else None
+        )
+        rescanned: list[tuple[str, int, int, list, list]] = []
+        visited: set[str] = set()
+        reused = 0
+
+        stack = [root_str]
+        while stack:
+            top = stack.pop()
+            listing = None
+            try:
+                if snapshot is not None:
+                    scanned_ns = time.time_ns()
+                    mtime_ns = os.stat(top).st_mtime_ns
+                    cached = snapshot.get(top)
+                    if (
+                        cached is not None
+                        and cached[0] == mtime_ns
+                        and cached[1] - mtime_ns > _RACY_NS
+                    ):
+                        listing = cached[2], cached[3]
+                        reused += 1
+                if listing is None:
+                    listing = _list_dir(top)
+                    if snapshot is not None:
+                        rescanned.append((top, mtime_ns, scanned_ns, *listing))
+            except (FileNotFoundError, NotADirectoryError):
+                if top == root_str:
+                    # No separate is_dir() stat up front; scandir tells us
+                    log.debug(f"Library root does not exist yet: {root}")
+                    return
+                continue
+            except OSError:
+                continue
+            visited.add(top)
+
+            dirs, file_names = listing
+            if dirs:
+                folders[top] = {_normalize_for_compare(n): n for n, _ in dirs}
+                folder_names[top] = {n for n, _ in dirs}
+                folder_count += len(dirs)
+            if file_names:
+                files[top] = set(file_names)
+                file_count += len(file_names)
+            # Reversed so the stack pops siblings in scandir order (like walk)
+            stack.extend(
+                os.path.join(top, name) for name, descend in reversed(dirs) if descend
+            )
 
-        for dirpath, dirnames, filenames in os.walk(root):
-            parent = Path(dirpath)
-            # Index subdirectories under this parent
-            if dirnames:
-                normalized = {}
-                for d in dirnames:
-                    norm = _normalize_for_compare(d)
-                    normalized[norm] = d
-                self._folders[parent] = normalized
-                folder_count += len(dirnames)
-            # Index files for existence checks
-            for f in filenames:
-                self._files.add((parent, f))
-                file_count += 1
+        if snapshot is not None:
+            removed = snapshot.keys() - visited
+            if rescanned or removed:
+                self._db.save_library_dirs(root_str, rescanned, removed)
+            log.debug(
+                f"Index snapshot: {reused} dirs reused, {len(rescanned)} rescanned, "
+                f"{len(removed)} removed"
+            )
 
         # Build surname index from top-level author folders
-        root_folders = self._folders.get(root, {})
+        root_folders = folders.get(root_str, {})
         for actual_name in root_folders.values():
             surname = _extract_surname(actual_name)
             if surname:
@@ -93,12 +172,13 @@ class LibraryIndex:
         under parent, otherwise returns desired unchanged.
         Uses token-based similarity to catch redundant author prefixes.
         """
-        folder_map = self._folders.get(parent)
+        key = os.fspath(parent)
+        folder_map = self._folders.get(key)
         if folder_map is None:
             return desired
 
-        # Exact match fast path
-        if desired in folder_map.values():
+        # Exact match fast path (O(1))
+        if desired in self._folder_names.get(key, ()):
             return desired
 
         # Normalized exact lookup (O(1))
@@ -117,7 +197,7 @@ class LibraryIndex:
 
     def file_exists(self, dest_dir: Path, filename: str) -> bool:
         """Check if a file exists at dest_dir/filename (O(1))."""
-        return (dest_dir, filename) in self._files
+        return filename in self._files.get(os.fspath(dest_dir), ())
 
     def mark_processed(self, source_stem: str) -> bool:
         """Mark a source stem as processed. Returns True if already seen.
@@ -132,14 +212,14 @@ class LibraryIndex:
 
     def register_new_folder(self, parent: Path, folder_name: str) -> None:
         """Register a newly created folder in the index."""
-        if parent not in self._folders:
-            self._folders[parent] = {}
+        key = os.fspath(parent)
         norm = _normalize_for_compare(folder_name)
-        self._folders[parent][norm] = folder_name
+        self._folders.setdefault(key, {})[norm] = folder_name
+        self._folder_names.setdefault(key, set()).add(folder_name)
 
     def register_new_file(self, dest_dir: Path, filename: str) -> None:
         """Register a newly added file in the index."""
-        self._files.add((dest_dir, filename))
+        self._files.setdefault(os.fspath(dest_dir), set()).add(filename)
 
     def is_correctly_placed(self, source_path: Path, dest_path: Path) -> bool:
         """Check if a file is already in its correct destination.
@@ -264,7 +344,32 @@ class LibraryIndex:
     @property
     def file_count(self) -> int:
         """Total number of indexed files."""
-        return len(self._files)
+        return sum(len(v) for v in self._files.values())
+
+
+def _list_dir(top: str) -> tuple[list[list], list[str]]:
+    """List one directory for the index: ([[dir_name, descend], ...], files).
+
+    os.scandir's DirEntry d_type answers is_dir()/is_symlink() without a stat
+    (or with one cached lstat on filesystems that report DT_UNKNOWN, e.g.
+    some NFS servers). Mirrors os.walk(followlinks=False): symlinked dirs
+    are listed but not descended into. Hidden and NAS housekeeping dirs
+    (_SKIP_DIRS) are pruned. Raises OSError if top can't be read.
+    """
+    dirs: list[list] = []
+    files: list[str] = []
+    with os.scandir(top) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            name = entry.name
+            if not is_dir:
+                files.append(name)
+            elif name[0] != "." and name not in _SKIP_DIRS:
+                dirs.append([name, not entry.is_symlink()])
+    return dirs, files
 
 
 def _extract_surname(name: str) -> str:
@@ -280,7 +385,7 @@ def _extract_surname(name: str) -> str:
         return ""
     cleaned = _clean_author_name(name)
     # Take the first author (primary) if comma or "and" separated
-    parts = re.split(r",\s*|\s+and\s+", cleaned)
+    parts = _AUTHOR_SPLIT_RE.split(cleaned)
     first_author = parts[0].strip()
     # Take the last word (surname)
     words = first_author.split()
@@ -299,22 +404,13 @@ def _clean_author_name(name: str) -> str:
     "Brandon Sanderson (Author)" -> "Brandon Sanderson"
     """
     # Strip " - editor", " - translator", etc.
-    cleaned = re.sub(
-        r",?\s+\w+\s*-\s*(editor|translator|narrator|foreword|introduction)\b.*$",
-        "",
-        name,
-        flags=re.IGNORECASE,
-    )
+    cleaned = _ROLE_SUFFIX_RE.sub("", name)
     # Strip "(Author)", "(Editor)", etc.
-    cleaned = re.sub(
-        r"\s*\((Author|Editor|Translator|Narrator)\)",
-        "",
-        cleaned,
-        flags=re.IGNORECASE,
-    )
+    cleaned = _ROLE_PAREN_RE.sub("", cleaned)
     return cleaned.strip()
 
 
+@lru_cache(maxsize=4096)
 def _normalize_author(name: str) -> str:
     """Normalize an author name for comparison, handling initials.
 
@@ -324,11 +420,11 @@ def _normalize_author(name: str) -> str:
     """
     s = name.lower().strip()
     # Expand concatenated initials: "j.r.r." -> "j. r. r."
-    s = re.sub(r"([a-z])\.([a-z])", r"\1. \2", s)
+    s = _JOINED_INITIALS_RE.sub(r"\1. \2", s)
     # Repeat for triple+ initials
-    s = re.sub(r"([a-z])\.([a-z])", r"\1. \2", s)
+    s = _JOINED_INITIALS_RE.sub(r"\1. \2", s)
     # Strip all periods
     s = s.replace(".", "")
     # Collapse whitespace
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _WHITESPACE_RE.sub(" ", s).strip()
     return s
@@ -60,8 +60,8 @@ class Stage(StrEnum):
 
 
 # Which stages run for each mode
-STAGE_ORDER: dict[PipelineMode, list[Stage]] = {
-    PipelineMode.CONVERT: [
+STAGE_ORDER: dict[PipelineMode, tuple[Stage, ...]] = {
+    PipelineMode.CONVERT: (
         Stage.VALIDATE,
         Stage.CONCAT,
         Stage.CONVERT,
@@ -70,34 +70,34 @@ STAGE_ORDER: dict[PipelineMode, list[Stage]] = {
         Stage.ORGANIZE,
         Stage.ARCHIVE,
         Stage.CLEANUP,
-    ],
-    PipelineMode.ENRICH: [
+    ),
+    PipelineMode.ENRICH: (
         Stage.ASIN,
         Stage.METADATA,
         Stage.ORGANIZE,
         Stage.CLEANUP,
-    ],
-    PipelineMode.METADATA: [
+    ),
+    PipelineMode.METADATA: (
         Stage.ASIN,
         Stage.METADATA,
         Stage.CLEANUP,
-    ],
-    PipelineMode.ORGANIZE: [
+    ),
+    PipelineMode.ORGANIZE: (
         Stage.ASIN,
         Stage.METADATA,
         Stage.ORGANIZE,
-    ],
+    ),
 }
 
-# Stages that are pre-completed for non-convert modes
-PRE_COMPLETED_STAGES: dict[PipelineMode, list[Stage]] = {
-    PipelineMode.ENRICH: [Stage.VALIDATE, Stage.CONCAT, Stage.CONVERT],
-    PipelineMode.METADATA: [Stage.VALIDATE, Stage.CONCAT, Stage.CONVERT],
-    PipelineMode.ORGANIZE: [
-        Stage.VALIDATE,
-        Stage.CONCAT,
-        Stage.CONVERT,
-    ],
+# Stages that are pre-completed for non-convert modes (sets: membership-tested
+# per stage in PipelineDB.create)
+_CONVERT_STAGES: frozenset[Stage] = frozenset(
+    {Stage.VALIDATE, Stage.CONCAT, Stage.CONVERT}
+)
+PRE_COMPLETED_STAGES: dict[PipelineMode, frozenset[Stage]] = {
+    PipelineMode.ENRICH: _CONVERT_STAGES,
+    PipelineMode.METADATA: _CONVERT_STAGES,
+    PipelineMode.ORGANIZE: _CONVERT_STAGES,
 }
 
 AUDIO_EXTENSIONS: frozenset[str] = frozenset(
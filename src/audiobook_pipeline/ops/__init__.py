@@ -11,8 +11,10 @@ Submodules:
                     and _is_franchise_folder for cross-module use.
     library_diff -- Cross-library comparison via compare_libraries(source, target).
                     Multi-part M4B collapsing, author normalization, franchise folder
-                    awareness, and fuzzy title matching (>=85%). Returns LibraryDiff
-                    with missing/matched BookEntry lists. CLI: audiobook-audit --diff.
+                    awareness, and fuzzy title matching (>=85%, rapidfuzz extractOne).
+                    Top-level folders are scanned in parallel with os.scandir. Returns
+                    LibraryDiff with missing/matched BookEntry lists. CLI:
+                    audiobook-audit --diff.
     organize     -- Path parsing (patterns A-G) with optional source_dir parameter for
                 author-only directory fallback via _title_from_audio_file helper.
                 Plex-compatible folder structure, library copying/moving with
@@ -17,6 +17,7 @@ import re
 import subprocess
 from collections import defaultdict
 from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 from loguru import logger
@@ -279,8 +280,7 @@ def check_duplicates(library_root: Path) -> list[AuditFinding]:
         if len(m4bs) > 1:
             # Check if these are multi-part files (Part 1, Part 2, etc.)
             names = [Path(p).stem for p in m4bs]
-            part_pattern = re.compile(r"[,\s]*part\s+\d+\s*$", re.IGNORECASE)
-            all_parts = all(part_pattern.search(n) for n in names)
+            all_parts = all(_PART_FILE_RE.search(n) for n in names)
 
             if all_parts:
                 findings.append(
@@ -327,6 +327,69 @@ def check_duplicates(library_root: Path) -> list[AuditFinding]:
     return findings
 
 
+# _normalize_for_dedup() strip patterns, applied in order before the
+# author-specific prefix/suffix patterns
+_DEDUP_STRIP_RES = (
+    # "Book N - " or "N - " prefix
+    re.compile(r"^(book\s+)?\d+\s*-\s*"),
+    # ASIN codes like [B00AAI79WY] or [B0...]
+    re.compile(r"\[B0[A-Z0-9]+\]", re.IGNORECASE),
+    # Bracket content like [01]
+    re.compile(r"\[.*?\]"),
+    # (Unabridged) / (Abridged)
+    re.compile(r"\(\s*(?:un)?abridged\s*\)", re.IGNORECASE),
+    # Remaining parenthesized content
+    re.compile(r"\(.*?\)"),
+    # ", Part N" or "Part N" suffix (multi-part fragments)
+    re.compile(r",?\s*part\s+\d+\s*$", re.IGNORECASE),
+    # Trailing " - Book N" pattern (Audible naming)
+    re.compile(r"\s*-\s*book\s+\d+\s*$", re.IGNORECASE),
+    # Series suffixes: "- Series Name, Volume One" / "- Series, Book N"
+    re.compile(r"\s*-\s*dragonlance[^-]*$", re.IGNORECASE),
+    re.compile(r"\s*-?\s*,?\s*volume\s+\w+\s*$", re.IGNORECASE),
+    # "The Ender Saga - book 1" style suffix
+    re.compile(r"\s*-\s*the\s+\w+\s+saga.*$", re.IGNORECASE),
+    # Trailing underscored sub-book: "_Book I - subtitle"
+    re.compile(r"_book\s+[\w]+\s*-.*$", re.IGNORECASE),
+    # " - Author Name" suffixes (common in downloads); done BEFORE prefix
+    # stripping since suffixes are more common
+    re.compile(r"\s*-\s*j\.?\s*r\.?\s*r\.?\s*tolkien.*$", re.IGNORECASE),
+    re.compile(r"\s*-\s*christopher\s+tolkien.*$", re.IGNORECASE),
+    # Generic " - F. M. Lastname" suffix (initials-style person name)
+    re.compile(r"\s+-\s+[a-z]\.\s*[a-z]\.\s*[a-z]+\s*$"),
+)
+# Leading "Vampire Chronicles NN_" style prefix
+_NUMBERED_UNDERSCORE_PREFIX_RE = re.compile(r"^[\w\s]+\d+_")
+_WORD_HYPHEN_RE = re.compile(r"(?<=[a-z])-(?=[a-z])")
+_DRAGONLANCE_PREFIX_RE = re.compile(r"^dragonlance\s*[-:]?\s*", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# _normalize_author() patterns
+_EDITED_BY_RE = re.compile(r"^edited\s+by\s+")
+_SPACED_INITIALS_RE = re.compile(r"\b([a-z])\s+(?=[a-z]\b)")
+
+# "Part N" suffix marking multi-part files in one directory
+_PART_FILE_RE = re.compile(r"[,\s]*part\s+\d+\s*$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _author_affix_res(author: str) -> tuple[re.Pattern[str], ...]:
+    """Compiled "Author - " prefix and " - Author" suffix patterns for an author.
+
+    Built once per author (raw and normalized spelling) instead of letting
+    per-author patterns churn the re module's internal cache.
+    """
+    raw_pat = re.escape(author.lower()).replace(r"\ ", r"\s*")
+    norm_pat = re.escape(_normalize_author(author)).replace(r"\ ", r"\s*")
+    return (
+        re.compile(rf"^{raw_pat}\s*-\s*"),
+        # Normalized form catches initials like "B. T. Narro"
+        re.compile(rf"^{norm_pat}\s*-\s*"),
+        re.compile(rf"\s*-\s*{raw_pat}.*$"),
+        re.compile(rf"\s*-\s*{norm_pat}.*$"),
+    )
+
+
 def _normalize_for_dedup(stem: str, author: str = "") -> str:
     """Normalize a filename stem for duplicate detection.
 
@@ -334,59 +397,22 @@ def _normalize_for_dedup(stem: str, author: str = "") -> str:
     and optionally the author-name prefix from Audible downloads.
     """
     s = stem.lower()
-    # Strip "Book N - " or "N - " prefix
-    s = re.sub(r"^(book\s+)?\d+\s*-\s*", "", s)
-    # Strip ASIN codes like [B00AAI79WY] or [B0...]
-    s = re.sub(r"\[B0[A-Z0-9]+\]", "", s, flags=re.IGNORECASE)
-    # Strip bracket content like [01]
-    s = re.sub(r"\[.*?\]", "", s)
-    # Strip (Unabridged) / (Abridged)
-    s = re.sub(r"\(\s*(?:un)?abridged\s*\)", "", s, flags=re.IGNORECASE)
-    # Strip remaining parenthesized content
-    s = re.sub(r"\(.*?\)", "", s)
-    # Strip ", Part N" or "Part N" suffix (multi-part fragments)
-    s = re.sub(r",?\s*part\s+\d+\s*$", "", s, flags=re.IGNORECASE)
-    # Strip trailing " - Book N" pattern (Audible naming)
-    s = re.sub(r"\s*-\s*book\s+\d+\s*$", "", s, flags=re.IGNORECASE)
-    # Strip series suffixes: "- Series Name, Volume One" / "- Series, Book N"
-    s = re.sub(r"\s*-\s*dragonlance[^-]*$", "", s, flags=re.IGNORECASE)
-    s = re.sub(r"\s*-?\s*,?\s*volume\s+\w+\s*$", "", s, flags=re.IGNORECASE)
-    # Strip "The Ender Saga - book 1" style suffix
-    s = re.sub(r"\s*-\s*the\s+\w+\s+saga.*$", "", s, flags=re.IGNORECASE)
-    # Strip trailing underscored sub-book: "_Book I - subtitle"
-    s = re.sub(r"_book\s+[\w]+\s*-.*$", "", s, flags=re.IGNORECASE)
-    # Strip " - Author Name" suffix (common in downloads)
-    # Do this BEFORE prefix stripping since suffixes are more common
-    s = re.sub(r"\s*-\s*j\.?\s*r\.?\s*r\.?\s*tolkien.*$", "", s, flags=re.IGNORECASE)
-    s = re.sub(r"\s*-\s*christopher\s+tolkien.*$", "", s, flags=re.IGNORECASE)
-    # Generic "- Author Name" suffix: match " - FirstName LastName" at end
-    # Only if it looks like a person name (2-4 capitalized words)
-    s = re.sub(r"\s+-\s+[a-z]\.\s*[a-z]\.\s*[a-z]+\s*$", "", s)
-    # Strip author-name prefix ("Author Name - Title" -> "Title")
+    for pattern in _DEDUP_STRIP_RES:
+        s = pattern.sub("", s)
+    # Strip author-name prefix ("Author Name - Title" -> "Title") and suffix
     if author:
-        norm_auth = _normalize_author(author)
-        # Try stripping "Author - " or "Author Name - " from start
-        prefix_pat = re.escape(author.lower()).replace(r"\ ", r"\s*")
-        s = re.sub(rf"^{prefix_pat}\s*-\s*", "", s)
-        # Also try normalized form for initials like "B. T. Narro"
-        prefix_pat2 = re.escape(norm_auth).replace(r"\ ", r"\s*")
-        s = re.sub(rf"^{prefix_pat2}\s*-\s*", "", s)
-        # Also try stripping " - Author" suffix using author name
-        suffix_pat = re.escape(author.lower()).replace(r"\ ", r"\s*")
-        s = re.sub(rf"\s*-\s*{suffix_pat}.*$", "", s)
-        suffix_pat2 = re.escape(norm_auth).replace(r"\ ", r"\s*")
-        s = re.sub(rf"\s*-\s*{suffix_pat2}.*$", "", s)
-    # Strip leading "Vampire Chronicles NN_" style prefix
-    s = re.sub(r"^[\w\s]+\d+_", "", s)
+        for pattern in _author_affix_res(author):
+            s = pattern.sub("", s)
+    s = _NUMBERED_UNDERSCORE_PREFIX_RE.sub("", s)
     # Replace underscores and hyphens with spaces
     s = s.replace("_", " ")
-    s = re.sub(r"(?<=[a-z])-(?=[a-z])", " ", s)  # word-word hyphens only
+    s = _WORD_HYPHEN_RE.sub(" ", s)  # word-word hyphens only
     # Strip commas (interferes with token matching)
     s = s.replace(",", "")
     # Strip leading "Dragonlance" / "DragonLance" prefix
-    s = re.sub(r"^dragonlance\s*[-:]?\s*", "", s, flags=re.IGNORECASE)
+    s = _DRAGONLANCE_PREFIX_RE.sub("", s)
     # Collapse whitespace
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _WHITESPACE_RE.sub(" ", s).strip()
     return s
 
 
@@ -409,15 +435,15 @@ def _normalize_author(author: str) -> str:
     """
     s = author.strip().lower()
     # Strip "Edited by" / "edited by" prefix
-    s = re.sub(r"^edited\s+by\s+", "", s)
+    s = _EDITED_BY_RE.sub("", s)
     # Normalize & <-> and
     s = s.replace(" & ", " and ")
     # Strip periods (R.A. -> RA, J.R.R. -> JRR)
     s = s.replace(".", "")
     # Collapse single-letter sequences (r a -> ra, j r r -> jrr)
-    s = re.sub(r"\b([a-z])\s+(?=[a-z]\b)", r"\1", s)
+    s = _SPACED_INITIALS_RE.sub(r"\1", s)
     # Collapse whitespace
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _WHITESPACE_RE.sub(" ", s).strip()
     return s
 
 
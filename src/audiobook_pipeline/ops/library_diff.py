@@ -14,13 +14,16 @@ Key normalizations:
 
 from __future__ import annotations
 
+import os
 import re
+import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from loguru import logger
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from .audit import (
     FRANCHISE_FOLDERS,
@@ -47,6 +50,9 @@ NON_AUTHOR_FOLDERS = {
     "new",
 }
 
+# Threads for walking top-level library folders in _find_m4b_parts()
+_SCAN_WORKERS = 16
+
 # Pattern: chapter-per-file naming like "01- Title", "Ch01 - Title"
 _CHAPTER_FILE_RE = re.compile(r"^(?:ch)?\d{1,3}[a-d]?\s*[-\.]\s*", re.IGNORECASE)
 
@@ -58,6 +64,9 @@ _NUMBERED_PREFIX_RE = re.compile(
     r"^(?:\d+-\d+\s+|HP[\.\s]*\d+\s*[-\.]\s*)", re.IGNORECASE
 )
 
+# Pattern: "Book N - " / "Book N.N - " prefix on series folder names
+_BOOK_PREFIX_RE = re.compile(r"^book\s+[\d.]+\s*-?\s*", re.IGNORECASE)
+
 
 @dataclass
 class BookEntry:
@@ -107,10 +116,58 @@ def _book_title_from_dir(dir_name: str) -> str:
 
     Strips "Book N - " prefixes commonly used in series folders.
     """
-    s = dir_name
-    # Strip "Book N - " or "Book N.N - " prefix
-    s = re.sub(r"^book\s+[\d.]+\s*-?\s*", "", s, flags=re.IGNORECASE)
-    return s.strip()
+    return _BOOK_PREFIX_RE.sub("", dir_name).strip()
+
+
+def _scan_m4b(top: str) -> list[str]:
+    """Collect *.m4b paths under a directory with an iterative scandir walk.
+
+    Like Path.rglob, does not descend into symlinked directories.
+    """
+    found: list[str] = []
+    stack = [top]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.name.endswith(".m4b"):
+                    found.append(entry.path)
+                try:
+                    if entry.is_dir() and not entry.is_symlink():
+                        stack.append(entry.path)
+                except OSError:
+                    continue
+    return found
+
+
+def _find_m4b_parts(library_root: Path) -> list[tuple[str, ...]]:
+    """Relative path parts of every *.m4b under library_root, in Path sort order.
+
+    Top-level folders are walked in parallel: the scan is syscall-bound
+    (and slow on NFS), and scandir releases the GIL.
+    """
+    root = str(library_root)
+    found: list[str] = []
+    top_dirs: list[str] = []
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.name.endswith(".m4b"):
+                found.append(entry.path)
+            if entry.is_dir() and not entry.is_symlink():
+                top_dirs.append(entry.path)
+
+    if top_dirs:
+        workers = min(_SCAN_WORKERS, len(top_dirs))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for paths in pool.map(_scan_m4b, top_dirs):
+                found.extend(paths)
+
+    prefix_len = len(os.path.join(root, ""))
+    # Sort by parts (not raw strings) to match sorted(Path.rglob(...))
+    return sorted(tuple(p[prefix_len:].split(os.sep)) for p in found)
 
 
 def _extract_books(library_root: Path) -> list[BookEntry]:
@@ -123,16 +180,17 @@ def _extract_books(library_root: Path) -> list[BookEntry]:
     if not library_root.is_dir():
         return entries
 
-    for m4b in sorted(library_root.rglob("*.m4b")):
-        rel = m4b.relative_to(library_root)
-        parts = rel.parts
+    for parts in _find_m4b_parts(library_root):
         if len(parts) < 2:
             continue
+        m4b = library_root.joinpath(*parts)
+        rel = Path(*parts)
 
         author = _guess_author_from_path(rel)
         stem = m4b.stem
-        norm_author = _normalize_author(author)
-        norm_title = _normalize_for_dedup(stem.lower(), author=author)
+        # Interned: these are the keys of every exact-match set/dict lookup
+        norm_author = sys.intern(_normalize_author(author))
+        norm_title = sys.intern(_normalize_for_dedup(stem.lower(), author=author))
 
         # Detect multi-part: "Part N" suffix
         is_part = bool(_PART_SUFFIX_RE.search(stem))
@@ -194,8 +252,8 @@ def _collapse_multipart(entries: list[BookEntry]) -> list[BookEntry]:
         ):
             dir_name = Path(representative.path).parent.name
             title = _book_title_from_dir(dir_name)
-            norm_title = _normalize_for_dedup(
-                title.lower(), author=representative.author
+            norm_title = sys.intern(
+                _normalize_for_dedup(title.lower(), author=representative.author)
             )
 
         result.append(
@@ -273,17 +331,31 @@ def _find_match(
 
     # 3. Fuzzy match, same author first
     # Use token_set_ratio to handle titles with extra series/subtitle info
-    if norm_author in target_index:
-        for target_title in target_index[norm_author]:
-            if fuzz.token_set_ratio(norm_title, target_title) >= FUZZY_THRESHOLD:
-                return True
+    if norm_author in target_index and _fuzzy_hit(
+        norm_title, target_index[norm_author]
+    ):
+        return True
 
     # 4. Fuzzy match, any author
-    for target_title in all_target_titles:
-        if fuzz.token_set_ratio(norm_title, target_title) >= FUZZY_THRESHOLD:
-            return True
+    return _fuzzy_hit(norm_title, all_target_titles)
+
+
+def _fuzzy_hit(norm_title: str, candidates: set[str]) -> bool:
+    """True if any candidate scores >= FUZZY_THRESHOLD (token_set_ratio).
 
-    return False
+    extractOne runs the scan in C and skips candidates early once they
+    can't reach the cutoff.
+    """
+    return (
+        process.extractOne(
+            norm_title,
+            candidates,
+            scorer=fuzz.token_set_ratio,
+            processor=None,
+            score_cutoff=FUZZY_THRESHOLD,
+        )
+        is not None
+    )
 
 
 def compare_libraries(source: Path, target: Path) -> LibraryDiff:
@@ -311,11 +383,9 @@ def compare_libraries(source: Path, target: Path) -> LibraryDiff:
         f"({pre_dedup} before dedup, after multi-part collapse)"
     )
 
-    # Build target lookup structures
+    # Build target lookup structures (hashed, so exact phases are O(1))
     target_index = _build_target_index(target_entries)
-    all_target_titles: set[str] = set()
-    for titles in target_index.values():
-        all_target_titles.update(titles)
+    all_target_titles = {entry.norm_title for entry in target_entries}
 
     diff = LibraryDiff(
         source_count=len(source_entries),
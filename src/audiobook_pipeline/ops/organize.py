@@ -6,8 +6,11 @@ Handles copying/moving files to NFS output with proper Author/Series/Title layou
 
 from __future__ import annotations
 
+import errno
+import os
 import re
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -51,6 +54,81 @@ _GENERIC_BASENAMES = frozenset(
 )
 
 
+# Substrings that mark a dir name as a collection or pipeline folder, not an author
+_COLLECTION_WORDS = (
+    "trilogy",
+    "series",
+    "saga",
+    "collection",
+    "volumes",
+    "books",
+    "chronicle",
+    "standalones",
+    "chaptered",
+    "audiobook",
+    "stuff",
+    "random",
+    "newbooks",
+    "output",
+    "input",
+    "incoming",
+    "processing",
+    "completed",
+    "failed",
+    "queue",
+    "pipeline",
+)
+
+_ARTICLE_PREFIXES = ("the ", "a ", "an ")
+
+# Ancestors that carry no naming information
+_ROOT = Path("/")
+_TOP_DIRS = (_ROOT, Path("."))
+
+# Dir/file name cleanup
+_HASH_SUFFIX_RE = re.compile(r"\s+-\s+[a-f0-9]{16}$")
+_LABEL_SUFFIX_RE = re.compile(
+    r"\s+-\s+(?:Audiobook|Audio|Unabridged|Abridged)$", re.IGNORECASE
+)
+_LAZY_PAREN_RE = re.compile(r"\s*\(.*?\)")
+_LAZY_BRACKET_RE = re.compile(r"\s*\[.*?\]")
+_DIGIT_RE = re.compile(r"\d")
+_YEAR_RE = re.compile(r"\d{4}")
+_YEAR_PREFIX_RE = re.compile(r"^\d{4}\s*-\s*")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Pattern A: "Author-Series-#N-Title" position markers
+_MARKER_DASH_RE = re.compile(r"-#-(\d+)")
+_MARKER_SPACE_RE = re.compile(r"-#(\d+) ")
+_MARKER_RE = re.compile(r"-#(\d+)-")
+_MARKER_PREFIX_RE = re.compile(r"-#\d+")
+_SERIES_PREFIX_RE = re.compile(r"-(.+?)-#\d+")
+
+# Patterns B2, B and G
+_PATTERN_B2_RE = re.compile(r"^(.+?)\s+(\d{1,3})\s+-\s+(.+)$")
+_PATTERN_B_RE = re.compile(r"^(.+?)\s+(\d{1,3})\s+(.+)$")
+_PATTERN_G_RE = re.compile(r"^(.+?)\s+\[(\d+)\]\s+(.+)$")
+
+# Title cleanup
+_INDEX_BRACKET_RE = re.compile(r"\[\d+\]")
+_BRACKETED_RE = re.compile(r"^\[(.+)\]$")
+_LEADING_NUMBER_RE = re.compile(r"^\d+\s*[-\u2013]?\s*")
+_BRACE_TAG_RE = re.compile(r"\s*\{[^}]+\}")
+_BITRATE_PAREN_RE = re.compile(r"\s*\([^)]*\b\d+k\b[^)]*\)")
+_BITRATE_TAG_RE = re.compile(r"\s*\([A-Z][a-z]+\)\s+\d+k\s+[\d.]+")
+_AUDIOBOOK_PAREN_RE = re.compile(r"\s*\((?:The\s+)?Audio\s*Book\)", re.IGNORECASE)
+_UNABRIDGED_PAREN_RE = re.compile(r"\s*\(Unabridged\)", re.IGNORECASE)
+_DASH_ARTIFACT_RE = re.compile(r"(\w)-\s")
+_TRAILING_DASH_RE = re.compile(r"-$")
+_PAREN_SERIES_RE = re.compile(
+    r"\s*-?\s*\(([^)]+?)(?:\s*[-,]\s*(?:Book|Day|#)\s*([\d.]+))?\)"
+)
+
+# _normalize_for_compare
+_YEAR_PAREN_RE = re.compile(r"\s*\(\d{4}\)")
+_PAREN_OR_PUNCT_RE = re.compile(r"\s*\([^)]*\)|[^\w\s]")
+
+
 # ---------------------------------------------------------------------------
 # Path parsing
 # ---------------------------------------------------------------------------
@@ -69,39 +147,28 @@ def parse_path(source_path: str, source_dir: Path | None = None) -> dict:
     p = Path(source_path)
 
     # Get basename without extension, strip pipeline hash suffix
-    basename = p.stem if p.is_file() or p.suffix else p.name
+    basename = p.stem
     basename = _strip_hash(basename)
 
-    # Pattern F: recover from generic basenames (file.m4b, MP3.m4b)
-    if basename.lower() in _GENERIC_BASENAMES:
-        parent_raw = _strip_hash(p.parent.name) if p.parent != Path("/") else ""
-        if parent_raw and parent_raw.lower() not in _GENERIC_BASENAMES:
-            basename = _strip_label_suffix(parent_raw)
-            log.debug(f"Pattern F: fallback to parent basename={basename}")
-        else:
-            gp_raw = (
-                _strip_hash(p.parent.parent.name)
-                if p.parent.parent not in (Path("/"), Path("."))
-                else ""
-            )
-            if gp_raw:
-                basename = _strip_label_suffix(gp_raw)
-                log.debug(f"Pattern F: fallback to grandparent basename={basename}")
-
-    # Parent and grandparent
+    # Parent, grandparent and great-grandparent (for deeper nesting),
+    # hash-stripped once and shared by every pattern below
     parent = p.parent
-    parent_name = _strip_hash(parent.name) if parent != Path("/") else ""
+    parent_name = _strip_hash(parent.name) if parent != _ROOT else ""
 
     grandparent = parent.parent
-    gp_name = (
-        _strip_hash(grandparent.name)
-        if grandparent not in (Path("/"), Path("."))
-        else ""
-    )
+    gp_name = _strip_hash(grandparent.name) if grandparent not in _TOP_DIRS else ""
 
-    # Great-grandparent for deeper nesting
     ggp = grandparent.parent
-    ggp_name = _strip_hash(ggp.name) if ggp not in (Path("/"), Path(".")) else ""
+    ggp_name = _strip_hash(ggp.name) if ggp not in _TOP_DIRS else ""
+
+    # Pattern F: recover from generic basenames (file.m4b, MP3.m4b)
+    if basename.lower() in _GENERIC_BASENAMES:
+        if parent_name and parent_name.lower() not in _GENERIC_BASENAMES:
+            basename = _strip_label_suffix(parent_name)
+            log.debug(f"Pattern F: fallback to parent basename={basename}")
+        elif gp_name:
+            basename = _strip_label_suffix(gp_name)
+            log.debug(f"Pattern F: fallback to grandparent basename={basename}")
 
     author = ""
     title = ""
@@ -113,22 +180,22 @@ def parse_path(source_path: str, source_dir: Path | None = None) -> dict:
 
     # Pattern A: "Author-Series-#N-Title" or nested subseries
     # Normalize malformed markers: "#-N" -> "#N", "#N " -> "#N-"
-    parse_target = re.sub(r"-#-(\d+)", r"-#\1", parse_target)
-    parse_target = re.sub(r"-#(\d+) ", r"-#\1-", parse_target)
-    if re.search(r"-#\d+-", parse_target):
+    parse_target = _MARKER_DASH_RE.sub(r"-#\1", parse_target)
+    parse_target = _MARKER_SPACE_RE.sub(r"-#\1-", parse_target)
+    if _MARKER_RE.search(parse_target):
         normalized = parse_target
 
-        last_match = list(re.finditer(r"-#(\d+)-", normalized))[-1]
+        last_match = list(_MARKER_RE.finditer(normalized))[-1]
         position = last_match.group(1)
         title = normalized[last_match.end() :].strip()
 
         prefix = normalized[: last_match.start()]
-        first_match = re.search(r"-(.+?)-#\d+", prefix)
+        first_match = _SERIES_PREFIX_RE.search(prefix)
         if first_match:
             author_end = prefix.index("-")
             author = prefix[:author_end].strip()
             series = prefix[author_end + 1 :].strip()
-            series = re.split(r"-#\d+-", series)[0].strip()
+            series = _MARKER_RE.split(series)[0].strip()
         else:
             parts = prefix.rsplit("-", 1)
             if len(parts) == 2:
@@ -144,7 +211,7 @@ def parse_path(source_path: str, source_dir: Path | None = None) -> dict:
         return _build_result(author, title, series, position)
 
     # Pattern B2: "Name N - Title" (e.g., "Deathgate Cycle 1 - Dragon Wing")
-    match_b2 = re.match(r"^(.+?)\s+(\d{1,3})\s+-\s+(.+)$", parse_target)
+    match_b2 = _PATTERN_B2_RE.match(parse_target)
     if match_b2:
         series = match_b2.group(1).strip()
         position = match_b2.group(2).strip()
@@ -155,7 +222,7 @@ def parse_path(source_path: str, source_dir: Path | None = None) -> dict:
 
     # Pattern B: "SeriesName NN Title" (e.g., "The First Law 04 Best Served Cold")
     if not title:
-        match_b = re.match(r"^(.+?)\s+(\d{1,3})\s+(.+)$", parse_target)
+        match_b = _PATTERN_B_RE.match(parse_target)
         if match_b:
             potential_series = match_b.group(1).strip()
             potential_pos = match_b.group(2).strip()
@@ -170,7 +237,7 @@ def parse_path(source_path: str, source_dir: Path | None = None) -> dict:
 
     # Pattern G: "Series [NN] Title" (e.g., "Mistborn [01] The Final Empire")
     if not title:
-        match_g = re.match(r"^(.+?)\s+\[(\d+)\]\s+(.+)$", parse_target)
+        match_g = _PATTERN_G_RE.match(parse_target)
         if match_g:
             series = match_g.group(1).strip()
             position = match_g.group(2).strip()
@@ -186,7 +253,7 @@ def parse_path(source_path: str, source_dir: Path | None = None) -> dict:
         gp_series = parts[1].strip()
         # Skip if right side is a label word
         if gp_series.lower() not in _LABEL_SUFFIXES:
-            if not re.search(r"\d", gp_author):
+            if not _DIGIT_RE.search(gp_author):
                 if not author:
                     author = gp_author
                 if not series:
@@ -216,7 +283,7 @@ def parse_path(source_path: str, source_dir: Path | None = None) -> dict:
 
     # Author-Title split from parent: "Author-Title" or "Author - Title"
     if not author and not series and "-" in parent_name and not title:
-        if not re.search(r"-#\d+", parent_name):
+        if not _MARKER_PREFIX_RE.search(parent_name):
             parts = parent_name.split("-", 1)
             candidate_author = parts[0].strip()
             candidate_title = parts[1].strip()
@@ -237,34 +304,31 @@ def parse_path(source_path: str, source_dir: Path | None = None) -> dict:
             title = title[len(author) :].lstrip(" -").strip()
         if series and title.lower().startswith(series.lower()):
             title = title[len(series) :].lstrip(" -").strip()
-        title = re.sub(r"\[\d+\]", "", title)
-        bracket_match = re.match(r"^\[(.+)\]$", title.strip())
+        title = _INDEX_BRACKET_RE.sub("", title)
+        bracket_match = _BRACKETED_RE.match(title.strip())
         if bracket_match:
             title = bracket_match.group(1)
-        title = re.sub(r"^\d+\s*[-\u2013]?\s*", "", title)
-        title = re.sub(r"\s+", " ", title).strip()
+        title = _LEADING_NUMBER_RE.sub("", title)
+        title = _WHITESPACE_RE.sub(" ", title).strip()
 
     # Clean metadata junk from title
-    title = re.sub(r"\s*\{[^}]+\}", "", title)
-    title = re.sub(r"\s*\([^)]*\b\d+k\b[^)]*\)", "", title)
-    title = re.sub(r"\s*\([A-Z][a-z]+\)\s+\d+k\s+[\d.]+", "", title)
+    title = _BRACE_TAG_RE.sub("", title)
+    title = _BITRATE_PAREN_RE.sub("", title)
+    title = _BITRATE_TAG_RE.sub("", title)
     # Strip "(The AudioBook)", "(Audiobook)", "(Unabridged)", etc.
-    title = re.sub(r"\s*\((?:The\s+)?Audio\s*Book\)", "", title, flags=re.IGNORECASE)
-    title = re.sub(r"\s*\(Unabridged\)", "", title, flags=re.IGNORECASE)
+    title = _AUDIOBOOK_PAREN_RE.sub("", title)
+    title = _UNABRIDGED_PAREN_RE.sub("", title)
     # Strip dash artifacts: "Food- A Love Story" -> "Food A Love Story"
-    title = re.sub(r"(\w)-\s", r"\1 ", title)
-    title = re.sub(r"-$", "", title).strip()
+    title = _DASH_ARTIFACT_RE.sub(r"\1 ", title)
+    title = _TRAILING_DASH_RE.sub("", title).strip()
 
     # Extract parenthesized series info from title:
     # "Title - (Series Name - Day 1)" or "Title (Series, Book 2.5)"
     if not series:
-        paren_match = re.search(
-            r"\s*-?\s*\(([^)]+?)" r"(?:\s*[-,]\s*(?:Book|Day|#)\s*([\d.]+))?" r"\)",
-            title,
-        )
+        paren_match = _PAREN_SERIES_RE.search(title)
         if paren_match:
             candidate_series = paren_match.group(1).strip().rstrip(" -,")
-            is_year = bool(re.fullmatch(r"\d{4}", candidate_series))
+            is_year = bool(_YEAR_RE.fullmatch(candidate_series))
             if is_year:
                 # Year = edition differentiator, not a series
                 # "Good Omens (2019)" -> title="Good Omens", position="2019"
@@ -345,14 +409,14 @@ def build_plex_path(
     # Year-as-position: treat as edition subfolder under title
     # "Good Omens (2019)" -> Author/Good Omens/2019/
     is_year_edition = bool(
-        position and re.fullmatch(r"\d{4}", position) and not series_name
+        position and _YEAR_RE.fullmatch(position) and not series_name
     )
 
     reuse = index.reuse_existing if index else _reuse_existing
 
     # Prefix title folder with "Book N -" when in a series with a position
     has_book_prefix = bool(
-        series_name and position and not re.fullmatch(r"\d{4}", position)
+        series_name and position and not _YEAR_RE.fullmatch(position)
     )
     if has_book_prefix:
         title_folder = f"Book {position} - {title}"
@@ -436,9 +500,13 @@ def copy_to_library(
     if dry_run:
         return dest_file
 
-    if dest_file.exists():
-        # Skip if same size (already copied)
-        if dest_file.stat().st_size == source_file.stat().st_size:
+    # Skip if same size (already copied); one stat doubles as the exists check
+    try:
+        dest_size = dest_file.stat().st_size
+    except FileNotFoundError:
+        pass
+    else:
+        if dest_size == source_file.stat().st_size:
             log.debug(f"Skip copy (same size): {filename}")
             return dest_file
 
@@ -468,12 +536,23 @@ def move_in_library(
     if dry_run:
         return dest_file
 
-    if dest_file.exists() and dest_file.stat().st_size == source_file.stat().st_size:
-        log.debug(f"Skip move (same size): {filename}")
-        return dest_file
+    try:
+        dest_size = dest_file.stat().st_size
+    except FileNotFoundError:
+        pass
+    else:
+        if dest_size == source_file.stat().st_size:
+            log.debug(f"Skip move (same size): {filename}")
+            return dest_file
 
     log.info(f"Move {source_file} -> {dest_file}")
-    shutil.move(str(source_file), str(dest_file))
+    # Plain rename within the library; shutil.move copies across filesystems
+    try:
+        os.replace(source_file, dest_file)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(source_file), str(dest_file))
 
     # Clean up empty parent dirs left behind by the move (bounded to library root)
     _cleanup_empty_parents(source_file.parent, stop_at=library_root)
@@ -485,18 +564,17 @@ def _cleanup_empty_parents(directory: Path, stop_at: Path | None) -> None:
     """Remove empty parent directories after a file move.
 
     Walks up from directory, removing each empty dir until
-    reaching stop_at or a non-empty directory.
+    reaching stop_at or a non-empty directory. rmdir() itself refuses
+    non-empty dirs, so each level costs one syscall. Unlike os.removedirs
+    this never climbs past stop_at.
     """
     current = directory
     while current != stop_at and current != current.parent:
         try:
-            if current.is_dir() and not any(current.iterdir()):
-                log.debug(f"Removed empty dir: {current}")
-                current.rmdir()
-            else:
-                break
+            current.rmdir()
         except OSError:
             break
+        log.debug(f"Removed empty dir: {current}")
         current = current.parent
 
 
@@ -505,6 +583,7 @@ def _cleanup_empty_parents(directory: Path, stop_at: Path | None) -> None:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=4096)
 def _normalize_for_compare(name: str) -> str:
     """Normalize a folder name for duplicate comparison.
 
@@ -512,13 +591,12 @@ def _normalize_for_compare(name: str) -> str:
     so "Food- A Love Story" matches "Food A Love Story (2014)".
     """
     s = name.lower()
-    # Strip year suffixes: "(2014)", "(2009)"
-    s = re.sub(r"\s*\(\d{4}\)", "", s)
-    # Strip edition markers: "(Unabridged)", "(The AudioBook)"
-    s = re.sub(r"\s*\([^)]*\)", "", s)
-    # Collapse punctuation and whitespace
-    s = re.sub(r"[^\w\s]", "", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    # Strip year suffixes first so "(Series (2014) Edition)" nests correctly
+    if "(" in s:
+        s = _YEAR_PAREN_RE.sub("", s)
+    # Strip edition markers ("(Unabridged)") and punctuation in one pass,
+    # then collapse whitespace
+    s = " ".join(_PAREN_OR_PUNCT_RE.sub("", s).split())
     # Strip single trailing 's' for singular/plural matching
     # "Chronicles" -> "Chronicle", but not "Mass" -> "Ma"
     # This is imperfect (affects "James" -> "Jame") but better than
@@ -579,48 +657,51 @@ def _reuse_existing(parent: Path, desired: str) -> str:
     Returns the existing folder name if found, otherwise returns desired unchanged.
     Uses token-based similarity to catch redundant author prefixes in folder names.
     """
-    if not parent.is_dir():
-        return desired
     # Exact match -- fast path
     if (parent / desired).exists():
         return desired
     # Normalize and compare against existing siblings
     desired_norm = _normalize_for_compare(desired)
-    for existing in parent.iterdir():
-        if not existing.is_dir():
-            continue
-        existing_norm = _normalize_for_compare(existing.name)
-        if _is_near_match(desired_norm, existing_norm):
-            log.debug(f"Near-match found: '{desired}' -> '{existing.name}'")
-            return existing.name
+    try:
+        with os.scandir(parent) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                existing_norm = _normalize_for_compare(entry.name)
+                if _is_near_match(desired_norm, existing_norm):
+                    log.debug(f"Near-match found: '{desired}' -> '{entry.name}'")
+                    return entry.name
+    except (FileNotFoundError, NotADirectoryError):
+        pass
     return desired
 
 
 def _strip_hash(name: str) -> str:
     """Strip pipeline hash suffix (e.g., ' - a7edd490030561fb')."""
-    return re.sub(r"\s+-\s+[a-f0-9]{16}$", "", name)
+    return _HASH_SUFFIX_RE.sub("", name)
 
 
 def _strip_label_suffix(name: str) -> str:
     """Strip label suffixes like ' - Audiobook' from dir names."""
-    return re.sub(
-        r"\s+-\s+(?:Audiobook|Audio|Unabridged|Abridged)$",
-        "",
-        name,
-        flags=re.IGNORECASE,
-    )
+    # Most names have no dash at all; skip the regex scan for them
+    if "-" not in name:
+        return name
+    return _LABEL_SUFFIX_RE.sub("", name)
 
 
 def _extract_author(name: str) -> str:
     """Extract author from a directory name, splitting off series info."""
+    cleaned = name.strip()
     # Strip parenthetical suffixes: "Tad Williams (All Chaptered)" -> "Tad Williams"
-    cleaned = re.sub(r"\s*\(.*?\)", "", name).strip()
+    if "(" in cleaned:
+        cleaned = _LAZY_PAREN_RE.sub("", cleaned).strip()
     # Strip bracketed suffixes: "Name [1-5]" -> "Name"
-    cleaned = re.sub(r"\s*\[.*?\]", "", cleaned).strip()
+    if "[" in cleaned:
+        cleaned = _LAZY_BRACKET_RE.sub("", cleaned).strip()
     if " - " in cleaned:
         parts = cleaned.split(" - ", 1)
         candidate = parts[0].strip()
-        if not re.search(r"\d", candidate):
+        if not _DIGIT_RE.search(candidate):
             result = candidate
             log.debug(f"_extract_author: name={name} -> result={result}")
             return result
@@ -631,44 +712,18 @@ def _extract_author(name: str) -> str:
 
 def _looks_like_author(name: str) -> bool:
     """Heuristic: does this directory name look like an author?"""
-    lower = name.lower()
-    collection_words = [
-        "trilogy",
-        "series",
-        "saga",
-        "collection",
-        "volumes",
-        "books",
-        "chronicle",
-        "chronicles",
-        "standalones",
-        "chaptered",
-        "audiobook",
-        "all chaptered",
-        "stuff",
-        "random",
-        "newbooks",
-        "output",
-        "input",
-        "incoming",
-        "processing",
-        "completed",
-        "failed",
-        "queue",
-        "pipeline",
-    ]
-    for word in collection_words:
-        if word in lower:
-            log.debug(
-                f"_looks_like_author: name={name} -> False (collection word: {word})"
-            )
-            return False
-    if re.search(r"\d", name):
-        log.debug(f"_looks_like_author: name={name} -> False (contains digit)")
-        return False
+    # Cheapest rejections first; the collection-word substring scan is last
     if len(name) > 50:
         log.debug(f"_looks_like_author: name={name} -> False (too long)")
         return False
+    if _DIGIT_RE.search(name):
+        log.debug(f"_looks_like_author: name={name} -> False (contains digit)")
+        return False
+    lower = name.lower()
+    # Reject names starting with articles (titles, not people)
+    if lower.startswith(_ARTICLE_PREFIXES):
+        log.debug(f"_looks_like_author: name={name} -> False (starts with article)")
+        return False
     # Reject titles masquerading as authors -- too many words
     words = name.split()
     if len(words) > 5:
@@ -676,22 +731,24 @@ def _looks_like_author(name: str) -> bool:
             f"_looks_like_author: name={name} -> False (too many words: {len(words)})"
         )
         return False
-    # Reject names starting with articles (titles, not people)
-    if lower.startswith(("the ", "a ", "an ")):
-        log.debug(f"_looks_like_author: name={name} -> False (starts with article)")
-        return False
     # Single word is suspicious -- could be series name not author
     if len(words) == 1:
         log.debug(f"_looks_like_author: name={name} -> False (single word)")
         return False
+    for word in _COLLECTION_WORDS:
+        if word in lower:
+            log.debug(
+                f"_looks_like_author: name={name} -> False (collection word: {word})"
+            )
+            return False
     log.debug(f"_looks_like_author: name={name} -> True")
     return True
 
 
 def _clean_collection_suffix(name: str) -> str:
     """Clean collection suffixes like [1-5], (All Chaptered)."""
-    cleaned = re.sub(r"\s*\[.*?\]", "", name)
-    cleaned = re.sub(r"\s*\(.*?\)", "", cleaned)
+    cleaned = _LAZY_BRACKET_RE.sub("", name)
+    cleaned = _LAZY_PAREN_RE.sub("", cleaned)
     return cleaned.strip()
 
 
@@ -699,9 +756,9 @@ def _clean_title_fallback(basename: str) -> str:
     """Last-resort title cleaning."""
     log.debug(f"_clean_title_fallback: basename={basename}")
     title = basename
-    title = re.sub(r"\[\d+\]", "", title)
-    title = re.sub(r"^\d+\s*[-\u2013]?\s*", "", title)
-    title = re.sub(r"\s+", " ", title).strip()
+    title = _INDEX_BRACKET_RE.sub("", title)
+    title = _LEADING_NUMBER_RE.sub("", title)
+    title = _WHITESPACE_RE.sub(" ", title).strip()
     return title if title else basename
 
 
@@ -724,7 +781,7 @@ def _title_from_audio_file(directory: Path) -> str:
         # Strip pipeline hash suffix
         stem = _strip_hash(stem)
         # Strip year prefix: "1991 - Barrayar" -> "Barrayar"
-        cleaned = re.sub(r"^\d{4}\s*-\s*", "", stem)
+        cleaned = _YEAR_PREFIX_RE.sub("", stem)
         cleaned = cleaned.strip()
 
         # Validate: reject generic basenames and purely numeric stems
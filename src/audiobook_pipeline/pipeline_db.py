@@ -7,16 +7,20 @@ manifest approach.
 
 PipelineDB is a drop-in replacement for Manifest with the same method signatures
 (create, read, read_field, update, set_stage, check_status, get_next_stage,
-increment_retry, set_error) plus new APIs for cover art, author aliases, and
-pipeline locking.
+increment_retry, set_error) plus new APIs for bulk creation (create_many), cover
+art, author aliases, the LibraryIndex directory snapshot, and pipeline locking.
 """
 
 from __future__ import annotations
 
+import json
 import os
 import sqlite3
+import sys
 import threading
+from collections.abc import Iterable
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -34,6 +38,8 @@ from .models import (
 
 log = logger.bind(stage="db")
 
+_intern = sys.intern
+
 _SCHEMA = """\
 PRAGMA journal_mode=WAL;
 PRAGMA busy_timeout=5000;
@@ -93,13 +99,28 @@ CREATE TABLE IF NOT EXISTS author_aliases (
     canonical TEXT NOT NULL
 );
 
+-- LibraryIndex snapshot: one row per scanned library directory. A row is
+-- reused on the next run while the directory's mtime is unchanged.
+CREATE TABLE IF NOT EXISTS library_dirs (
+    root       TEXT NOT NULL,
+    path       TEXT NOT NULL,
+    mtime_ns   INTEGER NOT NULL,
+    scanned_ns INTEGER NOT NULL,
+    dirs       TEXT NOT NULL,
+    files      TEXT NOT NULL,
+    PRIMARY KEY (root, path)
+);
+
 CREATE TABLE IF NOT EXISTS pipeline_locks (
     lock_name   TEXT PRIMARY KEY,
     acquired_at TEXT NOT NULL,
     pid         INTEGER NOT NULL
 );
 
-CREATE INDEX IF NOT EXISTS idx_books_status ON books(status);
+-- list_books filters by status and/or mode; the composite index also serves
+-- status-only queries, so it supersedes the old single-column index
+CREATE INDEX IF NOT EXISTS idx_books_status_mode ON books(status, mode);
+DROP INDEX IF EXISTS idx_books_status;
 CREATE INDEX IF NOT EXISTS idx_author_canonical ON author_aliases(canonical);
 """
 
@@ -141,14 +162,59 @@ _BOOKS_COLUMNS = {
     "cover_art_size",
 }
 
+# Top-level keys of the legacy dict that map 1:1 to books columns
+_TOP_LEVEL_COLUMNS = {
+    "book_hash",
+    "source_path",
+    "created_at",
+    "mode",
+    "status",
+    "retry_count",
+    "max_retries",
+}
+
 # Stage columns that can be updated via set_stage / update
 _STAGE_COLUMNS = {"status", "completed_at", "output_file", "dest_dir"}
 
+# Prepared-statement cache per connection (sqlite3 default: 128). read_field
+# and update() build one SQL string per column / column set, so the working
+# set is the fixed queries plus up to ~40 generated ones; leave headroom so
+# hot statements are never evicted and re-parsed.
+_STATEMENT_CACHE_SIZE = 256
+
 
 def _utcnow() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+@lru_cache(maxsize=None)
+def _stage_template(mode: PipelineMode) -> tuple[tuple[str, bool, bool], ...]:
+    """Per-mode (stage, pre_completed, records_source) for every Stage."""
+    pre = PRE_COMPLETED_STAGES.get(mode, frozenset())
+    return tuple(
+        # For convert stage in non-convert modes, record source as output
+        (stage.value, stage in pre, stage in pre and stage == Stage.CONVERT)
+        for stage in Stage
+    )
+
+
+def _stage_rows(
+    book_hash: str,
+    source_path: str,
+    mode: PipelineMode,
+    now: str,
+) -> list[tuple[str, str, str, str | None, str | None]]:
+    """Initial stage rows: pending, except the mode's pre-completed stages."""
+    return [
+        (
+            (book_hash, stage, "completed", now, source_path if records else None)
+            if done
+            else (book_hash, stage, "pending", None, None)
+        )
+        for stage, done, records in _stage_template(mode)
+    ]
+
+
 class PipelineDB:
     """SQLite-backed pipeline state manager.
 
@@ -170,10 +236,14 @@ class PipelineDB:
             conn = sqlite3.connect(
                 str(self.db_path),
                 timeout=10.0,
+                cached_statements=_STATEMENT_CACHE_SIZE,
             )
             conn.row_factory = sqlite3.Row
             conn.execute("PRAGMA journal_mode=WAL")
+            # WAL + NORMAL: fsync only at checkpoints, still crash-consistent
+            conn.execute("PRAGMA synchronous=NORMAL")
             conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA temp_store=MEMORY")
             conn.execute("PRAGMA foreign_keys=ON")
             self._local.conn = conn
         return conn
@@ -200,39 +270,46 @@ class PipelineDB:
         mode: PipelineMode,
     ) -> dict:
         """Create a new book record with stage rows. Returns legacy dict shape."""
+        self.create_many([(book_hash, source_path, mode)])
+        log.info(f"Created book record {book_hash} mode={mode}")
+        return self.read(book_hash)  # type: ignore[return-value]
+
+    def create_many(
+        self,
+        books: Iterable[tuple[str, str, PipelineMode]],
+    ) -> int:
+        """Create (or replace) several book records in one transaction.
+
+        Takes (book_hash, source_path, mode) tuples; same rows as create(),
+        written with two executemany calls and a single commit. Returns the
+        number of books written.
+        """
         now = _utcnow()
-        conn = self._get_conn()
+        book_rows = []
+        stage_rows = []
+        for book_hash, source_path, mode in books:
+            book_rows.append((book_hash, source_path, str(mode), now, now))
+            stage_rows.extend(_stage_rows(book_hash, source_path, mode, now))
+        if not book_rows:
+            return 0
 
-        conn.execute(
+        conn = self._get_conn()
+        conn.executemany(
             """INSERT OR REPLACE INTO books
                (book_hash, source_path, mode, status, retry_count, max_retries,
                 created_at, updated_at)
                VALUES (?, ?, ?, 'pending', 0, 3, ?, ?)""",
-            (book_hash, source_path, str(mode), now, now),
+            book_rows,
+        )
+        conn.executemany(
+            """INSERT OR REPLACE INTO stages
+               (book_hash, stage, status, completed_at, output_file)
+               VALUES (?, ?, ?, ?, ?)""",
+            stage_rows,
         )
-
-        # Create stage rows for all stages
-        pre = PRE_COMPLETED_STAGES.get(mode, [])
-        for stage in Stage:
-            if stage in pre:
-                status = "completed"
-                completed_at = now
-                # For convert stage in non-convert modes, record source as output
-                output_file = source_path if stage == Stage.CONVERT else None
-            else:
-                status = "pending"
-                completed_at = None
-                output_file = None
-            conn.execute(
-                """INSERT OR REPLACE INTO stages
-                   (book_hash, stage, status, completed_at, output_file)
-                   VALUES (?, ?, ?, ?, ?)""",
-                (book_hash, stage.value, status, completed_at, output_file),
-            )
-
         conn.commit()
-        log.info(f"Created book record {book_hash} mode={mode}")
-        return self.read(book_hash)  # type: ignore[return-value]
+        log.debug(f"Created {len(book_rows)} book records")
+        return len(book_rows)
 
     def read(self, book_hash: str) -> dict | None:
         """Read a book record as a legacy-compatible dict."""
@@ -306,15 +383,17 @@ class PipelineDB:
         stage_rows = conn.execute(
             "SELECT * FROM stages WHERE book_hash = ?", (book_hash,)
         ).fetchall()
+        # Stage names/statuses come back as fresh strings per row; intern
+        # them so every record shares the Stage/StageStatus value objects
         for sr in stage_rows:
-            stage_data: dict[str, Any] = {"status": sr["status"]}
+            stage_data: dict[str, Any] = {"status": _intern(sr["status"])}
             if sr["completed_at"]:
                 stage_data["completed_at"] = sr["completed_at"]
             if sr["output_file"]:
                 stage_data["output_file"] = sr["output_file"]
             if sr["dest_dir"]:
                 stage_data["dest_dir"] = sr["dest_dir"]
-            data["stages"][sr["stage"]] = stage_data
+            data["stages"][_intern(sr["stage"])] = stage_data
 
         return data
 
@@ -328,24 +407,36 @@ class PipelineDB:
         # Fast path: stages.X.status or stages.X.output_file
         if len(parts) == 3 and parts[0] == "stages":
             stage_name, col = parts[1], parts[2]
-            if col in _STAGE_COLUMNS:
-                conn = self._get_conn()
-                row = conn.execute(
-                    f"SELECT {col} FROM stages WHERE book_hash = ? AND stage = ?",
-                    (book_hash, stage_name),
-                ).fetchone()
-                return row[col] if row else None
+            if col not in _STAGE_COLUMNS:
+                return None  # stage dicts only carry stage columns
+            conn = self._get_conn()
+            row = conn.execute(
+                f"SELECT {col} FROM stages WHERE book_hash = ? AND stage = ?",
+                (book_hash, stage_name),
+            ).fetchone()
+            return row[col] if row else None
 
         # Fast path: metadata.X
         if len(parts) == 2 and parts[0] == "metadata":
             col = parts[1]
-            if col in _BOOKS_COLUMNS:
-                conn = self._get_conn()
-                row = conn.execute(
-                    f"SELECT {col} FROM books WHERE book_hash = ?",
-                    (book_hash,),
-                ).fetchone()
-                return row[col] if row else None
+            if col not in _BOOKS_COLUMNS:
+                return None  # metadata only holds book columns
+            conn = self._get_conn()
+            row = conn.execute(
+                f"SELECT {col} FROM books WHERE book_hash = ?",
+                (book_hash,),
+            ).fetchone()
+            return row[col] if row else None
+
+        # Fast path: top-level scalar (status, retry_count, source_path, ...)
+        if len(parts) == 1 and parts[0] in _TOP_LEVEL_COLUMNS:
+            col = parts[0]
+            conn = self._get_conn()
+            row = conn.execute(
+                f"SELECT {col} FROM books WHERE book_hash = ?",
+                (book_hash,),
+            ).fetchone()
+            return row[col] if row else None
 
         # Fallback: full dict traversal
         data = self.read(book_hash)
@@ -367,13 +458,6 @@ class PipelineDB:
         """
         conn = self._get_conn()
 
-        # Verify book exists
-        exists = conn.execute(
-            "SELECT 1 FROM books WHERE book_hash = ?", (book_hash,)
-        ).fetchone()
-        if not exists:
-            raise ManifestError(f"Book not found: {book_hash}")
-
         book_updates: dict[str, Any] = {}
         stage_updates: dict[str, dict[str, Any]] = {}
 
@@ -391,15 +475,23 @@ class PipelineDB:
             elif key in _BOOKS_COLUMNS:
                 book_updates[key] = value
 
-        # Apply book column updates
+        # Apply book column updates; the UPDATE's rowcount doubles as the
+        # existence check, so only stage-only updates need a separate SELECT
         if book_updates:
             book_updates["updated_at"] = _utcnow()
             set_clause = ", ".join(f"{k} = ?" for k in book_updates)
             values = list(book_updates.values()) + [book_hash]
-            conn.execute(
+            cur = conn.execute(
                 f"UPDATE books SET {set_clause} WHERE book_hash = ?",
                 values,
             )
+            if cur.rowcount == 0:
+                conn.rollback()
+                raise ManifestError(f"Book not found: {book_hash}")
+        elif not conn.execute(
+            "SELECT 1 FROM books WHERE book_hash = ?", (book_hash,)
+        ).fetchone():
+            raise ManifestError(f"Book not found: {book_hash}")
 
         # Apply stage updates
         for stage_name, stage_dict in stage_updates.items():
@@ -452,40 +544,46 @@ class PipelineDB:
         book_hash: str,
         mode: PipelineMode,
     ) -> Stage | None:
-        """Find the next incomplete stage for this mode."""
+        """Find the next incomplete stage for this mode.
+
+        Fetches all stage statuses in one query rather than one per stage.
+        """
         conn = self._get_conn()
-        exists = conn.execute(
+        statuses = dict(
+            conn.execute(
+                "SELECT stage, status FROM stages WHERE book_hash = ?",
+                (book_hash,),
+            ).fetchall()
+        )
+        # Stage rows reference books (FK), so only an empty result needs
+        # the existence check
+        if not statuses and not conn.execute(
             "SELECT 1 FROM books WHERE book_hash = ?", (book_hash,)
-        ).fetchone()
-        if not exists:
+        ).fetchone():
             raise ManifestError(f"Book not found: {book_hash}")
 
-        stages = STAGE_ORDER.get(mode, [])
-        for stage in stages:
-            row = conn.execute(
-                "SELECT status FROM stages WHERE book_hash = ? AND stage = ?",
-                (book_hash, stage.value),
-            ).fetchone()
-            stage_status = row["status"] if row else "pending"
-            if stage_status != "completed":
+        for stage in STAGE_ORDER.get(mode, ()):
+            if statuses.get(stage.value, "pending") != "completed":
                 return stage
         return None
 
     def increment_retry(self, book_hash: str) -> None:
         """Increment the retry counter."""
         conn = self._get_conn()
-        row = conn.execute(
-            "SELECT retry_count FROM books WHERE book_hash = ?", (book_hash,)
-        ).fetchone()
-        if row is None:
-            raise ManifestError(f"Book not found: {book_hash}")
-        new_count = row["retry_count"] + 1
-        log.warning(f"increment_retry book_hash={book_hash} new_count={new_count}")
-        conn.execute(
-            "UPDATE books SET retry_count = ?, updated_at = ? WHERE book_hash = ?",
-            (new_count, _utcnow(), book_hash),
+        # Increment in SQL: no read-modify-write race between threads
+        cur = conn.execute(
+            """UPDATE books SET retry_count = retry_count + 1, updated_at = ?
+               WHERE book_hash = ?""",
+            (_utcnow(), book_hash),
         )
+        if cur.rowcount == 0:
+            conn.rollback()
+            raise ManifestError(f"Book not found: {book_hash}")
+        new_count = conn.execute(
+            "SELECT retry_count FROM books WHERE book_hash = ?", (book_hash,)
+        ).fetchone()["retry_count"]
         conn.commit()
+        log.warning(f"increment_retry book_hash={book_hash} new_count={new_count}")
 
     def set_error(
         self,
@@ -580,6 +678,57 @@ class PipelineDB:
         ).fetchall()
         return [r["variant"] for r in rows]
 
+    # -- Library index snapshot API --
+
+    def get_library_dirs(self, root: str) -> dict[str, tuple]:
+        """Load the LibraryIndex snapshot for a library root.
+
+        Returns {path: (mtime_ns, scanned_ns, dirs, files)} where dirs is a
+        list of [name, descend] pairs and files a list of names.
+        """
+        conn = self._get_conn()
+        rows = conn.execute(
+            """SELECT path, mtime_ns, scanned_ns, dirs, files
+               FROM library_dirs WHERE root = ?""",
+            (root,),
+        ).fetchall()
+        return {
+            r["path"]: (
+                r["mtime_ns"],
+                r["scanned_ns"],
+                json.loads(r["dirs"]),
+                json.loads(r["files"]),
+            )
+            for r in rows
+        }
+
+    def save_library_dirs(
+        self,
+        root: str,
+        rows: Iterable[tuple[str, int, int, list, list]],
+        removed: Iterable[str] = (),
+    ) -> None:
+        """Upsert rescanned directories and drop vanished ones in one commit.
+
+        rows are (path, mtime_ns, scanned_ns, dirs, files) as returned by
+        get_library_dirs.
+        """
+        conn = self._get_conn()
+        conn.executemany(
+            """INSERT OR REPLACE INTO library_dirs
+               (root, path, mtime_ns, scanned_ns, dirs, files)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            [
+                (root, path, mtime_ns, scanned_ns, json.dumps(dirs), json.dumps(files))
+                for path, mtime_ns, scanned_ns, dirs, files in rows
+            ],
+        )
+        conn.executemany(
+            "DELETE FROM library_dirs WHERE root = ? AND path = ?",
+            [(root, path) for path in removed],
+        )
+        conn.commit()
+
     # -- Locking API --
 
     def acquire_reorganize_lock(self) -> bool:
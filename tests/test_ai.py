@@ -1,18 +1,69 @@
 """Tests for ai.py -- AI-assisted metadata resolution."""
 
+import json
+import re
 from unittest.mock import MagicMock, Mock
 
+import httpx
 import pytest
+from openai import BadRequestError
 
 from audiobook_pipeline.ai import (
     _parse_resolve_response,
+    clear_cache,
     disambiguate,
     get_client,
     needs_resolution,
     resolve,
+    resolve_many,
 )
 
 
+def _chunk(content=None, arguments=None):
+    """Build one mocked stream chunk with a content and/or tool-call delta."""
+    tool_calls = None
+    if arguments is not None:
+        tool_calls = [Mock(index=0, function=Mock(arguments=arguments))]
+    return Mock(choices=[Mock(delta=Mock(content=content, tool_calls=tool_calls))])
+
+
+def _tool_response(**arguments):
+    """Build a mocked streamed resolve_metadata tool call, split across chunks."""
+    payload = json.dumps(arguments)
+    mid = len(payload) // 2
+    return [_chunk(arguments=payload[:mid]), _chunk(arguments=payload[mid:])]
+
+
+def _text_response(content):
+    """Build a mocked streamed plain-text reply (endpoint without tool support)."""
+    return [_chunk(content=line) for line in content.splitlines(keepends=True)]
+
+
+def _bad_request(message="tools are not supported"):
+    """Build the 400 error an endpoint without tool support raises."""
+    request = httpx.Request("POST", "http://localhost/v1/chat/completions")
+    response = httpx.Response(400, request=request)
+    return BadRequestError(message, response=response, body=None)
+
+
+def _extract_books(prompt):
+    """Return the set of "Book N" labels mentioned in a prompt."""
+    return set(re.findall(r"Book \d+", prompt))
+
+
+def _prompt_lines(prompt):
+    """Return the prompt's lines as a set for field-presence checks."""
+    return set(prompt.splitlines())
+
+
+@pytest.fixture(autouse=True)
+def _clear_ai_cache():
+    """Isolate tests from the module-level response cache."""
+    clear_cache()
+    yield
+    clear_cache()
+
+
 class TestGetClient:
     """Test OpenAI client creation with various base URLs."""
 
@@ -77,6 +128,20 @@ class TestNeedsResolution:
             {"author": "Various"},
         )
 
+    def test_placeholders_case_and_whitespace_insensitive(self):
+        assert needs_resolution(
+            {"author": "  N/A "},
+            {"author": "NONE"},
+            {"author": " unknown"},
+        )
+
+    def test_none_author_value_treated_as_empty(self):
+        assert not needs_resolution(
+            {"author": None},
+            {"author": "Stephen King"},
+            None,
+        )
+
     def test_no_conflict_same_author(self):
         assert not needs_resolution(
             {"author": "Stephen King"},
@@ -272,11 +337,9 @@ class TestResolve:
 
     def test_builds_prompt_with_path_evidence(self):
         mock_client = Mock()
-        mock_response = Mock()
-        mock_response.choices = [
-            Mock(message=Mock(content="AUTHOR: Stephen King\nTITLE: The Stand\nSERIES: NONE\nPOSITION: NONE"))
-        ]
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create.return_value = _tool_response(
+            author="Stephen King", title="The Stand"
+        )
 
         result = resolve(
             {"author": "Stephen King", "title": "The Stand"},
@@ -294,16 +357,16 @@ class TestResolve:
         call_args = mock_client.chat.completions.create.call_args
         prompt = call_args.kwargs["messages"][0]["content"]
         assert "the_stand.m4b" in prompt
-        assert "File path suggests author: 'Stephen King'" in prompt
-        assert "File path title: 'The Stand'" in prompt
+        assert {
+            "File path suggests author: 'Stephen King'",
+            "File path title: 'The Stand'",
+        } <= _prompt_lines(prompt)
 
     def test_builds_prompt_with_tag_evidence(self):
         mock_client = Mock()
-        mock_response = Mock()
-        mock_response.choices = [
-            Mock(message=Mock(content="AUTHOR: Stephen King\nTITLE: The Stand\nSERIES: NONE\nPOSITION: NONE"))
-        ]
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create.return_value = _tool_response(
+            author="Stephen King", title="The Stand"
+        )
 
         result = resolve(
             {},
@@ -315,17 +378,17 @@ class TestResolve:
 
         call_args = mock_client.chat.completions.create.call_args
         prompt = call_args.kwargs["messages"][0]["content"]
-        assert "Embedded tags artist: 'Stephen King'" in prompt
-        assert "Tag album: 'The Stand'" in prompt
-        assert "Tag title: 'Chapter 1'" in prompt
+        assert {
+            "Embedded tags artist: 'Stephen King'",
+            "Tag album: 'The Stand'",
+            "Tag title: 'Chapter 1'",
+        } <= _prompt_lines(prompt)
 
     def test_builds_prompt_with_audible_candidates(self):
         mock_client = Mock()
-        mock_response = Mock()
-        mock_response.choices = [
-            Mock(message=Mock(content="AUTHOR: Stephen King\nTITLE: The Stand\nSERIES: NONE\nPOSITION: NONE"))
-        ]
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create.return_value = _tool_response(
+            author="Stephen King", title="The Stand"
+        )
 
         candidates = [
             {
@@ -346,17 +409,17 @@ class TestResolve:
 
         call_args = mock_client.chat.completions.create.call_args
         prompt = call_args.kwargs["messages"][0]["content"]
-        assert "Audible search results:" in prompt
-        assert '1. "The Stand" by Stephen King (Series: The Stand #1) [score: 95]' in prompt
-        assert '2. "The Stand: Complete & Uncut" by Stephen King [score: 90]' in prompt
+        assert {
+            "Audible search results:",
+            '1. "The Stand" by Stephen King (Series: The Stand #1) [score: 95]',
+            '2. "The Stand: Complete & Uncut" by Stephen King [score: 90]',
+        } <= _prompt_lines(prompt)
 
     def test_prompt_includes_uuid_nonce(self):
         mock_client = Mock()
-        mock_response = Mock()
-        mock_response.choices = [
-            Mock(message=Mock(content="AUTHOR: Stephen King\nTITLE: The Stand\nSERIES: NONE\nPOSITION: NONE"))
-        ]
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create.return_value = _tool_response(
+            author="Stephen King", title="The Stand"
+        )
 
         resolve(
             {"author": "Stephen King"},
@@ -375,11 +438,9 @@ class TestResolve:
 
     def test_sets_correct_api_params(self):
         mock_client = Mock()
-        mock_response = Mock()
-        mock_response.choices = [
-            Mock(message=Mock(content="AUTHOR: Stephen King\nTITLE: The Stand\nSERIES: NONE\nPOSITION: NONE"))
-        ]
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create.return_value = _tool_response(
+            author="Stephen King", title="The Stand"
+        )
 
         resolve(
             {"author": "Stephen King"},
@@ -393,8 +454,124 @@ class TestResolve:
         assert call_args.kwargs["model"] == "claude-haiku-4-5"
         assert call_args.kwargs["max_tokens"] == 150
         assert call_args.kwargs["temperature"] == 0.1
+        assert call_args.kwargs["stream"] is True
         assert call_args.kwargs["extra_headers"]["Cache-Control"] == "no-cache"
 
+    def test_forces_resolve_metadata_tool(self):
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = _tool_response(
+            author="Stephen King", title="The Stand"
+        )
+
+        resolve({"author": "Stephen King"}, {}, None, "haiku", mock_client)
+
+        call_args = mock_client.chat.completions.create.call_args
+        tool = call_args.kwargs["tools"][0]["function"]
+        assert tool["name"] == "resolve_metadata"
+        assert tool["parameters"]["required"] == ["author", "title"]
+        assert call_args.kwargs["tool_choice"]["function"]["name"] == "resolve_metadata"
+
+    def test_tool_call_arguments_normalized(self):
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = _tool_response(
+            author="Robin Hobb",
+            title="Ship of Magic (Unabridged)",
+            series="Liveship Traders",
+            position="01",
+        )
+
+        result = resolve({"author": "Robin Hobb"}, {}, None, "haiku", mock_client)
+
+        assert result == {
+            "author": "Robin Hobb",
+            "title": "Ship of Magic",
+            "series": "Liveship Traders",
+            "position": "1",
+        }
+
+    def test_tool_call_null_series_excluded(self):
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = _tool_response(
+            author="Stephen King", title="The Stand", series=None, position="NONE"
+        )
+
+        result = resolve({"author": "Stephen King"}, {}, None, "haiku", mock_client)
+
+        assert result == {"author": "Stephen King", "title": "The Stand"}
+
+    def test_invalid_tool_arguments_return_none(self):
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = [
+            _chunk(arguments="{not json")
+        ]
+
+        result = resolve({"author": "Stephen King"}, {}, None, "haiku", mock_client)
+
+        assert result is None
+
+    def test_falls_back_to_text_reply_without_tool_call(self):
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = _text_response(
+            "AUTHOR: Stephen King\nTITLE: The Stand\nSERIES: NONE\nPOSITION: NONE"
+        )
+
+        result = resolve({"author": "Stephen King"}, {}, None, "haiku", mock_client)
+
+        assert result == {"author": "Stephen King", "title": "The Stand"}
+
+    def test_retries_without_tools_when_endpoint_rejects_them(self):
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = [
+            _bad_request(),
+            _text_response("AUTHOR: Stephen King\nTITLE: The Stand"),
+        ]
+
+        result = resolve({"author": "Stephen King"}, {}, None, "haiku", mock_client)
+
+        assert result == {"author": "Stephen King", "title": "The Stand"}
+        first, second = mock_client.chat.completions.create.call_args_list
+        assert "tools" in first.kwargs
+        assert "tools" not in second.kwargs
+        assert "tool_choice" not in second.kwargs
+        assert second.kwargs["messages"] == first.kwargs["messages"]
+
+    def test_text_retry_failure_returns_none(self):
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = [
+            _bad_request(),
+            Exception("API error"),
+        ]
+
+        result = resolve({"author": "Stephen King"}, {}, None, "haiku", mock_client)
+
+        assert result is None
+        assert mock_client.chat.completions.create.call_count == 2
+
+    def test_stops_reading_text_stream_after_position(self):
+        def _stream():
+            yield _chunk(content="AUTHOR: Stephen King\nTITLE: The Stand\n")
+            yield _chunk(content="SERIES: NONE\nPOSITION: NONE\n")
+            raise AssertionError("stream read past POSITION line")
+
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = _stream()
+
+        result = resolve({"author": "Stephen King"}, {}, None, "haiku", mock_client)
+
+        assert result == {"author": "Stephen King", "title": "The Stand"}
+
+    def test_closes_stream(self):
+        stream = MagicMock()
+        stream.__iter__.return_value = iter(
+            _tool_response(author="Stephen King", title="The Stand")
+        )
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = stream
+
+        resolve({"author": "Stephen King"}, {}, None, "haiku", mock_client)
+
+        stream.close.assert_called_once()
+
     def test_handles_api_exception(self):
         mock_client = Mock()
         mock_client.chat.completions.create.side_effect = Exception("API error")
@@ -408,6 +585,83 @@ class TestResolve:
         )
 
         assert result is None
+        # Only a 400 triggers the text retry
+        mock_client.chat.completions.create.assert_called_once()
+
+    def test_caches_identical_evidence(self):
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = _tool_response(
+            author="Stephen King", title="The Stand"
+        )
+
+        first = resolve({"author": "Stephen King"}, {}, None, "haiku", mock_client)
+        second = resolve({"author": "Stephen King"}, {}, None, "haiku", mock_client)
+
+        assert first == second == {"author": "Stephen King", "title": "The Stand"}
+        mock_client.chat.completions.create.assert_called_once()
+
+    def test_cache_keyed_on_model_and_evidence(self):
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = _tool_response(
+            author="Stephen King", title="The Stand"
+        )
+
+        resolve({"author": "Stephen King"}, {}, None, "haiku", mock_client)
+        resolve({"author": "Stephen King"}, {}, None, "sonnet", mock_client)
+        resolve({"author": "Stephen King", "title": "It"}, {}, None, "haiku", mock_client)
+
+        assert mock_client.chat.completions.create.call_count == 3
+
+    def test_failed_call_not_cached(self):
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = [
+            Exception("API error"),
+            _tool_response(author="Stephen King", title="The Stand"),
+        ]
+
+        assert resolve({"author": "Stephen King"}, {}, None, "haiku", mock_client) is None
+        result = resolve({"author": "Stephen King"}, {}, None, "haiku", mock_client)
+
+        assert result["author"] == "Stephen King"
+        assert mock_client.chat.completions.create.call_count == 2
+
+
+class TestResolveMany:
+    """Test concurrent batch resolution."""
+
+    def test_returns_none_per_item_when_client_none(self):
+        items = [{"path_metadata": {"author": "King"}}] * 3
+        assert resolve_many(items, "haiku", None) == [None, None, None]
+
+    def test_empty_items(self):
+        assert resolve_many([], "haiku", Mock()) == []
+
+    def test_preserves_input_order(self):
+        def _reply(**kwargs):
+            prompt = kwargs["messages"][0]["content"]
+            name = next(n for n in ("a", "b", "c") if f"'{n}.m4b'" in prompt)
+            return _tool_response(author=f"Author {name.upper()}", title="T")
+
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = _reply
+
+        items = [
+            {"path_metadata": {"title": "T"}, "source_filename": name}
+            for name in ("a.m4b", "b.m4b", "c.m4b")
+        ]
+        results = resolve_many(items, "haiku", mock_client, max_workers=2)
+
+        assert [r["author"] for r in results] == ["Author A", "Author B", "Author C"]
+        assert mock_client.chat.completions.create.call_count == 3
+
+    def test_failed_item_yields_none(self):
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = Exception("API error")
+
+        results = resolve_many(
+            [{"path_metadata": {"author": "King"}}], "haiku", mock_client
+        )
+        assert results == [None]
 
 
 class TestDisambiguate:
@@ -489,9 +743,7 @@ class TestDisambiguate:
         call_args = mock_client.chat.completions.create.call_args
         prompt = call_args.kwargs["messages"][0]["content"]
         # Only first 5 should appear in prompt
-        assert "Book 0" in prompt
-        assert "Book 4" in prompt
-        assert "Book 5" not in prompt
+        assert _extract_books(prompt) == {"Book 0", "Book 1", "Book 2", "Book 3", "Book 4"}
 
     def test_prompt_includes_uuid_nonce(self):
         mock_client = Mock()
@@ -560,6 +812,19 @@ class TestDisambiguate:
         # Regex [0-5] matches first "1" from "10", returns candidates[0]
         assert result == candidates[0]
 
+    def test_skips_digits_outside_pick_range(self):
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content="Not 7 or 9 -- pick 3"))]
+        mock_client.chat.completions.create.return_value = mock_response
+
+        candidates = [
+            {"title": f"Book {i}", "author_str": "Author", "asin": f"B00{i}"}
+            for i in range(1, 4)
+        ]
+        result = disambiguate(candidates, "Book 3", "Author", "haiku", mock_client)
+        assert result == candidates[2]
+
     def test_returns_none_when_no_valid_digit(self):
         mock_client = Mock()
         mock_response = Mock()
@@ -569,3 +834,33 @@ class TestDisambiguate:
         candidates = [{"title": "Book 1", "author_str": "Author", "asin": "B001"}]
         result = disambiguate(candidates, "Book 1", "Author", "haiku", mock_client)
         assert result is None
+
+    def test_caches_pick_for_identical_candidates(self):
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content="2"))]
+        mock_client.chat.completions.create.return_value = mock_response
+
+        candidates = [
+            {"title": "Book 1", "author_str": "Author", "asin": "B001"},
+            {"title": "Book 2", "author_str": "Author", "asin": "B002"},
+        ]
+        first = disambiguate(candidates, "Book 2", "Author", "haiku", mock_client)
+        second = disambiguate(candidates, "Book 2", "Author", "haiku", mock_client)
+
+        assert first == second == candidates[1]
+        mock_client.chat.completions.create.assert_called_once()
+
+    def test_garbled_reply_not_cached(self):
+        garbled = Mock(choices=[Mock(message=Mock(content="No match found"))])
+        valid = Mock(choices=[Mock(message=Mock(content="1"))])
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = [garbled, valid]
+
+        candidates = [{"title": "Book 1", "author_str": "Author", "asin": "B001"}]
+        first = disambiguate(candidates, "Book 1", "Author", "haiku", mock_client)
+        second = disambiguate(candidates, "Book 1", "Author", "haiku", mock_client)
+
+        assert first is None
+        assert second == candidates[0]
+        assert mock_client.chat.completions.create.call_count == 2
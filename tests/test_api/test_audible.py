@@ -1,57 +1,74 @@
-"""Tests for api/audible.py -- Audible catalog search with mocked HTTP."""
+"""Tests for api/audible.py -- Audible catalog search with mocked HTTP transport."""
 
-from unittest.mock import MagicMock, patch
+import json
+import time
 
+import httpx
 import pytest
 
-from audiobook_pipeline.api.audible import _extract_genre, _strip_html, search
+from audiobook_pipeline.api.audible import (
+    _extract_genre,
+    _get_client,
+    _parse_products,
+    _strip_html,
+    _user_agent,
+    clear_cache,
+    close_clients,
+    search,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_search_cache():
+    """Isolate tests from the module-level search cache."""
+    clear_cache()
+    yield
+    clear_cache()
 
 
 class TestSearch:
-    """Test Audible API search with mocked httpx calls."""
-
-    @patch("audiobook_pipeline.api.audible.httpx.get")
-    def test_successful_search_returns_results(self, mock_get):
-        # Mock successful API response with expanded fields
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "products": [
-                {
-                    "asin": "B001ABC",
-                    "title": "The Great Book",
-                    "subtitle": "A Subtitle",
-                    "authors": [
-                        {"name": "John Smith"},
-                        {"name": "Jane Doe"},
-                    ],
-                    "series": [
-                        {
-                            "title": "Great Series",
-                            "sequence": "1",
-                        },
-                    ],
-                    "publisher_summary": "<p>A great book.</p>",
-                    "publisher_name": "Acme Publishing",
-                    "copyright": "(c) 2024 John Smith",
-                    "language": "english",
-                    "category_ladders": [
-                        {
-                            "ladder": [
-                                {"name": "Science Fiction"},
-                                {"name": "Space Opera"},
-                            ],
-                        },
-                    ],
-                },
-                {
-                    "asin": "B002DEF",
-                    "title": "Another Book",
-                    "authors": [{"name": "Bob Jones"}],
-                    "series": None,
-                },
-            ],
-        }
-        mock_get.return_value = mock_response
+    """Test Audible API search against pytest-httpx transport mocks."""
+
+    def test_successful_search_returns_results(self, httpx_mock):
+        httpx_mock.add_response(
+            json={
+                "products": [
+                    {
+                        "asin": "B001ABC",
+                        "title": "The Great Book",
+                        "subtitle": "A Subtitle",
+                        "authors": [
+                            {"name": "John Smith"},
+                            {"name": "Jane Doe"},
+                        ],
+                        "series": [
+                            {
+                                "title": "Great Series",
+                                "sequence": "1",
+                            },
+                        ],
+                        "publisher_summary": "<p>A great book.</p>",
+                        "publisher_name": "Acme Publishing",
+                        "copyright": "(c) 2024 John Smith",
+                        "language": "english",
+                        "category_ladders": [
+                            {
+                                "ladder": [
+                                    {"name": "Science Fiction"},
+                                    {"name": "Space Opera"},
+                                ],
+                            },
+                        ],
+                    },
+                    {
+                        "asin": "B002DEF",
+                        "title": "Another Book",
+                        "authors": [{"name": "Bob Jones"}],
+                        "series": None,
+                    },
+                ],
+            }
+        )
 
         results = search("test query")
 
@@ -75,39 +92,28 @@ class TestSearch:
         assert results[1]["publisher_summary"] == ""
         assert results[1]["genre"] == ""
 
-    @patch("audiobook_pipeline.api.audible.httpx.get")
-    def test_uses_correct_api_endpoint(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"products": []}
-        mock_get.return_value = mock_response
+    def test_uses_correct_api_endpoint(self, httpx_mock):
+        httpx_mock.add_response(json={"products": []})
 
         search("test query", region="com")
 
-        # Verify the correct API URL was called
-        call_args = mock_get.call_args
-        assert "api.audible.com/1.0/catalog/products" in call_args[0][0]
+        request = httpx_mock.get_request()
+        assert request.url.host == "api.audible.com"
+        assert request.url.path == "/1.0/catalog/products"
 
-    @patch("audiobook_pipeline.api.audible.httpx.get")
-    def test_uses_custom_region(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"products": []}
-        mock_get.return_value = mock_response
+    def test_uses_custom_region(self, httpx_mock):
+        httpx_mock.add_response(json={"products": []})
 
         search("test query", region="uk")
 
-        call_args = mock_get.call_args
-        assert "api.audible.uk/1.0/catalog/products" in call_args[0][0]
+        assert httpx_mock.get_request().url.host == "api.audible.uk"
 
-    @patch("audiobook_pipeline.api.audible.httpx.get")
-    def test_includes_correct_query_params(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"products": []}
-        mock_get.return_value = mock_response
+    def test_includes_correct_query_params(self, httpx_mock):
+        httpx_mock.add_response(json={"products": []})
 
         search("fantasy books")
 
-        call_kwargs = mock_get.call_args[1]
-        params = call_kwargs["params"]
+        params = httpx_mock.get_request().url.params
         assert params["keywords"] == "fantasy books"
         assert params["num_results"] == "10"
         assert params["products_sort_by"] == "Relevance"
@@ -119,56 +125,40 @@ class TestSearch:
         assert "rating" in rg
         assert "product_details" in rg
 
-    @patch("audiobook_pipeline.api.audible.httpx.get")
-    def test_http_error_returns_empty_list(self, mock_get):
-        # Simulate HTTP error
-        import httpx
-
-        mock_get.side_effect = httpx.HTTPError("Network error")
+    def test_http_error_returns_empty_list(self, httpx_mock):
+        httpx_mock.add_exception(httpx.ConnectError("Network error"))
 
         results = search("test query")
 
         assert results == []
 
-    @patch("audiobook_pipeline.api.audible.httpx.get")
-    def test_http_status_error_returns_empty_list(self, mock_get):
-        # Simulate 404 or other HTTP status error
-        import httpx
-
-        mock_response = MagicMock()
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "404 Not Found", request=MagicMock(), response=MagicMock()
-        )
-        mock_get.return_value = mock_response
+    def test_http_status_error_returns_empty_list(self, httpx_mock):
+        httpx_mock.add_response(status_code=404)
 
         results = search("test query")
 
         assert results == []
 
-    @patch("audiobook_pipeline.api.audible.httpx.get")
-    def test_empty_products_array(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"products": []}
-        mock_get.return_value = mock_response
+    def test_empty_products_array(self, httpx_mock):
+        httpx_mock.add_response(json={"products": []})
 
         results = search("nonexistent book")
 
         assert results == []
 
-    @patch("audiobook_pipeline.api.audible.httpx.get")
-    def test_missing_authors_handled_gracefully(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "products": [
-                {
-                    "asin": "B001",
-                    "title": "Book Without Authors",
-                    "authors": None,
-                    "series": None,
-                },
-            ],
-        }
-        mock_get.return_value = mock_response
+    def test_missing_authors_handled_gracefully(self, httpx_mock):
+        httpx_mock.add_response(
+            json={
+                "products": [
+                    {
+                        "asin": "B001",
+                        "title": "Book Without Authors",
+                        "authors": None,
+                        "series": None,
+                    },
+                ],
+            }
+        )
 
         results = search("test")
 
@@ -176,38 +166,36 @@ class TestSearch:
         assert results[0]["authors"] == []
         assert results[0]["author_str"] == ""
 
-    @patch("audiobook_pipeline.api.audible.httpx.get")
-    def test_empty_series_array_handled(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "products": [
-                {
-                    "asin": "B001",
-                    "title": "Standalone Book",
-                    "authors": [{"name": "Author"}],
-                    "series": [],
-                },
-            ],
-        }
-        mock_get.return_value = mock_response
+    def test_empty_series_array_handled(self, httpx_mock):
+        httpx_mock.add_response(
+            json={
+                "products": [
+                    {
+                        "asin": "B001",
+                        "title": "Standalone Book",
+                        "authors": [{"name": "Author"}],
+                        "series": [],
+                    },
+                ],
+            }
+        )
 
         results = search("test")
 
         assert results[0]["series"] == ""
         assert results[0]["position"] == ""
 
-    @patch("audiobook_pipeline.api.audible.httpx.get")
-    def test_missing_fields_use_empty_defaults(self, mock_get):
+    def test_missing_fields_use_empty_defaults(self, httpx_mock):
         # Test defensive parsing when fields are missing entirely
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "products": [
-                {
-                    # Minimal product, missing optional fields
-                },
-            ],
-        }
-        mock_get.return_value = mock_response
+        httpx_mock.add_response(
+            json={
+                "products": [
+                    {
+                        # Minimal product, missing optional fields
+                    },
+                ],
+            }
+        )
 
         results = search("test")
 
@@ -218,16 +206,214 @@ class TestSearch:
         assert results[0]["series"] == ""
         assert results[0]["position"] == ""
 
-    @patch("audiobook_pipeline.api.audible.httpx.get")
-    def test_timeout_set_correctly(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"products": []}
-        mock_get.return_value = mock_response
+    def test_timeout_set_correctly(self, httpx_mock):
+        httpx_mock.add_response(json={"products": []})
 
         search("test")
 
-        call_kwargs = mock_get.call_args[1]
-        assert call_kwargs["timeout"] == 30.0
+        timeout = httpx_mock.get_request().extensions["timeout"]
+        assert timeout["read"] == 30.0
+
+    def test_reuses_pooled_client_per_region(self, httpx_mock):
+        for _ in range(3):
+            httpx_mock.add_response(json={"products": []})
+
+        search("first")
+        search("second")
+        search("third", region="uk")
+
+        assert _get_client("com") is _get_client("com")
+        assert _get_client("com") is not _get_client("uk")
+        assert [r.url.host for r in httpx_mock.get_requests()] == [
+            "api.audible.com",
+            "api.audible.com",
+            "api.audible.uk",
+        ]
+
+    def test_repeat_query_served_from_cache(self, httpx_mock):
+        httpx_mock.add_response(
+            json={"products": [{"asin": "B001", "title": "Cached"}]}
+        )
+
+        first = search("Cached Book")
+        second = search("  cached book ")
+
+        assert first == second
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_cached_results_are_copies(self, httpx_mock):
+        httpx_mock.add_response(json={"products": [{"asin": "B001"}]})
+
+        search("query")[0]["asin"] = "mutated"
+
+        assert search("query")[0]["asin"] == "B001"
+
+    def test_cached_result_lists_are_copies(self, httpx_mock):
+        httpx_mock.add_response(
+            json={
+                "products": [
+                    {
+                        "asin": "B001",
+                        "authors": [{"name": "Author"}],
+                        "narrators": [{"name": "Narrator"}],
+                        "series": [{"title": "Saga", "sequence": "1"}],
+                    }
+                ]
+            }
+        )
+
+        first = search("query")[0]
+        first["authors"].append("Extra")
+        first["narrators"].clear()
+        first["all_series"][0]["position"] = "99"
+
+        second = search("query")[0]
+        assert second["authors"] == ["Author"]
+        assert second["narrators"] == ["Narrator"]
+        assert second["all_series"] == [{"name": "Saga", "position": "1"}]
+
+    def test_cache_keyed_on_region(self, httpx_mock):
+        httpx_mock.add_response(json={"products": []})
+        httpx_mock.add_response(json={"products": []})
+
+        search("query", region="com")
+        search("query", region="uk")
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_expired_entry_refetched(self, httpx_mock, monkeypatch):
+        from audiobook_pipeline.api import audible
+
+        httpx_mock.add_response(json={"products": []})
+        httpx_mock.add_response(json={"products": []})
+
+        search("query")
+        now = audible.time.monotonic()
+        monkeypatch.setattr(
+            audible.time, "monotonic", lambda: now + audible._SEARCH_CACHE_TTL + 1
+        )
+        search("query")
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_errors_not_cached(self, httpx_mock):
+        httpx_mock.add_response(status_code=503)
+        httpx_mock.add_response(json={"products": [{"asin": "B001"}]})
+
+        assert search("query") == []
+        assert search("query")[0]["asin"] == "B001"
+
+    def test_requests_compressed_responses(self, httpx_mock):
+        httpx_mock.add_response(json={"products": []})
+        search("test")
+        request = httpx_mock.get_requests()[0]
+        assert "gzip" in request.headers["Accept-Encoding"]
+        assert request.headers["User-Agent"].startswith("audiobook-pipeline/")
+
+    def test_user_agent_tracks_package_version(self, monkeypatch):
+        from audiobook_pipeline.api import audible
+
+        monkeypatch.setattr(audible.importlib.metadata, "version", lambda _: "9.8.7")
+        assert _user_agent() == "audiobook-pipeline/9.8.7"
+
+    def test_user_agent_without_package_metadata(self, monkeypatch):
+        from audiobook_pipeline.api import audible
+
+        def _missing(name):
+            raise audible.importlib.metadata.PackageNotFoundError(name)
+
+        monkeypatch.setattr(audible.importlib.metadata, "version", _missing)
+        assert _user_agent() == "audiobook-pipeline"
+
+    def test_concurrent_duplicates_share_one_request(self, httpx_mock):
+        import threading
+
+        release = threading.Event()
+
+        def _slow_response(request):
+            release.wait(timeout=5)
+            return httpx.Response(200, json={"products": [{"asin": "B001"}]})
+
+        httpx_mock.add_callback(_slow_response)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(search("same query")))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        # Let every thread reach the in-flight wait before the response lands
+        time.sleep(0.1)
+        release.set()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert [r[0]["asin"] for r in results] == ["B001"] * 4
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_close_clients_resets_pool(self):
+        client = _get_client("com")
+        close_clients()
+
+        assert client.is_closed
+        assert _get_client("com") is not client
+
+    def test_decodes_raw_utf8_bytes(self, httpx_mock):
+        httpx_mock.add_response(
+            content=json.dumps(
+                {"products": [{"asin": "B001", "title": "Le Château"}]},
+                ensure_ascii=False,
+            ).encode("utf-8")
+        )
+
+        results = search("test")
+
+        assert results[0]["title"] == "Le Château"
+
+    def test_invalid_json_returns_empty_list(self, httpx_mock):
+        httpx_mock.add_response(content=b"<html>Service Unavailable</html>")
+
+        assert search("test") == []
+
+
+class TestParseProducts:
+    """Test decoding + projection of raw catalog response bodies."""
+
+    def test_projects_products_from_bytes(self):
+        body = json.dumps(
+            {
+                "products": [{"asin": "B001", "title": "Book", "rating": {"x": 1}}],
+                "total_results": 1,
+            }
+        ).encode()
+        results = _parse_products(body)
+        assert [(r["asin"], r["title"]) for r in results] == [("B001", "Book")]
+        assert "rating" not in results[0]
+
+    def test_repeated_names_share_one_string(self):
+        # Build the names at runtime so they start out as distinct objects
+        body = json.dumps(
+            {
+                "products": [
+                    {"asin": f"B00{i}", "authors": [{"name": "Robin " + "Hobb"}]}
+                    for i in range(2)
+                ]
+            }
+        ).encode()
+        first, second = _parse_products(body)
+        assert first["authors"][0] is second["authors"][0]
+
+    def test_null_products(self):
+        assert _parse_products(b'{"products": null}') == []
+
+    def test_non_object_body_raises(self):
+        with pytest.raises(ValueError):
+            _parse_products(b"[]")
+
+    def test_invalid_json_raises(self):
+        with pytest.raises(ValueError):
+            _parse_products(b"not json")
 
 
 class TestExtractGenre:
@@ -247,6 +433,13 @@ class TestExtractGenre:
         ladders = [{"ladder": [{"name": "Nonfiction"}]}]
         assert _extract_genre(ladders) == "Nonfiction"
 
+    def test_skips_steps_without_name(self):
+        ladders = [{"ladder": [{"name": "Fiction"}, {"id": "123"}, {"name": ""}]}]
+        assert _extract_genre(ladders) == "Fiction"
+
+    def test_null_ladder(self):
+        assert _extract_genre([{"ladder": None}]) == ""
+
     def test_uses_first_ladder_only(self):
         ladders = [
             {"ladder": [{"name": "Fiction"}]},
@@ -4,6 +4,7 @@ import pytest
 
 from audiobook_pipeline.api.search import (
     _strip_series_numbers,
+    _title_scores,
     parse_source_path,
     score_results,
 )
@@ -25,6 +26,25 @@ class TestScoreResults:
         # Exact match: title 60 + author 30 + position 10 = 100
         assert 95 <= scored[0]["score"] <= 100
 
+    def test_exact_case_insensitive_match_scores_full(self):
+        results = [
+            {"asin": "B001", "title": "THE GREAT BOOK", "authors": ["john smith"]},
+        ]
+        scored = score_results(results, "The Great Book", "John Smith")
+        assert scored[0]["score"] == 100.0
+
+    def test_repeat_scoring_hits_similarity_cache(self):
+        results = [
+            {"asin": "B001", "title": "Cache Probe Title", "authors": ["Cache Author"]},
+        ]
+        first = score_results(results, "cache probe title", "Cache Author")
+        hits_before = _title_scores.cache_info().hits
+
+        second = score_results(results, "Cache Probe Title ", "Cache Author")
+
+        assert second == first
+        assert _title_scores.cache_info().hits == hits_before + 1
+
     def test_title_only_matching(self):
         results = [
             {
@@ -130,6 +150,12 @@ class TestParseSourcePath:
         assert result["author_hint"] == "John Smith"
         assert result["query"] == "John Smith The Great Book"
 
+    def test_cached_result_not_shared_between_callers(self):
+        first = parse_source_path("/library/John Smith/The Great Book.m4b")
+        first["author_hint"] = "mutated"
+        second = parse_source_path("/library/John Smith/The Great Book.m4b")
+        assert second["author_hint"] == "John Smith"
+
     def test_strips_series_numbers_brackets(self):
         result = parse_source_path("Series Name [03] Book Title.m4b")
         assert "[03]" not in result["title_hint"]
@@ -188,6 +214,14 @@ class TestStripSeriesNumbers:
         # Removes single-digit to 3-digit numbers surrounded by spaces
         assert _strip_series_numbers("Series 5 Book") == "Series Book"
 
+    def test_adjacent_standalone_numbers_do_not_overlap(self):
+        # Matches share no space, so the second number survives
+        assert _strip_series_numbers("Series 5 6 Book") == "Series 6 Book"
+        assert _strip_series_numbers("Series 5  6 Book") == "Series Book"
+
+    def test_standalone_number_between_tabs(self):
+        assert _strip_series_numbers("Series\t5\tBook") == "Series Book"
+
     def test_preserves_year_like_numbers(self):
         # Year-like numbers (4+ digits) should be preserved
         result = _strip_series_numbers("Book 2025 Edition")
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import patch
 
 import pytest
@@ -36,9 +39,11 @@ def _make_library(tmp_path: Path, structure: dict[str, bytes | str]) -> Path:
     Keys are relative paths, values are file contents (bytes or str).
     """
     lib = tmp_path / "AudioBooks"
-    for rel_path, content in structure.items():
-        full = lib / rel_path
-        full.parent.mkdir(parents=True, exist_ok=True)
+    files = {lib / rel_path: content for rel_path, content in structure.items()}
+    # One mkdir per distinct directory, not per file
+    for parent in {full.parent for full in files}:
+        parent.mkdir(parents=True, exist_ok=True)
+    for full, content in files.items():
         if isinstance(content, bytes):
             full.write_bytes(content)
         else:
@@ -46,28 +51,79 @@ def _make_library(tmp_path: Path, structure: dict[str, bytes | str]) -> Path:
     return lib
 
 
-def _fake_ffprobe_tags(tags: dict[str, str]):
-    """Return a mock for _ffprobe_tags that returns the given tags."""
+@pytest.fixture(scope="session")
+def single_m4b_lib(tmp_path_factory) -> Path:
+    """One-file library (Author/Book/book.m4b), built once per session.
 
-    def _mock(path: Path) -> dict[str, str]:
-        return {k.lower(): v for k, v in tags.items()}
+    Only for read-only checks -- tests that modify the tree use _make_library.
+    """
+    return _make_library(
+        tmp_path_factory.mktemp("lib"), {"Author/Book/book.m4b": b"\x00"}
+    )
+
+
+def _fake_ffprobe_tags(tags: Mapping[str, str]):
+    """Return a mock for _ffprobe_tags that returns the given tags.
+
+    Keys are lower-cased once here, not on every call.
+    """
+    tags = {k.lower(): v for k, v in tags.items()}
+
+    def _mock(path: Path) -> Mapping[str, str]:
+        return tags
 
     return _mock
 
 
-GOOD_TAGS = {
-    "artist": "Brandon Sanderson, Michael Kramer",
-    "album_artist": "Brandon Sanderson",
-    "album": "The Way of Kings",
-    "title": "The Way of Kings",
-    "genre": "Fantasy",
-    "sort_album": "Stormlight Archive 1 - The Way of Kings",
-    "media_type": "2",
-    "composer": "Michael Kramer",
-    "date": "2010",
-    "comment": "A great book",
-    "description": "A great book",
-}
+@pytest.fixture
+def patched_ffprobe(monkeypatch):
+    """Install a fake _ffprobe_tags returning the given tags (None = failure)."""
+
+    def _apply(tags: Mapping[str, str] | None) -> None:
+        fake = (lambda path: None) if tags is None else _fake_ffprobe_tags(tags)
+        monkeypatch.setattr("audiobook_pipeline.ops.audit._ffprobe_tags", fake)
+
+    return _apply
+
+
+# Tag fixtures are frozen with lower-case keys, matching _ffprobe_tags output
+GOOD_TAGS = MappingProxyType(
+    {
+        "artist": "Brandon Sanderson, Michael Kramer",
+        "album_artist": "Brandon Sanderson",
+        "album": "The Way of Kings",
+        "title": "The Way of Kings",
+        "genre": "Fantasy",
+        "sort_album": "Stormlight Archive 1 - The Way of Kings",
+        "media_type": "2",
+        "composer": "Michael Kramer",
+        "date": "2010",
+        "comment": "A great book",
+        "description": "A great book",
+    }
+)
+
+# Single-defect variants of GOOD_TAGS, built once at import
+NO_GENRE_TAGS = MappingProxyType({k: v for k, v in GOOD_TAGS.items() if k != "genre"})
+NO_MEDIA_TYPE_TAGS = MappingProxyType(
+    {k: v for k, v in GOOD_TAGS.items() if k != "media_type"}
+)
+NO_RECOMMENDED_TAGS = MappingProxyType(
+    {
+        k: v
+        for k, v in GOOD_TAGS.items()
+        if k not in ("composer", "date", "comment", "description")
+    }
+)
+SUSPICIOUS_ARTIST_TAGS = MappingProxyType({**GOOD_TAGS, "album_artist": "Unknown"})
+TITLE_MATCHES_AUTHOR_TAGS = MappingProxyType(
+    {
+        **GOOD_TAGS,
+        "title": "Brandon Sanderson",
+        "album_artist": "Brandon Sanderson",
+    }
+)
+AUDIOBOOK_GENRE_TAGS = MappingProxyType({**GOOD_TAGS, "genre": "Audiobook"})
 
 
 # ---------------------------------------------------------------------------
@@ -96,14 +152,16 @@ class TestAuditFinding:
 
 
 class TestAuditReport:
+    FINDINGS = (
+        AuditFinding("tags", "critical", "a", "m1"),
+        AuditFinding("tags", "critical", "b", "m2"),
+        AuditFinding("tags", "warning", "c", "m3"),
+        AuditFinding("tags", "info", "d", "m4", fixable=True),
+    )
+
     def test_counts(self):
         r = AuditReport(library_root="/test", total_files=10)
-        r.findings = [
-            AuditFinding("tags", "critical", "a", "m1"),
-            AuditFinding("tags", "critical", "b", "m2"),
-            AuditFinding("tags", "warning", "c", "m3"),
-            AuditFinding("tags", "info", "d", "m4", fixable=True),
-        ]
+        r.findings = list(self.FINDINGS)
         assert r.critical_count == 2
         assert r.warning_count == 1
         assert r.info_count == 1
@@ -123,98 +181,66 @@ class TestAuditReport:
 
 
 class TestCheckMetadataTags:
-    def test_good_tags_no_findings(self, tmp_path):
-        lib = _make_library(
-            tmp_path,
-            {"Author/Book/book.m4b": b"\x00"},
-        )
-        with patch(
-            "audiobook_pipeline.ops.audit._ffprobe_tags", _fake_ffprobe_tags(GOOD_TAGS)
-        ):
-            findings = check_metadata_tags(lib)
+    def test_good_tags_no_findings(self, single_m4b_lib, patched_ffprobe):
+        lib = single_m4b_lib
+        patched_ffprobe(GOOD_TAGS)
+        findings = check_metadata_tags(lib)
         # Should have no critical or warning findings
         critical_warning = [
             f for f in findings if f.severity in ("critical", "warning")
         ]
         assert len(critical_warning) == 0
 
-    def test_missing_mandatory_tag(self, tmp_path):
-        lib = _make_library(tmp_path, {"Author/Book/book.m4b": b"\x00"})
-        tags = {**GOOD_TAGS}
-        del tags["genre"]
-        with patch(
-            "audiobook_pipeline.ops.audit._ffprobe_tags", _fake_ffprobe_tags(tags)
-        ):
-            findings = check_metadata_tags(lib)
+    def test_missing_mandatory_tag(self, single_m4b_lib, patched_ffprobe):
+        lib = single_m4b_lib
+        patched_ffprobe(NO_GENRE_TAGS)
+        findings = check_metadata_tags(lib)
         critical = [f for f in findings if f.severity == "critical"]
         assert any("genre" in f.message for f in critical)
 
-    def test_suspicious_artist_value(self, tmp_path):
-        lib = _make_library(tmp_path, {"Author/Book/book.m4b": b"\x00"})
-        tags = {**GOOD_TAGS, "album_artist": "Unknown"}
-        with patch(
-            "audiobook_pipeline.ops.audit._ffprobe_tags", _fake_ffprobe_tags(tags)
-        ):
-            findings = check_metadata_tags(lib)
+    def test_suspicious_artist_value(self, single_m4b_lib, patched_ffprobe):
+        lib = single_m4b_lib
+        patched_ffprobe(SUSPICIOUS_ARTIST_TAGS)
+        findings = check_metadata_tags(lib)
         critical = [f for f in findings if f.severity == "critical"]
         assert any(
             "Suspicious value" in f.message and "album_artist" in f.message
             for f in critical
         )
 
-    def test_title_matches_author(self, tmp_path):
-        lib = _make_library(tmp_path, {"Author/Book/book.m4b": b"\x00"})
-        tags = {
-            **GOOD_TAGS,
-            "title": "Brandon Sanderson",
-            "album_artist": "Brandon Sanderson",
-        }
-        with patch(
-            "audiobook_pipeline.ops.audit._ffprobe_tags", _fake_ffprobe_tags(tags)
-        ):
-            findings = check_metadata_tags(lib)
+    def test_title_matches_author(self, single_m4b_lib, patched_ffprobe):
+        lib = single_m4b_lib
+        patched_ffprobe(TITLE_MATCHES_AUTHOR_TAGS)
+        findings = check_metadata_tags(lib)
         warnings = [f for f in findings if f.severity == "warning"]
         assert any("matches album_artist" in f.message for f in warnings)
 
-    def test_genre_audiobook_warning(self, tmp_path):
-        lib = _make_library(tmp_path, {"Author/Book/book.m4b": b"\x00"})
-        tags = {**GOOD_TAGS, "genre": "Audiobook"}
-        with patch(
-            "audiobook_pipeline.ops.audit._ffprobe_tags", _fake_ffprobe_tags(tags)
-        ):
-            findings = check_metadata_tags(lib)
+    def test_genre_audiobook_warning(self, single_m4b_lib, patched_ffprobe):
+        lib = single_m4b_lib
+        patched_ffprobe(AUDIOBOOK_GENRE_TAGS)
+        findings = check_metadata_tags(lib)
         warnings = [f for f in findings if f.severity == "warning"]
         assert any("Audiobook" in f.message for f in warnings)
 
-    def test_ffprobe_failure(self, tmp_path):
-        lib = _make_library(tmp_path, {"Author/Book/book.m4b": b"\x00"})
-        with patch("audiobook_pipeline.ops.audit._ffprobe_tags", return_value=None):
-            findings = check_metadata_tags(lib)
+    def test_ffprobe_failure(self, single_m4b_lib, patched_ffprobe):
+        lib = single_m4b_lib
+        patched_ffprobe(None)
+        findings = check_metadata_tags(lib)
         assert len(findings) == 1
         assert findings[0].severity == "critical"
         assert "corrupt" in findings[0].message
 
-    def test_missing_media_type(self, tmp_path):
-        lib = _make_library(tmp_path, {"Author/Book/book.m4b": b"\x00"})
-        tags = {k: v for k, v in GOOD_TAGS.items() if k != "media_type"}
-        with patch(
-            "audiobook_pipeline.ops.audit._ffprobe_tags", _fake_ffprobe_tags(tags)
-        ):
-            findings = check_metadata_tags(lib)
+    def test_missing_media_type(self, single_m4b_lib, patched_ffprobe):
+        lib = single_m4b_lib
+        patched_ffprobe(NO_MEDIA_TYPE_TAGS)
+        findings = check_metadata_tags(lib)
         warnings = [f for f in findings if f.severity == "warning"]
         assert any("media_type" in f.message for f in warnings)
 
-    def test_missing_recommended_tags(self, tmp_path):
-        lib = _make_library(tmp_path, {"Author/Book/book.m4b": b"\x00"})
-        tags = {
-            k: v
-            for k, v in GOOD_TAGS.items()
-            if k not in ("composer", "date", "comment", "description")
-        }
-        with patch(
-            "audiobook_pipeline.ops.audit._ffprobe_tags", _fake_ffprobe_tags(tags)
-        ):
-            findings = check_metadata_tags(lib)
+    def test_missing_recommended_tags(self, single_m4b_lib, patched_ffprobe):
+        lib = single_m4b_lib
+        patched_ffprobe(NO_RECOMMENDED_TAGS)
+        findings = check_metadata_tags(lib)
         info = [f for f in findings if f.severity == "info"]
         assert len(info) >= 3  # composer, date, comment/description
 
@@ -226,6 +252,38 @@ class TestCheckMetadataTags:
         assert findings == []
 
 
+@pytest.fixture(scope="module")
+def clean_findings_by_check(single_m4b_lib):
+    """Findings of every filesystem check on the clean library, run in parallel."""
+    checks = {
+        "tags": check_metadata_tags,
+        "duplicates": check_duplicates,
+        "structure": check_structure,
+        "sources": check_leftover_sources,
+    }
+    with (
+        patch(
+            "audiobook_pipeline.ops.audit._ffprobe_tags",
+            _fake_ffprobe_tags(GOOD_TAGS),
+        ),
+        ThreadPoolExecutor(max_workers=len(checks)) as pool,
+    ):
+        futures = {
+            name: pool.submit(check, single_m4b_lib) for name, check in checks.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+class TestCleanLibrary:
+    """All filesystem checks on one well-formed library, run side by side."""
+
+    @pytest.mark.parametrize("check", ["tags", "duplicates", "structure", "sources"])
+    def test_no_problems(self, clean_findings_by_check, check):
+        findings = clean_findings_by_check[check]
+        problems = [f for f in findings if f.severity in ("critical", "warning")]
+        assert problems == []
+
+
 # ---------------------------------------------------------------------------
 # Check 2: Duplicates
 # ---------------------------------------------------------------------------
@@ -305,20 +363,22 @@ class TestCheckDuplicates:
 
 
 class TestNormalizeForDedup:
-    def test_strips_part_suffix(self):
-        assert _normalize_for_dedup("homeland, part 1") == "homeland"
-        assert _normalize_for_dedup("homeland part 3") == "homeland"
-
-    def test_strips_asin(self):
-        assert (
-            _normalize_for_dedup("the way of kings [B00AAI79WY]") == "the way of kings"
-        )
-
-    def test_strips_unabridged(self):
-        assert (
-            _normalize_for_dedup("the way of kings (unabridged)") == "the way of kings"
-        )
-        assert _normalize_for_dedup("the way of kings (Abridged)") == "the way of kings"
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("homeland, part 1", "homeland"),
+            ("homeland part 3", "homeland"),
+            ("the way of kings [B00AAI79WY]", "the way of kings"),
+            ("the way of kings (unabridged)", "the way of kings"),
+            ("the way of kings (Abridged)", "the way of kings"),
+            ("the rhythm of rivalry - book 1", "the rhythm of rivalry"),
+            ("book 3 - homeland", "homeland"),
+            ("3 - homeland", "homeland"),
+            ("The Way of Kings", "the way of kings"),
+        ],
+    )
+    def test_normalizes(self, raw: str, expected: str):
+        assert _normalize_for_dedup(raw) == expected
 
     def test_strips_author_prefix(self):
         result = _normalize_for_dedup(
@@ -327,51 +387,44 @@ class TestNormalizeForDedup:
         assert "rhythm of rivalry" in result
         assert "narro" not in result
 
-    def test_strips_book_n_suffix(self):
-        assert (
-            _normalize_for_dedup("the rhythm of rivalry - book 1")
-            == "the rhythm of rivalry"
-        )
-
-    def test_strips_series_prefix(self):
-        assert _normalize_for_dedup("book 3 - homeland") == "homeland"
-        assert _normalize_for_dedup("3 - homeland") == "homeland"
-
-    def test_basic_normalization(self):
-        assert _normalize_for_dedup("The Way of Kings") == "the way of kings"
-
 
 class TestNormalizeAuthor:
-    def test_strips_periods(self):
-        assert _normalize_author("R.A. Salvatore") == "ra salvatore"
-
-    def test_period_spacing_variations(self):
-        # R.A. Salvatore, R. A. Salvatore, R.A Salvatore all normalize the same
-        a = _normalize_author("R.A. Salvatore")
-        b = _normalize_author("R. A. Salvatore")
-        c = _normalize_author("R.A Salvatore")
-        assert a == b == c
-
-    def test_and_ampersand_equivalence(self):
-        a = _normalize_author("Margaret Weis & Tracy Hickman")
-        b = _normalize_author("Margaret Weis and Tracy Hickman")
-        assert a == b
-
-    def test_edited_by_prefix(self):
-        assert _normalize_author("Edited by John Smith") == "john smith"
-
-    def test_whitespace_collapse(self):
-        assert _normalize_author("  John   Smith  ") == "john smith"
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("R.A. Salvatore", "ra salvatore"),
+            ("Edited by John Smith", "john smith"),
+            ("  John   Smith  ", "john smith"),
+        ],
+    )
+    def test_normalizes(self, raw: str, expected: str):
+        assert _normalize_author(raw) == expected
+
+    @pytest.mark.parametrize(
+        "variants",
+        [
+            # Period spacing variations
+            ("R.A. Salvatore", "R. A. Salvatore", "R.A Salvatore"),
+            # "and" / "&" equivalence
+            ("Margaret Weis & Tracy Hickman", "Margaret Weis and Tracy Hickman"),
+        ],
+    )
+    def test_equivalent_spellings(self, variants: tuple[str, ...]):
+        assert len({_normalize_author(v) for v in variants}) == 1
 
 
 class TestIsFranchiseFolder:
-    def test_known_franchises(self):
-        assert _is_franchise_folder("Dragonlance") is True
-        assert _is_franchise_folder("Forgotten Realms") is True
-        assert _is_franchise_folder("Star Wars") is True
-
-    def test_not_franchise(self):
-        assert _is_franchise_folder("Brandon Sanderson") is False
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("Dragonlance", True),
+            ("Forgotten Realms", True),
+            ("Star Wars", True),
+            ("Brandon Sanderson", False),
+        ],
+    )
+    def test_is_franchise_folder(self, name: str, expected: bool):
+        assert _is_franchise_folder(name) is expected
 
 
 # ---------------------------------------------------------------------------
@@ -492,9 +545,8 @@ class TestCheckLeftoverSources:
 
 
 class TestCheckStalePlex:
-    def test_no_token_skips(self, tmp_path):
-        lib = _make_library(tmp_path, {"Author/Book/book.m4b": b"\x00"})
-        findings = check_stale_plex(lib, plex_token="")
+    def test_no_token_skips(self, single_m4b_lib):
+        findings = check_stale_plex(single_m4b_lib, plex_token="")
         assert len(findings) == 1
         assert "Skipped" in findings[0].message
 
@@ -505,6 +557,30 @@ class TestCheckStalePlex:
 
 
 class TestApplyFixes:
+    # Findings are only read by apply_fixes, so one instance serves every test
+    DELETE_LEFTOVER = AuditFinding(
+        check="sources",
+        severity="warning",
+        path="Author/Book/leftover.mp3",
+        message="Leftover",
+        fixable=True,
+        fix_action="delete",
+    )
+    TOUCH_STALE = AuditFinding(
+        check="stale",
+        severity="warning",
+        path="Author/Book/book.m4b",
+        message="Stale",
+        fixable=True,
+        fix_action="touch",
+    )
+    MISSING_TAG = AuditFinding(
+        check="tags",
+        severity="critical",
+        path="Author/Book/book.m4b",
+        message="Missing tag",
+    )
+
     def test_delete_action(self, tmp_path):
         lib = _make_library(
             tmp_path,
@@ -513,17 +589,7 @@ class TestApplyFixes:
                 "Author/Book/leftover.mp3": b"\x00",
             },
         )
-        findings = [
-            AuditFinding(
-                check="sources",
-                severity="warning",
-                path="Author/Book/leftover.mp3",
-                message="Leftover",
-                fixable=True,
-                fix_action="delete",
-            )
-        ]
-        actions = apply_fixes(lib, findings)
+        actions = apply_fixes(lib, [self.DELETE_LEFTOVER])
         assert len(actions) == 1
         assert "Deleted" in actions[0]
         assert not (lib / "Author/Book/leftover.mp3").exists()
@@ -533,17 +599,7 @@ class TestApplyFixes:
             tmp_path,
             {"Author/Book/leftover.mp3": b"\x00"},
         )
-        findings = [
-            AuditFinding(
-                check="sources",
-                severity="warning",
-                path="Author/Book/leftover.mp3",
-                message="Leftover",
-                fixable=True,
-                fix_action="delete",
-            )
-        ]
-        actions = apply_fixes(lib, findings, dry_run=True)
+        actions = apply_fixes(lib, [self.DELETE_LEFTOVER], dry_run=True)
         assert len(actions) == 1
         assert "DRY-RUN" in actions[0]
         assert (lib / "Author/Book/leftover.mp3").exists()
@@ -553,31 +609,12 @@ class TestApplyFixes:
             tmp_path,
             {"Author/Book/book.m4b": b"\x00"},
         )
-        findings = [
-            AuditFinding(
-                check="stale",
-                severity="warning",
-                path="Author/Book/book.m4b",
-                message="Stale",
-                fixable=True,
-                fix_action="touch",
-            )
-        ]
-        actions = apply_fixes(lib, findings)
+        actions = apply_fixes(lib, [self.TOUCH_STALE])
         assert len(actions) == 1
         assert "Touched" in actions[0]
 
-    def test_skips_non_fixable(self, tmp_path):
-        lib = _make_library(tmp_path, {"Author/Book/book.m4b": b"\x00"})
-        findings = [
-            AuditFinding(
-                check="tags",
-                severity="critical",
-                path="Author/Book/book.m4b",
-                message="Missing tag",
-            )
-        ]
-        actions = apply_fixes(lib, findings)
+    def test_skips_non_fixable(self, single_m4b_lib):
+        actions = apply_fixes(single_m4b_lib, [self.MISSING_TAG])
         assert len(actions) == 0
 
 
@@ -587,12 +624,9 @@ class TestApplyFixes:
 
 
 class TestRunAudit:
-    def test_runs_selected_checks(self, tmp_path):
-        lib = _make_library(tmp_path, {"Author/Book/book.m4b": b"\x00"})
-        with patch(
-            "audiobook_pipeline.ops.audit._ffprobe_tags", _fake_ffprobe_tags(GOOD_TAGS)
-        ):
-            report = run_audit(lib, checks=("tags",))
+    def test_runs_selected_checks(self, single_m4b_lib, patched_ffprobe):
+        patched_ffprobe(GOOD_TAGS)
+        report = run_audit(single_m4b_lib, checks=("tags",))
         assert report.total_files == 1
         # Only tag findings, no structure/duplicate findings
         assert all(f.check == "tags" for f in report.findings)
@@ -610,36 +644,45 @@ class TestRunAudit:
 # ---------------------------------------------------------------------------
 
 
-class TestCLIAudit:
-    def test_help_output(self):
-        from click.testing import CliRunner
+@pytest.fixture(scope="module")
+def cli():
+    """One runner for the module -- invoke() keeps no state between calls."""
+    from click.testing import CliRunner
+
+    return CliRunner()
 
+
+@pytest.fixture(scope="module")
+def _silence_loguru():
+    """Drop loguru handlers once so CLI stdout stays clean for JSON parsing."""
+    from loguru import logger
+
+    logger.remove()
+
+
+class TestCLIAudit:
+    def test_help_output(self, cli):
         from audiobook_pipeline.cli_audit import main
 
-        runner = CliRunner()
-        result = runner.invoke(main, ["--help"])
+        result = cli.invoke(main, ["--help"])
         assert result.exit_code == 0
         assert "Audit an audiobook library" in result.output
         assert "--fix" in result.output
         assert "--check" in result.output
 
-    def test_json_output(self, tmp_path, monkeypatch):
-        from click.testing import CliRunner
-        from loguru import logger
-
+    def test_json_output(
+        self, cli, single_m4b_lib, monkeypatch, patched_ffprobe, _silence_loguru
+    ):
         from audiobook_pipeline.cli_audit import main
 
-        lib = _make_library(tmp_path, {"Author/Book/book.m4b": b"\x00"})
         monkeypatch.setattr("audiobook_pipeline.cli._find_config_file", lambda: None)
-        monkeypatch.chdir(tmp_path)
-
-        # Suppress loguru to keep stdout clean for JSON parsing
-        logger.remove()
-        with patch(
-            "audiobook_pipeline.ops.audit._ffprobe_tags", _fake_ffprobe_tags(GOOD_TAGS)
-        ):
-            runner = CliRunner()
-            result = runner.invoke(main, [str(lib), "--json-output", "--check", "tags"])
+        # The CLI writes .reports/ under cwd; keep it out of the shared library
+        monkeypatch.chdir(single_m4b_lib.parent)
+        patched_ffprobe(GOOD_TAGS)
+
+        result = cli.invoke(
+            main, [str(single_m4b_lib), "--json-output", "--check", "tags"]
+        )
 
         assert result.exit_code == 0, result.output + str(result.exception or "")
         # Extract JSON from output (skip any non-JSON prefix lines)
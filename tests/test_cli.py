@@ -29,60 +29,64 @@ def _no_env_file(monkeypatch):
     monkeypatch.setattr("audiobook_pipeline.cli._find_config_file", lambda: None)
 
 
+@pytest.fixture(scope="module")
+def cli() -> CliRunner:
+    """One runner for the module -- invoke() keeps no state between calls."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="module")
+def main_help(cli):
+    """`--help` output, rendered once for every test that inspects it."""
+    return cli.invoke(main, ["--help"])
+
+
 class TestHelpOutput:
-    def test_help_flag(self):
-        runner = CliRunner()
-        result = runner.invoke(main, ["--help"])
-        assert result.exit_code == 0
-        assert "Convert, enrich, and organize" in result.output
-        assert "--mode" in result.output
-        assert "--dry-run" in result.output
-        assert "--asin" in result.output
-
-    def test_mode_choices(self):
-        runner = CliRunner()
-        result = runner.invoke(main, ["--help"])
-        assert "convert" in result.output
-        assert "enrich" in result.output
-        assert "metadata" in result.output
-        assert "organize" in result.output
+    def test_help_flag(self, main_help):
+        assert main_help.exit_code == 0
+        assert "Convert, enrich, and organize" in main_help.output
+        assert "--mode" in main_help.output
+        assert "--dry-run" in main_help.output
+        assert "--asin" in main_help.output
+
+    def test_mode_choices(self, main_help):
+        assert "convert" in main_help.output
+        assert "enrich" in main_help.output
+        assert "metadata" in main_help.output
+        assert "organize" in main_help.output
 
 
 class TestModeAutoDetect:
     @patch("audiobook_pipeline.cli.PipelineRunner")
-    def test_directory_defaults_to_convert(self, mock_runner_cls, tmp_path):
-        runner = CliRunner()
-        result = runner.invoke(main, [str(tmp_path), "--dry-run"])
+    def test_directory_defaults_to_convert(self, mock_runner_cls, tmp_path, cli):
+        result = cli.invoke(main, [str(tmp_path), "--dry-run"])
         assert result.exit_code == 0, result.output + str(result.exception or "")
         mode_arg = mock_runner_cls.call_args.kwargs.get("mode")
         assert mode_arg == PipelineMode.CONVERT
 
     @patch("audiobook_pipeline.cli.PipelineRunner")
-    def test_m4b_file_defaults_to_enrich(self, mock_runner_cls, tmp_path):
+    def test_m4b_file_defaults_to_enrich(self, mock_runner_cls, tmp_path, cli):
         m4b = tmp_path / "book.m4b"
         m4b.write_bytes(b"\x00")
-        runner = CliRunner()
-        result = runner.invoke(main, [str(m4b), "--dry-run"])
+        result = cli.invoke(main, [str(m4b), "--dry-run"])
         assert result.exit_code == 0, result.output + str(result.exception or "")
         mode_arg = mock_runner_cls.call_args.kwargs.get("mode")
         assert mode_arg == PipelineMode.ENRICH
 
-    def test_unknown_extension_fails(self, tmp_path):
+    def test_unknown_extension_fails(self, tmp_path, cli):
         txt = tmp_path / "notes.txt"
         txt.write_text("hello")
-        runner = CliRunner()
-        result = runner.invoke(main, [str(txt)])
+        result = cli.invoke(main, [str(txt)])
         assert result.exit_code != 0
         assert "Cannot auto-detect mode" in result.output
 
 
 class TestDryRun:
     @patch("audiobook_pipeline.cli.PipelineRunner")
-    def test_dry_run_sets_config(self, mock_runner_cls, tmp_path, monkeypatch):
+    def test_dry_run_sets_config(self, mock_runner_cls, tmp_path, monkeypatch, cli):
         """--dry-run flag propagates to PipelineConfig."""
         monkeypatch.delenv("DRY_RUN", raising=False)
-        runner = CliRunner()
-        result = runner.invoke(main, [str(tmp_path), "--dry-run"])
+        result = cli.invoke(main, [str(tmp_path), "--dry-run"])
         assert result.exit_code == 0, result.output + str(result.exception or "")
         config = mock_runner_cls.call_args.kwargs.get("config")
         assert config.dry_run is True
@@ -90,40 +94,60 @@ class TestDryRun:
 
 class TestLevelFlag:
     @patch("audiobook_pipeline.cli.PipelineRunner")
-    def test_level_flag_overrides_config(self, mock_runner_cls, tmp_path, monkeypatch):
+    def test_level_flag_overrides_config(
+        self, mock_runner_cls, tmp_path, monkeypatch, cli
+    ):
         monkeypatch.delenv("PIPELINE_LEVEL", raising=False)
-        runner = CliRunner()
-        result = runner.invoke(main, [str(tmp_path), "--level", "simple", "--dry-run"])
+        result = cli.invoke(main, [str(tmp_path), "--level", "simple", "--dry-run"])
         assert result.exit_code == 0, result.output + str(result.exception or "")
         config = mock_runner_cls.call_args.kwargs.get("config")
         assert config.pipeline_level == "simple"
 
     @patch("audiobook_pipeline.cli.PipelineRunner")
-    def test_reorganize_forces_ai_level(self, mock_runner_cls, tmp_path, monkeypatch):
+    def test_reorganize_forces_ai_level(
+        self, mock_runner_cls, tmp_path, monkeypatch, cli
+    ):
         monkeypatch.delenv("PIPELINE_LEVEL", raising=False)
-        runner = CliRunner()
-        result = runner.invoke(main, [str(tmp_path), "--reorganize", "--dry-run"])
+        result = cli.invoke(main, [str(tmp_path), "--reorganize", "--dry-run"])
         assert result.exit_code == 0, result.output + str(result.exception or "")
         config = mock_runner_cls.call_args.kwargs.get("config")
         # --reorganize forces level to "ai" or "full"
         assert config.pipeline_level in ("ai", "full")
 
     @patch("audiobook_pipeline.cli.PipelineRunner")
-    def test_ai_all_forces_ai_level(self, mock_runner_cls, tmp_path, monkeypatch):
+    def test_ai_all_forces_ai_level(self, mock_runner_cls, tmp_path, monkeypatch, cli):
         monkeypatch.delenv("PIPELINE_LEVEL", raising=False)
-        runner = CliRunner()
-        result = runner.invoke(main, [str(tmp_path), "--ai-all", "--dry-run"])
+        result = cli.invoke(main, [str(tmp_path), "--ai-all", "--dry-run"])
         assert result.exit_code == 0, result.output + str(result.exception or "")
         config = mock_runner_cls.call_args.kwargs.get("config")
         # --ai-all forces level to "ai" or "full"
         assert config.pipeline_level in ("ai", "full")
 
     @patch("audiobook_pipeline.cli.PipelineRunner")
-    def test_simple_level_disables_ai(self, mock_runner_cls, tmp_path, monkeypatch):
+    def test_simple_level_disables_ai(
+        self, mock_runner_cls, tmp_path, monkeypatch, cli
+    ):
         monkeypatch.delenv("PIPELINE_LEVEL", raising=False)
         monkeypatch.delenv("AI_ALL", raising=False)
-        runner = CliRunner()
-        result = runner.invoke(main, [str(tmp_path), "--level", "simple", "--dry-run"])
+        result = cli.invoke(main, [str(tmp_path), "--level", "simple", "--dry-run"])
         assert result.exit_code == 0, result.output + str(result.exception or "")
         config = mock_runner_cls.call_args.kwargs.get("config")
         assert config.ai_all is False
+
+    @patch("audiobook_pipeline.cli.PipelineRunner")
+    def test_config_built_once(self, mock_runner_cls, tmp_path, monkeypatch, cli):
+        """Level enforcement copies the config instead of re-reading env/.env."""
+        from audiobook_pipeline.config import PipelineConfig
+
+        builds = []
+
+        class _CountingConfig(PipelineConfig):
+            def __init__(self, **kwargs):
+                builds.append(kwargs)
+                super().__init__(**kwargs)
+
+        monkeypatch.setattr("audiobook_pipeline.cli.PipelineConfig", _CountingConfig)
+        result = cli.invoke(main, [str(tmp_path), "--level", "ai", "--dry-run"])
+        assert result.exit_code == 0, result.output + str(result.exception or "")
+        assert len(builds) == 1
+        assert mock_runner_cls.call_args.kwargs.get("config").ai_all is True
@@ -1,16 +1,26 @@
 """Tests for file locking and disk space checks."""
 
+import os
 from unittest.mock import patch
 
 import pytest
 
 from audiobook_pipeline.concurrency import (
     LockError,
+    _dir_size,
     acquire_global_lock,
     check_disk_space,
+    clear_disk_cache,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_disk_cache():
+    clear_disk_cache()
+    yield
+    clear_disk_cache()
+
+
 class TestAcquireGlobalLock:
     def test_skip_returns_none(self, tmp_path):
         assert acquire_global_lock(tmp_path, skip=True) is None
@@ -40,11 +50,12 @@ class TestAcquireGlobalLock:
 
 
 class TestCheckDiskSpace:
-    def test_sufficient_space(self, tmp_path):
+    @pytest.mark.parametrize("kwargs", [{}, {"multiplier": 1}])
+    def test_sufficient_space(self, tmp_path, kwargs):
         source = tmp_path / "source.mp3"
         source.write_bytes(b"x" * 1000)
         # tmp_path should have plenty of space
-        assert check_disk_space(source, tmp_path) is True
+        assert check_disk_space(source, tmp_path, **kwargs) is True
 
     def test_insufficient_space(self, tmp_path):
         source = tmp_path / "source.mp3"
@@ -61,8 +72,60 @@ class TestCheckDiskSpace:
         (src_dir / "ch2.mp3").write_bytes(b"x" * 500)
         assert check_disk_space(src_dir, tmp_path) is True
 
-    def test_custom_multiplier(self, tmp_path):
+    def test_dir_size_counts_nested_files_once(self, tmp_path):
+        src_dir = tmp_path / "book"
+        (src_dir / "disc1").mkdir(parents=True)
+        (src_dir / "ch1.mp3").write_bytes(b"x" * 500)
+        (src_dir / "disc1" / "ch2.mp3").write_bytes(b"x" * 300)
+        (src_dir / "alias").symlink_to(src_dir / "disc1", target_is_directory=True)
+        assert _dir_size(src_dir) == 800
+
+    @pytest.mark.skipif(os.geteuid() == 0, reason="root ignores directory modes")
+    def test_dir_size_skips_unreadable_subdir(self, tmp_path):
+        src_dir = tmp_path / "book"
+        locked = src_dir / "locked"
+        locked.mkdir(parents=True)
+        (src_dir / "ch1.mp3").write_bytes(b"x" * 500)
+        (locked / "ch2.mp3").write_bytes(b"x" * 300)
+        locked.chmod(0o000)
+        try:
+            assert _dir_size(src_dir) == 500
+        finally:
+            locked.chmod(0o755)
+
+    def test_dir_size_skips_scandir_errors(self, tmp_path, monkeypatch):
+        src_dir = tmp_path / "book"
+        locked = src_dir / "locked"
+        locked.mkdir(parents=True)
+        (src_dir / "ch1.mp3").write_bytes(b"x" * 500)
+        (locked / "ch2.mp3").write_bytes(b"x" * 300)
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if path == str(locked):
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        monkeypatch.setattr("audiobook_pipeline.concurrency.os.scandir", scandir)
+        assert _dir_size(src_dir) == 500
+
+    def test_dir_size_missing_path_is_zero(self, tmp_path):
+        assert _dir_size(tmp_path / "gone") == 0
+
+    def test_free_space_reused_within_ttl(self, tmp_path, monkeypatch):
         source = tmp_path / "source.mp3"
-        source.write_bytes(b"x" * 1000)
-        # With multiplier=1, need less space
-        assert check_disk_space(source, tmp_path, multiplier=1) is True
+        source.write_bytes(b"x" * 10)
+        fake_usage = type("Usage", (), {"free": 10**9, "total": 0, "used": 0})()
+        clock = [100.0]
+        monkeypatch.setattr(
+            "audiobook_pipeline.concurrency.time.monotonic", lambda: clock[0]
+        )
+        with patch(
+            "audiobook_pipeline.concurrency.shutil.disk_usage", return_value=fake_usage
+        ) as mock_usage:
+            check_disk_space(source, tmp_path)
+            check_disk_space(source, tmp_path)
+            assert mock_usage.call_count == 1
+            clock[0] += 10
+            check_disk_space(source, tmp_path)
+            assert mock_usage.call_count == 2
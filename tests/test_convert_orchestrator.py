@@ -57,3 +57,26 @@ class TestConvertOrchestrator:
         pct = orch._cpu_load_pct()
         assert isinstance(pct, float)
         assert pct >= 0
+
+    def test_cpu_load_pct_primes_then_samples_without_blocking(self, tmp_path):
+        config = self._make_config(tmp_path)
+        orch = ConvertOrchestrator(config)
+        clock = [100.0]
+        with patch(
+            "audiobook_pipeline.convert_orchestrator.time.monotonic",
+            side_effect=lambda: clock[0],
+        ), patch(
+            "audiobook_pipeline.convert_orchestrator.psutil.cpu_percent",
+            side_effect=[10.0, 60.0],
+        ) as mock_pct:
+            # First call blocks once to prime the baseline
+            assert orch._cpu_load_pct() == 10.0
+            assert mock_pct.call_args.kwargs == {"interval": 1.0}
+            # Inside the minimum window: last reading reused, no sample
+            clock[0] += 0.2
+            assert orch._cpu_load_pct() == 10.0
+            assert mock_pct.call_count == 1
+            # Window elapsed: non-blocking sample
+            clock[0] += 2.0
+            assert orch._cpu_load_pct() == 60.0
+            assert mock_pct.call_args.kwargs == {"interval": None}
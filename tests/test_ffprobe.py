@@ -1,17 +1,25 @@
 """Tests for ffprobe subprocess wrappers."""
 
+import json
 import subprocess
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from audiobook_pipeline.ffprobe import (
+    _run_ffprobe,
+    clear_cache,
     count_chapters,
     duration_to_timestamp,
     get_bitrate,
     get_channels,
     get_codec,
     get_duration,
+    get_format_name,
     get_sample_rate,
+    get_tags,
+    probe,
     validate_audio_file,
 )
 
@@ -22,67 +30,117 @@ def _mock_result(stdout: str = "", returncode: int = 0) -> subprocess.CompletedP
     )
 
 
-class TestGetDuration:
-    @patch("audiobook_pipeline.ffprobe._run_ffprobe")
-    def test_parses_float(self, mock_run):
-        mock_run.return_value = _mock_result("123.456\n")
-        assert get_duration(Path("test.mp3")) == 123.456
+def _probe_json(format: dict | None = None, stream: dict | None = None) -> str:
+    """ffprobe -show_format -show_streams JSON with one audio stream."""
+    return json.dumps(
+        {"format": format or {}, "streams": [stream] if stream else []}
+    )
 
-    @patch("audiobook_pipeline.ffprobe._run_ffprobe")
-    def test_empty_output_raises(self, mock_run):
-        import pytest
-        mock_run.return_value = _mock_result("")
-        with pytest.raises(ValueError, match="empty duration"):
-            get_duration(Path("test.mp3"))
 
+@pytest.fixture(autouse=True)
+def _clear_probe_cache():
+    clear_cache()
+    yield
+    clear_cache()
 
-class TestGetBitrate:
-    @patch("audiobook_pipeline.ffprobe._run_ffprobe")
-    def test_parses_int(self, mock_run):
-        mock_run.return_value = _mock_result("128000\n")
-        assert get_bitrate(Path("test.mp3")) == 128000
 
+class TestGetters:
+    @pytest.mark.parametrize(
+        "getter,fmt,stream,expected",
+        [
+            (get_duration, {"duration": "123.456"}, None, 123.456),
+            (get_bitrate, {"bit_rate": "128000"}, None, 128000),
+            (get_codec, None, {"codec_name": "aac"}, "aac"),
+            (get_channels, None, {"channels": 2}, 2),
+            (get_sample_rate, None, {"sample_rate": "44100"}, 44100),
+        ],
+    )
+    @patch("audiobook_pipeline.ffprobe._run_ffprobe")
+    def test_parses(self, mock_run, getter, fmt, stream, expected):
+        mock_run.return_value = _mock_result(_probe_json(fmt, stream))
+        assert getter(Path("test.mp3")) == expected
+
+    @pytest.mark.parametrize(
+        "getter,message",
+        [
+            (get_duration, "empty duration"),
+            (get_bitrate, "empty bitrate"),
+            (get_channels, "empty channel count"),
+            (get_sample_rate, "empty sample rate"),
+        ],
+    )
     @patch("audiobook_pipeline.ffprobe._run_ffprobe")
-    def test_empty_output_raises(self, mock_run):
-        import pytest
-        mock_run.return_value = _mock_result("")
-        with pytest.raises(ValueError, match="empty bitrate"):
-            get_bitrate(Path("test.mp3"))
+    def test_empty_output_raises(self, mock_run, getter, message):
+        mock_run.return_value = _mock_result(_probe_json())
+        with pytest.raises(ValueError, match=message):
+            getter(Path("test.mp3"))
 
+    @patch("audiobook_pipeline.ffprobe._run_ffprobe")
+    def test_ffprobe_failure_raises(self, mock_run):
+        mock_run.return_value = _mock_result(returncode=1)
+        with pytest.raises(ValueError, match="empty duration"):
+            get_duration(Path("test.mp3"))
 
-class TestGetCodec:
     @patch("audiobook_pipeline.ffprobe._run_ffprobe")
-    def test_parses_string(self, mock_run):
-        mock_run.return_value = _mock_result("aac\n")
-        assert get_codec(Path("test.mp3")) == "aac"
+    def test_no_audio_stream(self, mock_run):
+        mock_run.return_value = _mock_result(_probe_json())
+        assert get_codec(Path("test.mp3")) == ""
 
 
-class TestGetChannels:
-    @patch("audiobook_pipeline.ffprobe._run_ffprobe")
-    def test_parses_int(self, mock_run):
-        mock_run.return_value = _mock_result("2\n")
-        assert get_channels(Path("test.mp3")) == 2
+class TestRunFfprobe:
+    @patch("audiobook_pipeline.ffprobe.subprocess.run")
+    def test_spawn_friendly_arguments(self, mock_run, monkeypatch):
+        monkeypatch.setattr(
+            "audiobook_pipeline.ffprobe._ffprobe_bin", lambda: "/usr/bin/ffprobe"
+        )
+        mock_run.return_value = _mock_result()
+        _run_ffprobe(["test.mp3"])
+        cmd = mock_run.call_args.args[0]
+        assert cmd[:3] == ["/usr/bin/ffprobe", "-v", "error"]
+        assert mock_run.call_args.kwargs["close_fds"] is False
 
-    @patch("audiobook_pipeline.ffprobe._run_ffprobe")
-    def test_empty_output_raises(self, mock_run):
-        import pytest
-        mock_run.return_value = _mock_result("")
-        with pytest.raises(ValueError, match="empty channel count"):
-            get_channels(Path("test.mp3"))
 
+class TestProbeCache:
+    @patch("audiobook_pipeline.ffprobe._run_ffprobe")
+    def test_getters_share_one_probe(self, mock_run, tmp_path):
+        f = tmp_path / "book.m4b"
+        f.write_bytes(b"fake")
+        mock_run.return_value = _mock_result(
+            _probe_json(
+                {"duration": "60.0", "bit_rate": "64000", "format_name": "mov,mp4"},
+                {"codec_name": "aac", "channels": 1, "sample_rate": "44100"},
+            )
+        )
+        assert get_duration(f) == 60.0
+        assert get_bitrate(f) == 64000
+        assert get_codec(f) == "aac"
+        assert get_channels(f) == 1
+        assert get_sample_rate(f) == 44100
+        assert get_format_name(f) == "mov,mp4"
+        assert count_chapters(f) == 0
+        assert get_tags(f) == {}
+        assert mock_run.call_count == 1
 
-class TestGetSampleRate:
     @patch("audiobook_pipeline.ffprobe._run_ffprobe")
-    def test_parses_int(self, mock_run):
-        mock_run.return_value = _mock_result("44100\n")
-        assert get_sample_rate(Path("test.mp3")) == 44100
+    def test_modified_file_is_reprobed(self, mock_run, tmp_path):
+        f = tmp_path / "book.m4b"
+        f.write_bytes(b"fake")
+        mock_run.return_value = _mock_result(_probe_json({"duration": "1.0"}))
+        get_duration(f)
+        f.write_bytes(b"rewritten")
+        get_duration(f)
+        assert mock_run.call_count == 2
 
     @patch("audiobook_pipeline.ffprobe._run_ffprobe")
-    def test_empty_output_raises(self, mock_run):
-        import pytest
-        mock_run.return_value = _mock_result("")
-        with pytest.raises(ValueError, match="empty sample rate"):
-            get_sample_rate(Path("test.mp3"))
+    def test_failures_not_cached(self, mock_run, tmp_path):
+        f = tmp_path / "book.m4b"
+        f.write_bytes(b"fake")
+        mock_run.side_effect = [
+            _mock_result(returncode=1),
+            _mock_result(_probe_json({"duration": "1.0"})),
+        ]
+        assert probe(f) == {}
+        assert get_duration(f) == 1.0
 
 
 class TestValidateAudioFile:
@@ -93,18 +151,28 @@ class TestValidateAudioFile:
     @patch("audiobook_pipeline.ffprobe._run_ffprobe")
     def test_valid_file(self, mock_run, mock_codec, tmp_path):
         f = tmp_path / "test.mp3"
-        f.write_bytes(b"fake")
-        mock_run.return_value = _mock_result()
+        f.write_bytes(b"fake" * 512)
+        mock_run.return_value = _mock_result(_probe_json())
         mock_codec.return_value = "mp3"
         assert validate_audio_file(f) is True
 
     @patch("audiobook_pipeline.ffprobe._run_ffprobe")
     def test_ffprobe_fails(self, mock_run, tmp_path):
         f = tmp_path / "test.mp3"
-        f.write_bytes(b"fake")
+        f.write_bytes(b"fake" * 512)
         mock_run.return_value = _mock_result(returncode=1)
         assert validate_audio_file(f) is False
 
+    @patch("audiobook_pipeline.ffprobe._run_ffprobe")
+    def test_tiny_file_skips_ffprobe(self, mock_run, tmp_path):
+        f = tmp_path / "test.mp3"
+        f.write_bytes(b"fake")
+        assert validate_audio_file(f) is False
+        mock_run.assert_not_called()
+
+    def test_directory(self, tmp_path):
+        assert validate_audio_file(tmp_path) is False
+
 
 class TestDurationToTimestamp:
     def test_zero(self):
@@ -118,24 +186,38 @@ class TestDurationToTimestamp:
 
 
 class TestCountChapters:
-    @patch("subprocess.run")
+    @patch("audiobook_pipeline.ffprobe._run_ffprobe")
     def test_with_chapters(self, mock_run):
         mock_run.return_value = _mock_result(
             '{"chapters": [{"id": 0}, {"id": 1}, {"id": 2}]}'
         )
         assert count_chapters(Path("test.m4b")) == 3
 
-    @patch("subprocess.run")
+    @patch("audiobook_pipeline.ffprobe._run_ffprobe")
     def test_no_chapters(self, mock_run):
         mock_run.return_value = _mock_result('{"chapters": []}')
         assert count_chapters(Path("test.mp3")) == 0
 
-    @patch("subprocess.run")
+    @patch("audiobook_pipeline.ffprobe._run_ffprobe")
     def test_ffprobe_error(self, mock_run):
         mock_run.return_value = _mock_result(returncode=1)
         assert count_chapters(Path("test.mp3")) == 0
 
-    @patch("subprocess.run")
+    @patch("audiobook_pipeline.ffprobe._run_ffprobe")
     def test_invalid_json(self, mock_run):
         mock_run.return_value = _mock_result("not json")
         assert count_chapters(Path("test.mp3")) == 0
+
+
+class TestGetTags:
+    @patch("audiobook_pipeline.ffprobe._run_ffprobe")
+    def test_lowercases_keys(self, mock_run):
+        mock_run.return_value = _mock_result(
+            _probe_json({"tags": {"ARTIST": "Author", "album": "Book"}})
+        )
+        assert get_tags(Path("test.m4b")) == {"artist": "Author", "album": "Book"}
+
+    @patch("audiobook_pipeline.ffprobe._run_ffprobe")
+    def test_ffprobe_error(self, mock_run):
+        mock_run.return_value = _mock_result(returncode=1)
+        assert get_tags(Path("test.m4b")) == {}
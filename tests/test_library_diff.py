@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -23,16 +24,57 @@ from audiobook_pipeline.ops.library_diff import (
 def _make_library(tmp_path: Path, name: str, structure: dict[str, bytes]) -> Path:
     """Create a mock library directory structure.
 
-    Keys are relative paths, values are file contents.
+    Keys are relative paths, values are file contents. Files with the same
+    content are hardlinks to the first one written (compare_libraries only
+    looks at paths), so each distinct payload is written once.
     """
     lib = tmp_path / name
-    for rel_path, content in structure.items():
-        full = lib / rel_path
-        full.parent.mkdir(parents=True, exist_ok=True)
-        full.write_bytes(content)
+    files = {lib / rel_path: content for rel_path, content in structure.items()}
+    # One makedirs per distinct directory, not per file
+    for parent in {full.parent for full in files}:
+        os.makedirs(parent, exist_ok=True)
+    written: dict[bytes, Path] = {}
+    for full, content in files.items():
+        if content in written:
+            os.link(written[content], full)
+        else:
+            full.write_bytes(content)
+            written[content] = full
     return lib
 
 
+# ---------------------------------------------------------------------------
+# Library scan
+# ---------------------------------------------------------------------------
+
+
+class TestExtractBooks:
+    def test_sorted_by_path_across_top_level_folders(self, tmp_path):
+        lib = _make_library(
+            tmp_path,
+            "source",
+            {
+                "Zed/Book/Book.m4b": b"\x00",
+                "Anne Rice/Book/Book.m4b": b"\x00",
+                "Anne/Book/Book.m4b": b"\x00",
+                "Anne/Book/notes.txt": b"\x00",
+                "root.m4b": b"\x00",
+            },
+        )
+        paths = [e.path for e in _extract_books(lib)]
+        # Path ordering compares components, so "Anne/" sorts before "Anne Rice/"
+        assert paths == [
+            "Anne/Book/Book.m4b",
+            "Anne Rice/Book/Book.m4b",
+            "Zed/Book/Book.m4b",
+        ]
+
+    def test_does_not_follow_symlinked_dirs(self, tmp_path):
+        lib = _make_library(tmp_path, "source", {"Author/Book/Book.m4b": b"\x00"})
+        (lib / "Alias").symlink_to(lib / "Author", target_is_directory=True)
+        assert [e.path for e in _extract_books(lib)] == ["Author/Book/Book.m4b"]
+
+
 # ---------------------------------------------------------------------------
 # Multi-part grouping
 # ---------------------------------------------------------------------------
@@ -1,10 +1,14 @@
 """Tests for library_index.py -- in-memory library index for batch operations."""
 
+import os
+import time
 from pathlib import Path
 
 import pytest
 
+from audiobook_pipeline import library_index
 from audiobook_pipeline.library_index import LibraryIndex
+from audiobook_pipeline.pipeline_db import PipelineDB
 
 
 @pytest.fixture
@@ -68,6 +72,23 @@ class TestLibraryIndexBuild:
         # Stephen King, The Shining, _unsorted, Random Book = 8
         assert index.folder_count == 8
 
+    def test_skips_hidden_and_housekeeping_dirs(self, library_tree):
+        for name in (".Trash-1000", "@eaDir"):
+            (library_tree / name / "sub").mkdir(parents=True)
+            (library_tree / name / "sub" / "junk.m4b").write_text("x")
+        index = LibraryIndex(library_tree)
+        assert index.folder_count == 8
+        assert index.file_count == 4
+
+    def test_symlinked_folder_indexed_not_descended(self, library_tree):
+        (library_tree / "Alias").symlink_to(
+            library_tree / "Stephen King", target_is_directory=True
+        )
+        index = LibraryIndex(library_tree)
+        assert index.folder_count == 9
+        assert index.file_count == 4
+        assert index.reuse_existing(library_tree, "Alias") == "Alias"
+
 
 class TestReuseExisting:
     """Test O(1) folder name lookup."""
@@ -95,6 +116,25 @@ class TestReuseExisting:
         result = index.reuse_existing(lib, "Title")
         assert result == "Title (2014)"
 
+    @pytest.mark.parametrize("name", ["Good Omens", "Good Omens (2019)", "Good Omens!"])
+    def test_exact_name_wins_over_normalized_collision(self, tmp_path, name):
+        """Siblings sharing a normalized key each resolve to themselves."""
+        lib = tmp_path / "lib"
+        lib.mkdir()
+        for folder in ("Good Omens", "Good Omens (2019)", "Good Omens!"):
+            (lib / folder).mkdir()
+        index = LibraryIndex(lib)
+        assert index.reuse_existing(lib, name) == name
+
+    def test_exact_name_wins_for_registered_folder(self, tmp_path):
+        lib = tmp_path / "lib"
+        lib.mkdir()
+        (lib / "Good Omens").mkdir()
+        index = LibraryIndex(lib)
+        index.register_new_folder(lib, "Good Omens (2019)")
+        assert index.reuse_existing(lib, "Good Omens") == "Good Omens"
+        assert index.reuse_existing(lib, "Good Omens (2019)") == "Good Omens (2019)"
+
     def test_no_match_returns_desired(self, library_tree):
         index = LibraryIndex(library_tree)
         result = index.reuse_existing(library_tree, "New Author Name")
@@ -211,3 +251,91 @@ class TestIsCorrectlyPlaced:
         dest = library_tree / "other" / "book.m4b"
         # Should not raise, just return False
         assert index.is_correctly_placed(source, dest) is False
+
+
+class TestIndexSnapshot:
+    """Incremental rebuild from the PipelineDB directory snapshot."""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        pdb = PipelineDB(tmp_path / "state.db")
+        yield pdb
+        pdb.close()
+
+    @pytest.fixture
+    def settled_tree(self, library_tree):
+        """library_tree with every dir mtime an hour old (outside racy window)."""
+        past = time.time() - 3600
+        for dirpath, _, _ in os.walk(library_tree):
+            os.utime(dirpath, (past, past))
+        return library_tree
+
+    @pytest.fixture
+    def listings(self, monkeypatch):
+        """Record which directories are actually read."""
+        seen = []
+        real = library_index._list_dir
+
+        def counting(top):
+            seen.append(top)
+            return real(top)
+
+        monkeypatch.setattr(library_index, "_list_dir", counting)
+        return seen
+
+    def test_unchanged_tree_reuses_snapshot(self, settled_tree, db, listings):
+        first = LibraryIndex(settled_tree, db=db)
+        assert len(listings) == 9
+        listings.clear()
+        second = LibraryIndex(settled_tree, db=db)
+        assert listings == []
+        assert second.folder_count == first.folder_count == 8
+        assert second.file_count == 4
+        assert second.reuse_existing(settled_tree, "Stephen King") == "Stephen King"
+
+    def test_changed_dir_is_rescanned(self, settled_tree, db, listings):
+        LibraryIndex(settled_tree, db=db)
+        listings.clear()
+        shining = settled_tree / "Stephen King" / "The Shining"
+        (shining / "extra.m4b").write_text("audio")
+        index = LibraryIndex(settled_tree, db=db)
+        assert listings == [str(shining)]
+        assert index.file_exists(shining, "extra.m4b")
+        assert index.file_count == 5
+
+    def test_recent_dirs_not_trusted(self, library_tree, db, listings):
+        """Dirs modified within the racy window are always re-read."""
+        LibraryIndex(library_tree, db=db)
+        listings.clear()
+        LibraryIndex(library_tree, db=db)
+        assert len(listings) == 9
+
+    def test_racy_snapshot_entry_is_rescanned(self, settled_tree, db, listings):
+        """A listing saved within _RACY_NS of the dir's mtime is never reused.
+
+        Simulates a coarse-mtime filesystem: an entry added after the scan
+        leaves the dir mtime unchanged, so only the racy check catches it.
+        """
+        shining = settled_tree / "Stephen King" / "The Shining"
+        now_ns = time.time_ns()
+        os.utime(shining, ns=(now_ns, now_ns))
+        LibraryIndex(settled_tree, db=db)
+        listings.clear()
+
+        (shining / "extra.m4b").write_text("audio")
+        os.utime(shining, ns=(now_ns, now_ns))
+        index = LibraryIndex(settled_tree, db=db)
+
+        assert listings == [str(shining)]
+        assert index.file_exists(shining, "extra.m4b")
+
+    def test_removed_dirs_dropped(self, settled_tree, db):
+        LibraryIndex(settled_tree, db=db)
+        unsorted = settled_tree / "_unsorted"
+        (unsorted / "Random Book" / "random.m4b").unlink()
+        (unsorted / "Random Book").rmdir()
+        index = LibraryIndex(settled_tree, db=db)
+        assert index.folder_count == 7
+        assert str(unsorted / "Random Book") not in db.get_library_dirs(
+            str(settled_tree)
+        )
@@ -13,6 +13,9 @@ class TestSetupLogging:
     def setup_method(self):
         logger.remove()
 
+    def teardown_method(self):
+        logger.remove()  # stop the enqueued sink's writer thread
+
     def test_setup_creates_log_dir(self, tmp_path, monkeypatch):
         for var in ["WORK_DIR", "MANIFEST_DIR", "OUTPUT_DIR", "LOG_DIR",
                      "ARCHIVE_DIR", "LOCK_DIR", "NFS_OUTPUT_DIR"]:
@@ -30,6 +33,7 @@ class TestSetupLogging:
         config = PipelineConfig(_env_file=None, log_dir=log_dir)
         config.setup_logging()
         logger.bind(stage="test").info("hello from test")
+        logger.complete()  # drain the enqueued file sink
         log_file = log_dir / "pipeline.log"
         assert log_file.exists()
         content = log_file.read_text()
@@ -43,6 +47,7 @@ class TestSetupLogging:
         config = PipelineConfig(_env_file=None, log_dir=log_dir)
         config.setup_logging()
         logger.bind(stage="organize").info("organizing")
+        logger.complete()
         content = (log_dir / "pipeline.log").read_text()
         assert "organize" in content
 
@@ -54,5 +59,6 @@ class TestSetupLogging:
         config = PipelineConfig(_env_file=None, log_dir=log_dir)
         config.setup_logging()
         logger.info("no stage bound")
+        logger.complete()
         content = (log_dir / "pipeline.log").read_text()
         assert "no stage bound" in content
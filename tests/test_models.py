@@ -47,7 +47,7 @@ class TestStageOrder:
 
     def test_organize_includes_asin_metadata(self):
         stages = STAGE_ORDER[PipelineMode.ORGANIZE]
-        assert stages == [Stage.ASIN, Stage.METADATA, Stage.ORGANIZE]
+        assert stages == (Stage.ASIN, Stage.METADATA, Stage.ORGANIZE)
 
 
 class TestPreCompletedStages:
@@ -1,5 +1,7 @@
 """Tests for ops/organize.py -- path parsing and Plex folder building."""
 
+import errno
+import os
 from pathlib import Path
 
 import pytest
@@ -237,6 +239,10 @@ class TestNormalizeForCompare:
         assert _normalize_for_compare("Title (Unabridged)") == "title"
         assert _normalize_for_compare("Title (The AudioBook)") == "title"
 
+    def test_year_inside_edition_marker(self):
+        """Year is stripped before the enclosing parenthetical"""
+        assert _normalize_for_compare("Title (Series (2014) Edition)") == "title"
+
     def test_removes_punctuation(self):
         assert _normalize_for_compare("Food- A Love Story") == "food a love story"
 
@@ -253,6 +259,12 @@ class TestNormalizeForCompare:
     def test_lowercases(self):
         assert _normalize_for_compare("Title") == "title"
 
+    def test_repeat_names_are_cached(self):
+        _normalize_for_compare.cache_clear()
+        _normalize_for_compare("Mistborn Era 1")
+        _normalize_for_compare("Mistborn Era 1")
+        assert _normalize_for_compare.cache_info().hits == 1
+
     def test_unicode_preserved(self):
         """Unicode chars are preserved in normalization"""
         normalized = _normalize_for_compare("José García")
@@ -298,6 +310,12 @@ class TestReuseExisting:
         nonexistent = tmp_path / "nonexistent"
         assert _reuse_existing(nonexistent, "Desired") == "Desired"
 
+    def test_parent_is_a_file(self, tmp_path):
+        """Parent that is a regular file returns desired unchanged"""
+        parent = tmp_path / "not-a-dir"
+        parent.write_text("data")
+        assert _reuse_existing(parent, "Desired") == "Desired"
+
     def test_ignores_files(self, tmp_path):
         """Only checks directories, not files"""
         (tmp_path / "file.txt").write_text("data")
@@ -533,6 +551,9 @@ class TestStripLabelSuffix:
     def test_no_suffix_unchanged(self):
         assert _strip_label_suffix("Just A Title") == "Just A Title"
 
+    def test_requires_spaced_dash(self):
+        assert _strip_label_suffix("Title-Audiobook") == "Title-Audiobook"
+
 
 class TestExtractAuthor:
     """Test extracting author names from directory names."""
@@ -679,6 +700,34 @@ class TestMoveInLibrary:
         assert not (tmp_path / "a" / "b").exists()
         assert not (tmp_path / "a").exists()
 
+    def test_cleanup_stops_at_library_root(self, tmp_path):
+        """Empty dirs at and above library_root are left alone"""
+        library = tmp_path / "library"
+        deep = library / "Author" / "Title"
+        deep.mkdir(parents=True)
+        source_file = deep / "audio.m4b"
+        source_file.write_text("audio")
+
+        move_in_library(source_file, tmp_path / "dest", library_root=library)
+
+        assert not (library / "Author").exists()
+        assert library.is_dir()
+
+    def test_cross_device_falls_back_to_shutil_move(self, tmp_path, monkeypatch):
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        source_file = source_dir / "audio.m4b"
+        source_file.write_text("audio")
+
+        def fake_replace(src, dst):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(os, "replace", fake_replace)
+        result = move_in_library(source_file, tmp_path / "dest")
+
+        assert result.read_text() == "audio"
+        assert not source_file.exists()
+
     def test_skips_same_size_existing(self, tmp_path):
         """Existing file with same size is not overwritten"""
         source_dir = tmp_path / "source"
@@ -28,6 +28,24 @@ def book(db):
     return db, "abc123"
 
 
+class TestConnection:
+    def test_pragmas(self, db):
+        conn = db._get_conn()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # 1 = NORMAL
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+    def test_status_mode_query_uses_index(self, db):
+        conn = db._get_conn()
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT book_hash FROM books "
+            "WHERE status = ? AND mode = ?",
+            ("pending", "convert"),
+        ).fetchall()
+        assert "idx_books_status_mode" in " ".join(row[-1] for row in plan)
+
+
 class TestCreate:
     def test_creates_book_record(self, db):
         data = db.create("h1", "/src/book", PipelineMode.CONVERT)
@@ -69,6 +87,24 @@ class TestCreate:
         data = db.create("h1", "/src/new", PipelineMode.CONVERT)
         assert data["source_path"] == "/src/new"
 
+    def test_create_many(self, db):
+        count = db.create_many(
+            [
+                ("h1", "/input/one", PipelineMode.CONVERT),
+                ("h2", "/input/two", PipelineMode.ORGANIZE),
+            ]
+        )
+        assert count == 2
+        assert db.read("h1")["stages"]["convert"]["status"] == "pending"
+        two = db.read("h2")
+        assert two["mode"] == "organize"
+        assert two["stages"]["convert"]["status"] == "completed"
+        assert two["stages"]["convert"]["output_file"] == "/input/two"
+
+    def test_create_many_empty(self, db):
+        assert db.create_many([]) == 0
+        assert db.list_books() == []
+
 
 class TestRead:
     def test_read_existing(self, book):
@@ -77,9 +113,25 @@ class TestRead:
         assert data is not None
         assert data["book_hash"] == h
 
+    def test_read_interns_stage_strings(self, book):
+        pdb, h = book
+        stages = pdb.read(h)["stages"]
+        key = next(k for k in stages if k == Stage.CONVERT.value)
+        assert key is Stage.CONVERT.value
+        assert stages[key]["status"] is StageStatus.PENDING.value
+
     def test_read_missing_returns_none(self, db):
         assert db.read("nonexistent") is None
 
+    def test_read_field_skips_full_read(self, book, monkeypatch):
+        pdb, h = book
+        monkeypatch.setattr(pdb, "read", lambda _h: pytest.fail("full read"))
+        assert pdb.read_field(h, "status") == "pending"
+        assert pdb.read_field(h, "retry_count") == 0
+        # Not a books column: metadata can never hold it
+        assert pdb.read_field(h, "metadata.output_file") is None
+        assert pdb.read_field(h, "stages.convert.bogus") is None
+
     def test_read_field_dotted_path(self, book):
         pdb, h = book
         status = pdb.read_field(h, "stages.validate.status")
@@ -141,6 +193,10 @@ class TestUpdate:
         with pytest.raises(ManifestError):
             db.update("nope", {"status": "x"})
 
+    def test_stage_only_update_missing_raises(self, db):
+        with pytest.raises(ManifestError):
+            db.update("nope", {"stages": {"convert": {"output_file": "/x"}}})
+
 
 class TestSetStage:
     def test_set_stage_running(self, book):
@@ -384,3 +440,26 @@ class TestThreadSafety:
         for stage in stages:
             assert data["stages"][stage.value]["status"] == "completed"
         pdb.close()
+
+    def test_concurrent_increment_retry(self, tmp_path):
+        """Retry increments from several threads are not lost."""
+        pdb = PipelineDB(tmp_path / "retry_test.db")
+        pdb.create("book1", "/src", PipelineMode.CONVERT)
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(5):
+                    pdb.increment_retry("book1")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(errors) == 0
+        assert pdb.read("book1")["retry_count"] == 20
+        pdb.close()